@@ -13,14 +13,34 @@ import sys
 import re
 import os
 import hashlib
+import time
 import logging
+import gzip
+import lzma
+import queue
+import threading
+import itertools
+import contextvars
+import sqlite3
+import zlib
+import zipfile
+import struct
+import tempfile
+import shutil
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Optional, Union
+from typing import Dict, List, Tuple, Any, Optional, Union, Iterator
 from dataclasses import dataclass, field, asdict
 from enum import Enum
-from scipy.integrate import solve_ivp
-from collections import deque
+from scipy.integrate import solve_ivp, solve_bvp
+from scipy.optimize import brentq
+from collections import deque, OrderedDict
+from collections.abc import Mapping
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from contextlib import contextmanager
+from sklearn import config_context as sklearn_config_context, get_config as sklearn_get_config
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
@@ -202,7 +222,7 @@ class TextSeedProcessor:
 
     def _determine_framework(self, text: str, features: Dict[str, float]) -> str:
         text_lower = text.lower()
-        framework_scores = {name: 0 for name in HybridFrameworkGenerator.FRAMEWORKS.keys()}
+        framework_scores = {name: 0 for name in HybridFrameworkGenerator.current().keys()}
         keywords = {
             "SEMANTIC_GRAVITY": ["meaning", "language", "semantic", "word", "grammar", "linguistic", "gravity"],
             "AUTOPOIETIC_COMPUTATIONAL": ["self", "recursive", "comput", "program", "algorithm", "code", "autopoietic", "gödel"],
@@ -257,24 +277,131 @@ class OntologyCoordinates:
         return (self.participation, self.plasticity, self.substrate,
                 self.temporal, self.generative)
 
+    @staticmethod
+    def bounds() -> Tuple[np.ndarray, np.ndarray]:
+        """Lower and upper bounds of the 5 axes, as used by __post_init__."""
+        return np.zeros(5), np.array([1.0, 1.5, 1.0, 1.0, 1.0])
+
     def distance_to(self, other: 'OntologyCoordinates') -> float:
         return math.sqrt(sum((a-b)**2 for a,b in zip(self.to_tuple(), other.to_tuple())))
 
+# ============================================================================
+# GEODESIC CACHE – LRU over quantized endpoints, optionally backed by SQLite
+# ============================================================================
+
+class GeodesicCache:
+    """
+    Cache of integrated geodesic paths.
+
+    Entries are keyed on the endpoints rounded to `precision` decimals plus
+    the curvature scale and attractor, and remember the resolution they were
+    integrated at. A request for a different n_points is resampled from the
+    cached path when it is at least as dense, and re-integrated (replacing
+    the entry) otherwise. With `path`, entries are also written through to a
+    SQLite file so they survive restarts and can be shared between processes.
+    """
+
+    def __init__(self, max_entries: int = 256, precision: int = 6,
+                 path: Optional[Union[str, Path]] = None):
+        self.max_entries = max_entries
+        self.precision = precision
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.conn = None
+        if path:
+            self.conn = sqlite3.connect(str(path))
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS geodesics (
+                    key TEXT PRIMARY KEY,
+                    n_points INTEGER NOT NULL,
+                    path BLOB NOT NULL
+                )""")
+            self.conn.commit()
+
+    def key(self, start: Tuple[float, ...], end: Tuple[float, ...], curvature_scale: float,
+            attractor: np.ndarray, mode: str = "shooting") -> str:
+        parts = (np.round(np.asarray(start, dtype=float), self.precision).tolist(),
+                 np.round(np.asarray(end, dtype=float), self.precision).tolist(),
+                 round(float(curvature_scale), 12),
+                 np.round(np.asarray(attractor, dtype=float), 12).tolist())
+        if mode != "shooting":
+            parts += (mode,)
+        return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+    def get(self, key: str, n_points: int) -> Optional[List[Tuple[float, ...]]]:
+        path = self._entries.get(key)
+        if path is not None:
+            self._entries.move_to_end(key)
+        elif self.conn is not None:
+            row = self.conn.execute("SELECT n_points, path FROM geodesics WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                path = np.frombuffer(row[1], dtype=np.float64).reshape(row[0], 5)
+                self._remember(key, path)
+        if path is None or len(path) < n_points:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if len(path) == n_points:
+            return [tuple(p) for p in path]
+        return resample_path(path, n_points)
+
+    def put(self, key: str, path: List[Tuple[float, ...]]):
+        arr = np.asarray(path, dtype=np.float64)
+        self._remember(key, arr)
+        if self.conn is not None:
+            self.conn.execute("INSERT OR REPLACE INTO geodesics (key, n_points, path) VALUES (?, ?, ?)",
+                              (key, len(arr), arr.tobytes()))
+            self.conn.commit()
+
+    def _remember(self, key: str, path: np.ndarray):
+        self._entries[key] = path
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop the in-memory entries (on-disk entries are keyed by attractor and simply stop matching)."""
+        self._entries.clear()
+
+    def info(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "max_entries": self.max_entries,
+                "hits": self.hits, "misses": self.misses, "persistent": self.conn is not None}
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
 # ============================================================================
 # RELATIVISTIC FIELD SIMULATOR – with adaptive step size and convergence
 # ============================================================================
 
 class RelativisticFieldSimulator:
     PHI = (1 + math.sqrt(5)) / 2
+    # Gauss-Legendre nodes/weights on [0, 1], keyed by node count
+    _QUADRATURE: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
 
-    def __init__(self, attractor_point: Optional[Tuple[float, ...]] = None, curvature_scale: float = 1.0):
+    def __init__(self, attractor_point: Optional[Tuple[float, ...]] = None, curvature_scale: float = 1.0,
+                 geodesic_cache: Optional[GeodesicCache] = None):
         self._attractor = np.array(attractor_point) if attractor_point is not None else None
         self.k = curvature_scale
         self._attractor_set = attractor_point is not None
+        self.geodesic_cache = geodesic_cache
 
     def set_attractor(self, attractor_point: Tuple[float, ...]):
         self._attractor = np.array(attractor_point)
         self._attractor_set = True
+        if self.geodesic_cache is not None:
+            self.geodesic_cache.clear()
+
+    def enable_geodesic_cache(self, max_entries: int = 256, precision: int = 6,
+                              path: Optional[Union[str, Path]] = None) -> GeodesicCache:
+        if self.geodesic_cache is not None:
+            self.geodesic_cache.close()
+        self.geodesic_cache = GeodesicCache(max_entries=max_entries, precision=precision, path=path)
+        return self.geodesic_cache
 
     def _ensure_attractor(self):
         if not self._attractor_set:
@@ -319,6 +446,20 @@ class RelativisticFieldSimulator:
             "omega": float(Ω)
         }
 
+    def ricci_scalar_batch(self, coords: np.ndarray) -> np.ndarray:
+        """Vectorized compute_curvature_tensor(...)["ricci_scalar"] for an (N, 5) array of points."""
+        self._ensure_attractor()
+        x = np.asarray(coords, dtype=float)
+        n = x.shape[-1]
+        diff = x - self._attractor
+        omega = -self.k * np.sum(diff**2, axis=-1)
+        grad = -2 * self.k * diff
+        hess_diag = -2 * self.k
+        grad_sq = np.sum(grad**2, axis=-1)
+        laplacian = hess_diag * n
+        ricci_diag = -(n-2) * (hess_diag - grad**2) - (laplacian + (n-2)*grad_sq)[..., None]
+        return np.exp(-2*omega) * np.sum(ricci_diag, axis=-1)
+
     def curvature_gradient_flow(self, start_coords: Tuple[float, ...],
                                 steps: int = 10, dt: float = 0.005,
                                 momentum: float = 0.9,
@@ -378,25 +519,160 @@ class RelativisticFieldSimulator:
 
         return [tuple(x) for x in history]
 
+    def curvature_gradient_flow_batch(self, starts: np.ndarray, steps: int = 10, dt: float = 0.005,
+                                      momentum: float = 0.9, tol: float = 1e-6,
+                                      target_curvature: Optional[float] = None,
+                                      interaction: float = 0.0,
+                                      interaction_range: float = 0.25) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        curvature_gradient_flow for an (F, 5) array of points at once.
+
+        Gradients of R come from one ricci_scalar_batch call over all 10F
+        central-difference probes per step. Rows stop (and stay put) once they
+        converge, as the single-point flow does. interaction adds a pairwise
+        pull interaction·(Σ_j w_ij x_j / Σ_j w_ij − x_i) towards the
+        neighbourhood mean, with Gaussian weights w_ij = exp(−d_ij² /
+        2·interaction_range²) from the (F, F) distance matrix. Positive values
+        pull frameworks together and negative values push them apart; the
+        coupled ensemble then only stops as a whole.
+        Returns the (T+1, F, 5) history and each row's stopping step (-1 if it
+        ran all steps).
+        """
+        self._ensure_attractor()
+        current = np.array(starts, dtype=float)
+        F = len(current)
+        velocity = np.zeros_like(current)
+        prev_norm = np.full(F, np.inf)
+        active = np.ones(F, dtype=bool)
+        stopped = np.full(F, -1)
+        diverged = np.zeros(F, dtype=bool)
+        low, high = OntologyCoordinates.bounds()
+        eps = 1e-5
+        offsets = eps * np.eye(5)
+        history = [current.copy()]
+
+        for step in range(steps):
+            if not active.any():
+                break
+            with np.errstate(over='ignore', invalid='ignore'):
+                curv0 = self.ricci_scalar_batch(current)
+                probes = np.concatenate([current[:, None, :] + offsets, current[:, None, :] - offsets], axis=1)
+                R = self.ricci_scalar_batch(probes.reshape(-1, 5)).reshape(F, 10)
+                gradR = (R[:, :5] - R[:, 5:]) / (2*eps)
+
+                # Adaptive step size based on gradient norm
+                grad_norm = np.linalg.norm(gradR, axis=1)
+                dt_adapt = np.where(grad_norm > 0, dt * np.minimum(1.0, prev_norm / (grad_norm + 1e-12)), dt)
+                prev_norm = grad_norm
+
+                new_velocity = momentum * velocity - (dt_adapt * np.sign(curv0))[:, None] * gradR
+                if interaction:
+                    sq = np.sum(current**2, axis=1)
+                    d2 = np.maximum(sq[:, None] + sq[None, :] - 2 * current @ current.T, 0.0)
+                    weights = np.exp(-d2 / (2 * interaction_range**2))
+                    np.fill_diagonal(weights, 0.0)
+                    total = weights.sum(axis=1)
+                    pull = np.divide(weights @ current, total[:, None], out=current.copy(),
+                                     where=total[:, None] > 0) - current
+                    new_velocity += dt * interaction * pull
+                new = current + new_velocity
+
+                # Reflect off boundaries
+                below, above = new < low, new > high
+                new = np.where(below, 2*low - new, np.where(above, 2*high - new, new))
+                new_velocity = np.where(below | above, -0.5 * new_velocity, new_velocity)
+
+            # Far from the attractor the flow can run away; such rows stop at their last finite point
+            blown = active & ~(np.isfinite(new).all(axis=1) & np.isfinite(new_velocity).all(axis=1))
+            diverged |= blown
+            stopped[blown] = step
+            active &= ~blown
+
+            current[active] = new[active]
+            velocity[active] = new_velocity[active]
+            history.append(current.copy())
+
+            # Convergence check
+            done = np.zeros(F, dtype=bool)
+            if step > 0:
+                done = np.linalg.norm(history[-1] - history[-2], axis=1) < tol
+            if target_curvature is not None:
+                with np.errstate(over='ignore', invalid='ignore'):
+                    done |= np.abs(self.ricci_scalar_batch(current) - target_curvature) < 0.01
+            if interaction:
+                done[:] = done[active].all()
+            done &= active
+            stopped[done] = step + 1
+            active &= ~done
+
+        if diverged.any():
+            logger.warning(f"Curvature flow diverged for {int(diverged.sum())} of {F} points; "
+                           f"they were stopped at their last finite position.")
+        return np.array(history), stopped
+
+    def path_length(self, path: List[Tuple[float, ...]]) -> float:
+        """Length of a polyline under the conformal metric e^{2Ω}δ (midpoint rule)."""
+        pts = np.asarray(path, dtype=float)
+        if len(pts) < 2:
+            return 0.0
+        self._ensure_attractor()
+        mid = 0.5 * (pts[1:] + pts[:-1])
+        omega = -self.k * np.sum((mid - self._attractor)**2, axis=1)
+        return float(np.sum(np.exp(omega) * np.linalg.norm(np.diff(pts, axis=0), axis=1)))
+
+    def segment_lengths(self, start: Tuple[float, ...], ends: np.ndarray, nodes: int = 16) -> np.ndarray:
+        """
+        Conformal length of the straight segments from start to each row of ends
+        (Gauss-Legendre quadrature). An upper bound on the geodesic distance.
+        """
+        self._ensure_attractor()
+        if nodes not in self._QUADRATURE:
+            t, w = np.polynomial.legendre.leggauss(nodes)
+            self._QUADRATURE[nodes] = (0.5 * (t + 1), 0.5 * w)
+        t, w = self._QUADRATURE[nodes]
+        a = np.asarray(start, dtype=float)
+        d = np.atleast_2d(np.asarray(ends, dtype=float)) - a
+        pts = a + t[:, None, None] * d[None]
+        omega = -self.k * np.sum((pts - self._attractor)**2, axis=-1)
+        return np.linalg.norm(d, axis=1) * (w @ np.exp(omega))
+
     def geodesic(self, start: Tuple[float, ...], end: Tuple[float, ...],
-                 n_points: int = 20) -> List[Tuple[float, ...]]:
+                 n_points: int = 20, mode: str = "shooting") -> List[Tuple[float, ...]]:
+        """
+        mode="shooting" integrates from start along the straight-line direction
+        until it passes within 0.01 of end (or λ=10); mode="bvp" solves the
+        two-point problem so the path ends at end (see geodesic_bvp).
+        """
+        if self.geodesic_cache is None:
+            return self._solve_geodesic(start, end, n_points, mode)[0]
+        self._ensure_attractor()
+        key = self.geodesic_cache.key(start, end, self.k, self._attractor, mode)
+        path = self.geodesic_cache.get(key, n_points)
+        if path is None:
+            path, integrated = self._solve_geodesic(start, end, n_points, mode)
+            # Linear fallbacks and degenerate single-point paths are not worth keeping
+            if integrated and len(path) == n_points:
+                self.geodesic_cache.put(key, path)
+        return path
+
+    def _solve_geodesic(self, start: Tuple[float, ...], end: Tuple[float, ...], n_points: int,
+                        mode: str) -> Tuple[List[Tuple[float, ...]], bool]:
+        if mode == "bvp":
+            path, info = self.geodesic_bvp(start, end, n_points)
+            if not info["converged"]:
+                logger.warning(f"BVP geodesic did not converge (miss {info['residual']:.3g} after "
+                               f"{info['iterations']} iterations); returning the closest path found.")
+            return path, info["converged"] and len(path) > 1
+        return self._integrate_geodesic(start, end, n_points)
+
+    def _integrate_geodesic(self, start: Tuple[float, ...], end: Tuple[float, ...],
+                            n_points: int) -> Tuple[List[Tuple[float, ...]], bool]:
         def geodesic_ode(λ, y):
-            n = 5
-            x = y[:n]
-            v = y[n:]
+            # Γ^k_ij v^i v^j for g = e^{2Ω}δ, contracted in closed form
+            x = y[:5]
+            v = y[5:]
             grad, _ = self._conformal_derivatives(tuple(x))
-            acc = np.zeros(n)
-            for k in range(n):
-                for i in range(n):
-                    for j in range(n):
-                        term = 0.0
-                        if k == i:
-                            term += grad[j]
-                        if k == j:
-                            term += grad[i]
-                        if i == j:
-                            term -= grad[k]
-                        acc[k] -= term * v[i] * v[j]
+            acc = grad * np.dot(v, v) - 2 * v * np.dot(grad, v)
             return np.concatenate([v, acc])
 
         x0 = np.array(start)
@@ -404,7 +680,7 @@ class RelativisticFieldSimulator:
         direction = x1 - x0
         norm = np.linalg.norm(direction)
         if norm < 1e-9:
-            return [start]
+            return [start], False
         v0 = direction / norm
         y0 = np.concatenate([x0, v0])
 
@@ -427,25 +703,371 @@ class RelativisticFieldSimulator:
             sol = solve_ivp(geodesic_ode, (0, t_max), y0, t_eval=t_eval,
                             method='DOP853', rtol=1e-8, atol=1e-10)
 
-            return [tuple(sol.y[:5, i]) for i in range(sol.y.shape[1])]
+            return [tuple(sol.y[:5, i]) for i in range(sol.y.shape[1])], True
         except Exception as e:
             logger.warning(f"Geodesic integration failed: {e}. Using linear interpolation.")
-            return [tuple(x0 + (x1 - x0) * i / (n_points-1)) for i in range(n_points)]
+            return [tuple(x0 + (x1 - x0) * i / (n_points-1)) for i in range(n_points)], False
+
+    def _stacked_geodesic_ode(self, λ, y):
+        """geodesic_ode for P geodesics at once; y holds P rows of (x, v)."""
+        Y = y.reshape(-1, 10)
+        x, v = Y[:, :5], Y[:, 5:]
+        grad = -2 * self.k * (x - self._attractor)
+        acc = grad * np.sum(v * v, axis=1, keepdims=True) - 2 * v * np.sum(grad * v, axis=1, keepdims=True)
+        return np.concatenate([v, acc], axis=1).ravel()
+
+    def _integrate_geodesic_stacked(self, pairs: List[Tuple[Tuple[float, ...], Tuple[float, ...]]],
+                                    n_points: int) -> List[Tuple[List[Tuple[float, ...]], bool]]:
+        """
+        Integrate non-degenerate pairs as one stacked ODE system. Each pair
+        keeps the single-pair semantics: it ends where it first comes within
+        0.01 of its endpoint (located on the dense output) or at λ=10.
+        """
+        self._ensure_attractor()
+        x0 = np.array([p[0] for p in pairs], dtype=float)
+        x1 = np.array([p[1] for p in pairs], dtype=float)
+        v0 = (x1 - x0) / np.linalg.norm(x1 - x0, axis=1, keepdims=True)
+        y0 = np.concatenate([x0, v0], axis=1).ravel()
+        try:
+            sol = solve_ivp(self._stacked_geodesic_ode, (0, 10.0), y0, method='DOP853',
+                            max_step=0.5, rtol=1e-8, atol=1e-10, dense_output=True)
+            if not sol.success:
+                raise RuntimeError(sol.message)
+        except Exception as e:
+            logger.warning(f"Stacked geodesic integration failed: {e}. Integrating pairs one by one.")
+            return [self._integrate_geodesic(s, t, n_points) for s, t in pairs]
+
+        Y = sol.y.reshape(len(pairs), 10, -1)
+        gap = np.linalg.norm(Y[:, :5, :] - x1[:, :, None], axis=1) - 0.01
+        results = []
+        for p in range(len(pairs)):
+            rows = slice(10 * p, 10 * p + 5)
+            t_max = sol.t[-1]
+            crossing = np.flatnonzero((gap[p, :-1] > 0) & (gap[p, 1:] <= 0))
+            if crossing.size:
+                c = crossing[0]
+                t_max = brentq(lambda t: np.linalg.norm(sol.sol(t)[rows] - x1[p]) - 0.01,
+                               sol.t[c], sol.t[c + 1])
+            pts = sol.sol(np.linspace(0, t_max, n_points))[rows].T
+            if np.all(np.isfinite(pts)):
+                results.append(([tuple(r) for r in pts], True))
+            else:
+                logger.warning(f"Geodesic {p} in batch diverged. Using linear interpolation.")
+                results.append(([tuple(x0[p] + (x1[p] - x0[p]) * i / (n_points-1)) for i in range(n_points)],
+                                False))
+        return results
+
+    def _shoot(self, x0: np.ndarray, v0: np.ndarray, t_eval: Optional[np.ndarray] = None) -> np.ndarray:
+        """Positions of P geodesics with x(0)=x0, x'(0)=v0 over λ∈[0,1], integrated as one system: (P, 5, T)."""
+        y0 = np.concatenate([x0, v0], axis=1).ravel()
+        with np.errstate(over='ignore', invalid='ignore'):
+            sol = solve_ivp(self._stacked_geodesic_ode, (0, 1.0), y0, method='DOP853', t_eval=t_eval,
+                            rtol=1e-10, atol=1e-12)
+        if not sol.success or not np.all(np.isfinite(sol.y)):
+            raise RuntimeError(sol.message)
+        return sol.y.reshape(len(x0), 10, -1)[:, :5, :]
+
+    def _solve_geodesic_collocation(self, x0: np.ndarray, x1: np.ndarray, n_points: int,
+                                    tol: float) -> Tuple[Optional[List[Tuple[float, ...]]], int]:
+        """Two-point geodesic by collocation (solve_bvp) from the straight-line guess."""
+        def fun(t, y):
+            x, v = y[:5], y[5:]
+            grad = -2 * self.k * (x - self._attractor[:, None])
+            acc = grad * np.sum(v * v, axis=0) - 2 * v * np.sum(grad * v, axis=0)
+            return np.vstack([v, acc])
+
+        def bc(ya, yb):
+            return np.concatenate([ya[:5] - x0, yb[:5] - x1])
+
+        t = np.linspace(0, 1, max(n_points, 10))
+        guess = np.vstack([x0[:, None] + (x1 - x0)[:, None] * t, np.repeat((x1 - x0)[:, None], len(t), axis=1)])
+        try:
+            with np.errstate(over='ignore', invalid='ignore'):
+                sol = solve_bvp(fun, bc, t, guess, tol=tol, max_nodes=2000)
+        except Exception as e:
+            logger.debug(f"Collocation geodesic failed: {e}")
+            return None, 0
+        if sol.status != 0:
+            return None, sol.niter
+        return [tuple(p) for p in sol.sol(np.linspace(0, 1, n_points))[:5].T], sol.niter
+
+    def _integrate_geodesic_bvp_stacked(self, pairs: List[Tuple[Tuple[float, ...], Tuple[float, ...]]],
+                                        n_points: int, tol: float = 1e-6, max_iter: int = 20
+                                        ) -> List[Tuple[List[Tuple[float, ...]], Dict[str, Any]]]:
+        """
+        Two-point boundary-value geodesics x(0)=start, x(1)=end by Newton
+        shooting on the initial velocity. Every Newton iteration integrates,
+        for all unconverged pairs at once, the 5 finite-difference Jacobian
+        columns and then 4 damped trial steps as single stacked systems.
+        Pairs that do not converge are retried by collocation (solve_bvp).
+        """
+        self._ensure_attractor()
+        P = len(pairs)
+        x0 = np.array([p[0] for p in pairs], dtype=float)
+        x1 = np.array([p[1] for p in pairs], dtype=float)
+        v = x1 - x0
+        iterations = np.zeros(P, dtype=int)
+        stalls = np.zeros(P, dtype=int)
+        eps = 1e-7
+        scales = np.array([1.0, 0.5, 0.25, 0.125])
+        try:
+            F = self._shoot(x0, v)[..., -1] - x1
+            res = np.linalg.norm(F, axis=1)
+            for it in range(1, max_iter + 1):
+                # Pairs whose damped steps stop reducing the miss have no nearby solution
+                active = np.flatnonzero((res > tol) & (stalls < 2))
+                if not active.size:
+                    break
+                n = len(active)
+                starts, va = x0[active], v[active]
+                probes = (va[:, None, :] + eps * np.eye(5)[None]).reshape(-1, 5)
+                ends = self._shoot(np.repeat(starts, 5, axis=0), probes)[..., -1].reshape(n, 5, 5)
+                J = ((ends - x1[active][:, None, :] - F[active][:, None, :]) / eps).transpose(0, 2, 1)
+                step = (np.linalg.pinv(J) @ F[active][..., None])[..., 0]
+                # Trust region: never jump further than the chord or the current speed
+                cap = np.maximum(np.linalg.norm(x1[active] - starts, axis=1), np.linalg.norm(va, axis=1))
+                step *= np.minimum(1.0, cap / np.maximum(np.linalg.norm(step, axis=1), 1e-300))[:, None]
+                trial_v = va[:, None, :] - scales[None, :, None] * step[:, None, :]
+                trial_F = (self._shoot(np.repeat(starts, len(scales), axis=0), trial_v.reshape(-1, 5))[..., -1]
+                           .reshape(n, len(scales), 5) - x1[active][:, None, :])
+                trial_res = np.linalg.norm(trial_F, axis=2)
+                better = trial_res < res[active][:, None]
+                stalls[active] = np.where(better.any(axis=1), 0, stalls[active] + 1)
+                choice = np.where(better.any(axis=1), better.argmax(axis=1), trial_res.argmin(axis=1))
+                rows = np.arange(n)
+                v[active] = trial_v[rows, choice]
+                F[active] = trial_F[rows, choice]
+                res[active] = trial_res[rows, choice]
+                iterations[active] = it
+            converged = res <= tol
+            paths = self._shoot(x0, v, t_eval=np.linspace(0, 1, n_points)).transpose(0, 2, 1)
+        except Exception as e:
+            if P > 1:
+                logger.debug(f"Stacked shooting failed ({e}); solving pairs one by one.")
+                return [r for pair in pairs for r in self._integrate_geodesic_bvp_stacked([pair], n_points,
+                                                                                          tol, max_iter)]
+            res, converged, paths = np.array([np.inf]), np.array([False]), None
+
+        results = []
+        for p in range(P):
+            info = {"method": "shooting", "converged": bool(converged[p]),
+                    "iterations": int(iterations[p]), "residual": float(res[p])}
+            path = [tuple(r) for r in paths[p]] if paths is not None else None
+            if not converged[p]:
+                collocated, niter = self._solve_geodesic_collocation(x0[p], x1[p], n_points, tol)
+                info["iterations"] += niter
+                if collocated is not None:
+                    path = collocated
+                    info.update(method="collocation", converged=True,
+                                residual=float(np.linalg.norm(np.asarray(path[-1]) - x1[p])))
+            if path is None:
+                path = [tuple(x0[p] + (x1[p] - x0[p]) * i / (n_points-1)) for i in range(n_points)]
+                info["method"] = "linear"
+            results.append((path, info))
+        return results
+
+    def geodesic_bvp(self, start: Tuple[float, ...], end: Tuple[float, ...], n_points: int = 20,
+                     tol: float = 1e-6, max_iter: int = 20) -> Tuple[List[Tuple[float, ...]], Dict[str, Any]]:
+        """
+        Geodesic that actually ends at `end`: solves the two-point problem
+        x(0)=start, x(1)=end and returns the path with
+        {"method", "converged", "iterations", "residual"}.
+        """
+        if np.linalg.norm(np.asarray(end, dtype=float) - np.asarray(start, dtype=float)) < 1e-9:
+            return [start], {"method": "shooting", "converged": True, "iterations": 0, "residual": 0.0}
+        return self._integrate_geodesic_bvp_stacked([(start, end)], n_points, tol, max_iter)[0]
+
+    def _solve_chunk(self, pairs: List[Tuple[Tuple[float, ...], Tuple[float, ...]]], n_points: int,
+                     mode: str) -> List[Tuple[List[Tuple[float, ...]], bool]]:
+        if mode == "bvp":
+            solved = self._integrate_geodesic_bvp_stacked(pairs, n_points)
+            converged = sum(info["converged"] for _, info in solved)
+            logger.info(f"BVP geodesics: {converged}/{len(solved)} converged, "
+                        f"{np.mean([info['iterations'] for _, info in solved]):.1f} iterations on average")
+            return [(path, info["converged"]) for path, info in solved]
+        return self._integrate_geodesic_stacked(pairs, n_points)
+
+    def geodesic_batch(self, pairs: List[Tuple[Tuple[float, ...], Tuple[float, ...]]],
+                       n_points: int = 20, workers: int = 1,
+                       chunk_size: int = 64, mode: str = "shooting") -> List[List[Tuple[float, ...]]]:
+        """
+        geodesic() for many (start, end) pairs, returned in input order.
+        Cache hits are served directly; the remaining pairs are integrated
+        chunk_size at a time as stacked ODE systems, chunks spread over
+        `workers` processes. A pair that fails falls back to linear
+        interpolation exactly as geodesic() does.
+        """
+        self._ensure_attractor()
+        results: List[Optional[List[Tuple[float, ...]]]] = [None] * len(pairs)
+        keys: Dict[int, str] = {}
+        todo = []
+        for idx, (start, end) in enumerate(pairs):
+            if np.linalg.norm(np.asarray(end, dtype=float) - np.asarray(start, dtype=float)) < 1e-9:
+                results[idx] = [start]
+                continue
+            if self.geodesic_cache is not None:
+                keys[idx] = self.geodesic_cache.key(start, end, self.k, self._attractor, mode)
+                results[idx] = self.geodesic_cache.get(keys[idx], n_points)
+                if results[idx] is not None:
+                    continue
+            todo.append(idx)
+
+        chunks = [todo[i:i + chunk_size] for i in range(0, len(todo), chunk_size)]
+        if workers > 1 and len(chunks) > 1:
+            attractor = tuple(float(x) for x in self._attractor)
+            tasks = [(attractor, self.k, [(tuple(pairs[i][0]), tuple(pairs[i][1])) for i in chunk], n_points, mode)
+                     for chunk in chunks]
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+                solved = list(pool.map(_geodesic_chunk_task, tasks))
+        else:
+            solved = [self._solve_chunk([pairs[i] for i in chunk], n_points, mode) for chunk in chunks]
+
+        for chunk, chunk_results in zip(chunks, solved):
+            for idx, (path, integrated) in zip(chunk, chunk_results):
+                results[idx] = path
+                if integrated and idx in keys:
+                    self.geodesic_cache.put(keys[idx], path)
+        return results
+
+def _geodesic_chunk_task(task: Tuple[Tuple[float, ...], float, List[Tuple[Tuple[float, ...], Tuple[float, ...]]],
+                                     int, str]) -> List[Tuple[List[Tuple[float, ...]], bool]]:
+    attractor, k, pairs, n_points, mode = task
+    sim = RelativisticFieldSimulator(attractor_point=attractor, curvature_scale=k)
+    return [([tuple(float(v) for v in p) for p in path], ok)
+            for path, ok in sim._solve_chunk(pairs, n_points, mode)]
 
 # ============================================================================
 # HYBRID FRAMEWORK GENERATOR (with dynamic framework persistence)
 # ============================================================================
 
+class FrameworkSnapshot(Mapping):
+    """
+    One immutable, versioned view of the framework registry. Published
+    snapshots are never modified: writers build a new one and swap it in, so
+    readers can iterate a snapshot while frameworks are being added.
+    The framework dicts are shared with later versions and must be treated
+    as read-only.
+    """
+    __slots__ = ("version", "_frameworks", "_names", "_coords", "_keywords")
+
+    def __init__(self, frameworks: Optional[Dict[str, Dict[str, Any]]] = None, version: int = 0):
+        self.version = version
+        self._frameworks = dict(frameworks or {})
+        self._names = tuple(self._frameworks)
+        self._coords = None
+        self._keywords = None
+
+    def __getitem__(self, name: str) -> Dict[str, Any]:
+        return self._frameworks[name]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        return f"FrameworkSnapshot(version={self.version}, frameworks={len(self)})"
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return self._names
+
+    @property
+    def coordinates(self) -> np.ndarray:
+        """Read-only (F, 5) coordinate array in registry order, built on first use."""
+        if self._coords is None:
+            coords = np.array([self._frameworks[n]["coordinates"] for n in self._names],
+                              dtype=float).reshape(len(self._names), -1)
+            coords.setflags(write=False)
+            self._coords = coords
+        return self._coords
+
+    @property
+    def keywords(self) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+        """(name, seed_keywords) for every framework, in registry order."""
+        if self._keywords is None:
+            self._keywords = tuple((n, tuple(self._frameworks[n].get("seed_keywords", [])))
+                                   for n in self._names)
+        return self._keywords
+
+    def warm(self) -> 'FrameworkSnapshot':
+        """Build the derived indexes now rather than on the first lookup."""
+        self.coordinates
+        self.keywords
+        return self
+
+
 class HybridFrameworkGenerator:
-    FRAMEWORKS = {}
+    # Current FrameworkSnapshot. Reading it needs no lock; only publish() replaces it.
+    FRAMEWORKS = FrameworkSnapshot()
     DYNAMIC_FRAMEWORKS_FILE = "dynamic_frameworks.json"
+    # Set by MetaOntologyEngine.use_geodesic_table(); backs metric="geodesic" lookups
+    GEODESIC_TABLE: Optional['FrameworkGeodesicTable'] = None
+    _publish_lock = threading.RLock()
+    _pinned = contextvars.ContextVar("pinned_frameworks", default=None)
+
+    @classmethod
+    def current(cls) -> FrameworkSnapshot:
+        """The snapshot pinned in this thread/task (see pinned()), else the latest published one."""
+        pinned = cls._pinned.get()
+        return pinned if pinned is not None else cls.FRAMEWORKS
+
+    @classmethod
+    def publish(cls, frameworks: Mapping, merge: bool = False, warm: bool = False) -> FrameworkSnapshot:
+        """
+        Atomically replace the registry with `frameworks` (or, with merge=True,
+        the latest snapshot plus `frameworks`). Returns the new snapshot;
+        warm=True builds its indexes before readers can see it.
+        """
+        incoming = {}
+        for name, fw in frameworks.items():
+            fw = dict(fw)
+            if "coordinates" in fw:
+                fw["coordinates"] = tuple(fw["coordinates"])
+            incoming[name] = fw
+        with cls._publish_lock:
+            base = dict(cls.FRAMEWORKS._frameworks) if merge else {}
+            base.update(incoming)
+            snapshot = FrameworkSnapshot(base, cls.FRAMEWORKS.version + 1)
+            if warm:
+                snapshot.warm()
+            cls.FRAMEWORKS = snapshot
+        return snapshot
+
+    @classmethod
+    @contextmanager
+    def pinned(cls, snapshot: Optional[FrameworkSnapshot] = None):
+        """
+        Make every framework lookup in this thread/task see `snapshot` (default:
+        the current one) until the block exits. Frameworks published meanwhile
+        go into later versions and are not visible inside the block.
+        """
+        snapshot = cls.current() if snapshot is None else snapshot
+        token = cls._pinned.set(snapshot)
+        try:
+            yield snapshot
+        finally:
+            cls._pinned.reset(token)
+
+    @classmethod
+    def load_frameworks(cls, data_root: Path = Path("axiomforge")) -> FrameworkSnapshot:
+        return cls.publish(cls.read_frameworks(data_root))
 
     @classmethod
-    def load_frameworks(cls, data_root: Path = Path("axiomforge")):
+    def read_frameworks(cls, data_root: Path = Path("axiomforge"),
+                        strict: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse frameworks.json plus dynamic_frameworks.json without publishing.
+        strict=True raises on unreadable files instead of logging and falling
+        back, so a half-written file never replaces a good registry.
+        """
         path = data_root / "frameworks.json"
         if not path.exists():
+            if strict:
+                raise FileNotFoundError(f"Frameworks file not found: {path}")
             logger.error(f"Frameworks file not found: {path}")
-            cls.FRAMEWORKS = {
+            frameworks = {
                 "SEMANTIC_GRAVITY": {
                     "coordinates": (0.9, 0.8, 0.95, 0.4, 0.85),
                     "core_pattern": "(semantic_field) creates (geometric_structure)",
@@ -458,15 +1080,13 @@ class HybridFrameworkGenerator:
         else:
             try:
                 with open(path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                for name, fw in data.items():
-                    if "coordinates" in fw:
-                        fw["coordinates"] = tuple(fw["coordinates"])
-                cls.FRAMEWORKS = data
-                logger.info(f"Loaded {len(cls.FRAMEWORKS)} base frameworks from {path}")
+                    frameworks = json.load(f)
+                logger.info(f"Loaded {len(frameworks)} base frameworks from {path}")
             except Exception as e:
+                if strict:
+                    raise
                 logger.error(f"Failed to load frameworks: {e}")
-                cls.FRAMEWORKS = {}
+                frameworks = {}
 
         # Load dynamic frameworks if they exist
         dyn_path = data_root / cls.DYNAMIC_FRAMEWORKS_FILE
@@ -474,21 +1094,22 @@ class HybridFrameworkGenerator:
             try:
                 with open(dyn_path, 'r', encoding='utf-8') as f:
                     dyn_data = json.load(f)
-                for name, fw in dyn_data.items():
-                    if "coordinates" in fw:
-                        fw["coordinates"] = tuple(fw["coordinates"])
-                cls.FRAMEWORKS.update(dyn_data)
+                frameworks.update(dyn_data)
                 logger.info(f"Loaded {len(dyn_data)} dynamic frameworks from {dyn_path}")
             except Exception as e:
+                if strict:
+                    raise
                 logger.warning(f"Could not load dynamic frameworks: {e}")
 
-        return cls.FRAMEWORKS
+        return frameworks
 
     @classmethod
-    def save_dynamic_frameworks(cls, data_root: Path = Path("axiomforge")):
+    def save_dynamic_frameworks(cls, data_root: Path = Path("axiomforge"),
+                                snapshot: Optional[FrameworkSnapshot] = None):
         """Save dynamically created frameworks to a separate file."""
-        dyn_frameworks = {name: fw for name, fw in cls.FRAMEWORKS.items()
-                          if name not in cls.get_base_framework_names(data_root)}
+        snapshot = cls.FRAMEWORKS if snapshot is None else snapshot
+        base_names = cls.get_base_framework_names(data_root)
+        dyn_frameworks = {name: fw for name, fw in snapshot.items() if name not in base_names}
         if not dyn_frameworks:
             return
         dyn_path = data_root / cls.DYNAMIC_FRAMEWORKS_FILE
@@ -518,49 +1139,65 @@ class HybridFrameworkGenerator:
         return set()
 
     @classmethod
-    def add_dynamic_framework(cls, name: str, framework: Dict[str, Any], data_root: Path):
-        cls.FRAMEWORKS[name] = framework
-        cls.save_dynamic_frameworks(data_root)
+    def add_dynamic_framework(cls, prefix: str, framework: Dict[str, Any], data_root: Path,
+                              persist: bool = True) -> Tuple[str, FrameworkSnapshot]:
+        """Publish a framework named "<prefix>_<registry size>" and return (name, snapshot).
+
+        The name is picked under the publish lock, and bumped until unused, so two
+        threads creating frameworks at once can't overwrite each other.
+        """
+        # Held across the save so the file is always written in version order
+        with cls._publish_lock:
+            index = len(cls.FRAMEWORKS)
+            name = f"{prefix}_{index}"
+            while name in cls.FRAMEWORKS:
+                index += 1
+                name = f"{prefix}_{index}"
+            snapshot = cls.publish({name: framework}, merge=True)
+            if persist:
+                cls.save_dynamic_frameworks(data_root, snapshot)
+        return name, snapshot
 
     @classmethod
     def get_framework(cls, name: str) -> Dict[str, Any]:
-        if not cls.FRAMEWORKS:
-            cls.load_frameworks()
-        return cls.FRAMEWORKS.get(name, cls.FRAMEWORKS.get("SEMANTIC_GRAVITY", {}))
+        frameworks = cls.current() or cls.load_frameworks()
+        return frameworks.get(name, frameworks.get("SEMANTIC_GRAVITY", {}))
 
     @classmethod
     def random_framework(cls) -> str:
-        if not cls.FRAMEWORKS:
-            cls.load_frameworks()
-        return random.choice(list(cls.FRAMEWORKS.keys()))
+        frameworks = cls.current() or cls.load_frameworks()
+        return random.choice(frameworks.names)
 
     @classmethod
-    def get_nearest_framework(cls, coords: Tuple[float, ...]) -> str:
-        if not cls.FRAMEWORKS:
-            cls.load_frameworks()
-        min_dist = float('inf')
-        best = "SEMANTIC_GRAVITY"
-        for name, data in cls.FRAMEWORKS.items():
-            dist = sum((a-b)**2 for a,b in zip(coords, data["coordinates"]))
-            if dist < min_dist:
-                min_dist = dist
-                best = name
-        return best
+    def coordinate_array(cls) -> Tuple[List[str], np.ndarray]:
+        """Framework names and their coordinates as an (F, 5) array, in registry order."""
+        frameworks = cls.current() or cls.load_frameworks()
+        return list(frameworks.names), frameworks.coordinates.copy()
+
+    @classmethod
+    def get_nearest_framework(cls, coords: Tuple[float, ...], metric: str = "euclidean") -> str:
+        frameworks = cls.current() or cls.load_frameworks()
+        if metric == "geodesic" and cls.GEODESIC_TABLE is not None:
+            return cls.GEODESIC_TABLE.nearest(coords)
+        if not len(frameworks):
+            return "SEMANTIC_GRAVITY"
+        # One vectorized pass over the snapshot's cached (F, 5) array
+        dist = np.sum((frameworks.coordinates - np.asarray(coords, dtype=np.float64)) ** 2, axis=1)
+        return frameworks.names[int(np.argmin(dist))]
 
     @classmethod
     def get_framework_by_seed(cls, seed_text: str) -> str:
-        if not cls.FRAMEWORKS:
-            cls.load_frameworks()
+        frameworks = cls.current() or cls.load_frameworks()
         seed_lower = seed_text.lower()
         scores = {}
-        for name, data in cls.FRAMEWORKS.items():
+        for name, keywords in frameworks.keywords:
             score = 0
-            for keyword in data.get("seed_keywords", []):
+            for keyword in keywords:
                 if keyword in seed_lower:
                     score += 2
             scores[name] = score
         if max(scores.values()) == 0:
-            return random.choice(list(cls.FRAMEWORKS.keys()))
+            return random.choice(frameworks.names)
         return max(scores.items(), key=lambda x: x[1])[0]
 
     @classmethod
@@ -581,6 +1218,443 @@ class HybridFrameworkGenerator:
             "relativistic_structure": "yes" if "ricci_scalar" in fw["signature_metrics"] else "no"
         }
 
+# ============================================================================
+# FRAMEWORK WATCHER – hot reload of the framework files
+# ============================================================================
+
+class FrameworkWatcher:
+    """
+    Polls frameworks.json and dynamic_frameworks.json (mtime and size) from a
+    daemon thread and republishes the registry when either changes. Files
+    are parsed and the new snapshot's indexes built in the background; the
+    swap itself is a single publish(), so readers never wait.
+
+    Frameworks added in this process that are not in either file (e.g.
+    unpersisted dynamic frameworks) survive a reload. A file that fails to
+    parse is skipped until it changes again. Subscribers are called from the
+    watcher thread with the new snapshot.
+    """
+
+    def __init__(self, data_root: Union[str, Path] = Path("axiomforge"), interval: float = 2.0):
+        self.data_root = Path(data_root)
+        self.interval = interval
+        self.reloads = 0
+        self._callbacks = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stamps = self._stat()
+        try:
+            self._file_names = set(HybridFrameworkGenerator.read_frameworks(self.data_root, strict=True))
+        except Exception:
+            self._file_names = set(HybridFrameworkGenerator.FRAMEWORKS)
+
+    def _stat(self) -> Tuple[Optional[Tuple[int, int]], ...]:
+        stamps = []
+        for name in ("frameworks.json", HybridFrameworkGenerator.DYNAMIC_FRAMEWORKS_FILE):
+            try:
+                st = os.stat(self.data_root / name)
+                stamps.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    def subscribe(self, callback) -> 'FrameworkWatcher':
+        self._callbacks.append(callback)
+        return self
+
+    def start(self) -> 'FrameworkWatcher':
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="framework-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                logger.warning(f"Framework reload failed: {e}")
+
+    def poll(self) -> Optional[FrameworkSnapshot]:
+        """Reload if either file changed since the last poll; returns the new snapshot, if any."""
+        stamps = self._stat()
+        if stamps == self._stamps:
+            return None
+        self._stamps = stamps
+        return self.reload()
+
+    def reload(self) -> Optional[FrameworkSnapshot]:
+        try:
+            frameworks = HybridFrameworkGenerator.read_frameworks(self.data_root, strict=True)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable framework files in {self.data_root}: {e}")
+            return None
+        frameworks = {name: dict(fw, coordinates=tuple(fw["coordinates"])) if "coordinates" in fw else fw
+                      for name, fw in frameworks.items()}
+        # Under the publish lock so a concurrent add_dynamic_framework is not lost
+        with HybridFrameworkGenerator._publish_lock:
+            current = HybridFrameworkGenerator.FRAMEWORKS
+            merged = dict(frameworks)
+            for name, fw in current.items():
+                if name not in self._file_names and name not in merged:
+                    merged[name] = fw
+            self._file_names = set(frameworks)
+            if merged == dict(current):
+                return None
+            snapshot = HybridFrameworkGenerator.publish(merged, warm=True)
+        self.reloads += 1
+        logger.info(f"Reloaded {len(snapshot)} frameworks (registry version {snapshot.version})")
+        for callback in self._callbacks:
+            callback(snapshot)
+        return snapshot
+
+# ============================================================================
+# SHARED FRAMEWORK TABLES – one copy of the registry for a process pool
+# ============================================================================
+
+class SharedFrameworkTables:
+    """
+    The framework registry and the seed-processing word corpus packed into
+    one multiprocessing.shared_memory block. The parent builds it once; pool
+    workers attach to it instead of re-reading and re-parsing the axiomforge
+    files.
+
+    The block holds, in order:
+    - coordinates (F, 5) as float64
+    - an int64 record table and an int64 string-reference list
+    - the string offsets and the UTF-8 string pool
+    Each distinct string (names, patterns, mechanisms, equations, keywords,
+    the corpus) is stored once. Framework fields are runs of indices into
+    the pool. Remaining fields such as signature_metrics travel as a small
+    JSON string so frameworks are rebuilt exactly. Workers see the arrays as
+    read-only views of the block. The layout dict is small and is passed
+    through the pool initargs along with the block name.
+    """
+    STRING_FIELDS = ("mechanisms", "equations", "seed_keywords")
+    _RECORD_WIDTH = 3 + 2 * len(STRING_FIELDS)   # name, core_pattern, rest, then (start, end) per list
+
+    def __init__(self, shm: shared_memory.SharedMemory, layout: Dict[str, Any], owner: bool = False):
+        self.shm = shm
+        self.layout = layout
+        self.owner = owner
+        n = layout["frameworks"]
+        self.coordinates = self._view("coordinates", (n, 5))
+        self._records = self._view("records", (n, self._RECORD_WIDTH), np.int64)
+        self._refs = self._view("refs", (layout["refs"],), np.int64)
+        self._offsets = self._view("string_offsets", (layout["strings"] + 1,), np.int64)
+        self._decoded: List[Optional[str]] = [None] * layout["strings"]
+
+    def _view(self, key: str, shape: Tuple[int, ...], dtype=np.float64) -> np.ndarray:
+        arr = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=self.layout[key])
+        arr.setflags(write=False)
+        return arr
+
+    @property
+    def handle(self) -> Tuple[str, Dict[str, Any]]:
+        """Picklable (block name, layout) for attach()."""
+        return self.shm.name, self.layout
+
+    @classmethod
+    def create(cls, snapshot: Optional[FrameworkSnapshot] = None,
+               corpus: Optional[str] = None) -> 'SharedFrameworkTables':
+        """Pack `snapshot` (default: the current registry) and the loaded word corpus."""
+        snapshot = HybridFrameworkGenerator.current() if snapshot is None else snapshot
+        corpus = TextSeedProcessor._word_corpus if corpus is None else corpus
+        strings: List[str] = []
+        ids: Dict[str, int] = {}
+
+        def intern(text: str) -> int:
+            i = ids.get(text)
+            if i is None:
+                i = ids[text] = len(strings)
+                strings.append(text)
+            return i
+
+        n = len(snapshot)
+        coords = np.full((n, 5), np.nan)
+        records = np.full((n, cls._RECORD_WIDTH), -1, dtype=np.int64)
+        refs: List[int] = []
+        for row, (name, fw) in enumerate(snapshot.items()):
+            packed = set()
+            records[row, 0] = intern(name)
+            if "coordinates" in fw and len(fw["coordinates"]) == 5:
+                coords[row] = fw["coordinates"]
+                packed.add("coordinates")
+            if isinstance(fw.get("core_pattern"), str):
+                records[row, 1] = intern(fw["core_pattern"])
+                packed.add("core_pattern")
+            for j, key in enumerate(cls.STRING_FIELDS):
+                values = fw.get(key)
+                if isinstance(values, list) and all(isinstance(v, str) for v in values):
+                    records[row, 3 + 2 * j] = len(refs)
+                    refs.extend(intern(v) for v in values)
+                    records[row, 4 + 2 * j] = len(refs)
+                    packed.add(key)
+            rest = {k: v for k, v in fw.items() if k not in packed}
+            records[row, 2] = intern(json.dumps({"keys": list(fw), "fields": convert_to_serializable(rest)}))
+        corpus_id = intern(corpus) if corpus is not None else -1
+
+        encoded = [text.encode("utf-8") for text in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        arrays = {"coordinates": coords, "records": records,
+                  "refs": np.array(refs, dtype=np.int64), "string_offsets": offsets}
+        layout: Dict[str, Any] = {"frameworks": n, "strings": len(strings), "refs": len(refs),
+                                  "corpus": corpus_id, "version": snapshot.version}
+        position = 0
+        for key, arr in arrays.items():
+            layout[key] = position
+            position += -(-arr.nbytes // 8) * 8
+        layout["pool"] = position
+        shm = shared_memory.SharedMemory(create=True, size=max(1, position + int(offsets[-1])))
+        for key, arr in arrays.items():
+            shm.buf[layout[key]:layout[key] + arr.nbytes] = arr.tobytes()
+        shm.buf[position:position + int(offsets[-1])] = b"".join(encoded)
+        return cls(shm, layout, owner=True)
+
+    @classmethod
+    def attach(cls, handle: Tuple[str, Dict[str, Any]]) -> 'SharedFrameworkTables':
+        name, layout = handle
+        return cls(shared_memory.SharedMemory(name=name), layout)
+
+    def string(self, index: int) -> str:
+        """String `index` of the pool, decoded once and shared by every reference."""
+        text = self._decoded[index]
+        if text is None:
+            start = self.layout["pool"] + int(self._offsets[index])
+            end = self.layout["pool"] + int(self._offsets[index + 1])
+            text = self._decoded[index] = bytes(self.shm.buf[start:end]).decode("utf-8")
+        return text
+
+    def corpus(self) -> Optional[str]:
+        return self.string(self.layout["corpus"]) if self.layout["corpus"] >= 0 else None
+
+    def frameworks(self) -> Dict[str, Dict[str, Any]]:
+        frameworks = {}
+        for row, record in enumerate(self._records):
+            meta = json.loads(self.string(record[2]))
+            values = {"coordinates": tuple(float(x) for x in self.coordinates[row])}
+            if record[1] >= 0:
+                values["core_pattern"] = self.string(record[1])
+            for j, key in enumerate(self.STRING_FIELDS):
+                if record[3 + 2 * j] >= 0:
+                    values[key] = [self.string(i) for i in self._refs[record[3 + 2 * j]:record[4 + 2 * j]]]
+            values.update(meta["fields"])
+            frameworks[self.string(record[0])] = {k: values[k] for k in meta["keys"]}
+        return frameworks
+
+    def install(self) -> FrameworkSnapshot:
+        """
+        Publish the shared registry in this process (its coordinate array is
+        the shared view itself) and seed TextSeedProcessor's corpus from it.
+        """
+        with HybridFrameworkGenerator._publish_lock:
+            snapshot = FrameworkSnapshot(self.frameworks(), HybridFrameworkGenerator.FRAMEWORKS.version + 1)
+            if not np.isnan(self.coordinates).any():
+                snapshot._coords = self.coordinates
+            HybridFrameworkGenerator.FRAMEWORKS = snapshot
+        corpus = self.corpus()
+        if corpus is not None:
+            TextSeedProcessor._word_corpus = corpus
+        return snapshot
+
+    def close(self):
+        """Drop this process's mapping (views into the block become invalid)."""
+        self.coordinates = self._records = self._refs = self._offsets = None
+        self.shm.close()
+
+    def unlink(self):
+        """Close and, in the creating process, free the block."""
+        self.close()
+        if self.owner:
+            self.shm.unlink()
+
+# ============================================================================
+# FRAMEWORK GEODESIC TABLE – all-pairs conformal distances, built once
+# ============================================================================
+
+def resample_path(path: List[Tuple[float, ...]], n_points: int) -> List[Tuple[float, ...]]:
+    """Linearly resample a path sampled uniformly in its parameter to n_points points."""
+    pts = np.asarray(path, dtype=float)
+    if len(pts) < 2 or len(pts) == n_points:
+        return [tuple(p) for p in pts]
+    src = np.linspace(0.0, 1.0, len(pts))
+    dst = np.linspace(0.0, 1.0, n_points)
+    out = np.column_stack([np.interp(dst, src, pts[:, d]) for d in range(pts.shape[1])])
+    return [tuple(p) for p in out]
+
+class FrameworkGeodesicTable:
+    """
+    All-pairs geodesic distances and paths between registered frameworks.
+
+    Pairs are solved once as boundary-value geodesics (mode="bvp"; optionally
+    across a process pool) and cached in memory and in
+    data_root/geodesic_table.json. sync() only integrates pairs that involve
+    frameworks which are new or moved since the last build, so dynamic
+    frameworks extend the table incrementally; a changed attractor, curvature
+    scale or mode invalidates it. Distances are the conformal length of the
+    path (closed with a straight segment if it stops short of the endpoint),
+    capped by the straight segment itself, so every entry is an upper bound on
+    the true geodesic distance.
+    """
+    CACHE_FILE = "geodesic_table.json"
+
+    def __init__(self, field_sim: RelativisticFieldSimulator, n_points: int = 33, workers: int = 1,
+                 cache_path: Optional[Path] = None, mode: str = "bvp"):
+        self.field_sim = field_sim
+        self.n_points = n_points
+        self.mode = mode
+        self.workers = max(1, workers)
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.paths: Dict[Tuple[str, str], List[Tuple[float, ...]]] = {}
+        self.endpoint_error: Dict[Tuple[str, str], float] = {}
+        self._clear()
+        if self.cache_path and self.cache_path.exists():
+            self._load()
+
+    def _clear(self):
+        self.names: List[str] = []
+        self.coords = np.zeros((0, 5))
+        self.distances = np.zeros((0, 0))
+        self.paths.clear()
+        self.endpoint_error.clear()
+        self._signature = None
+
+    def _current_signature(self) -> Dict[str, Any]:
+        self.field_sim._ensure_attractor()
+        return {"attractor": [float(x) for x in self.field_sim._attractor],
+                "curvature_scale": float(self.field_sim.k), "n_points": self.n_points, "mode": self.mode}
+
+    def _load(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._signature = data["signature"]
+            self.names = list(data["names"])
+            self.coords = np.array(data["coordinates"], dtype=float).reshape(-1, 5)
+            self.distances = np.array(data["distances"], dtype=float).reshape(len(self.names), len(self.names))
+            for entry in data["paths"]:
+                key = (entry["from"], entry["to"])
+                self.paths[key] = [tuple(p) for p in entry["path"]]
+                self.endpoint_error[key] = entry["endpoint_error"]
+            logger.info(f"Loaded geodesic table for {len(self.names)} frameworks from {self.cache_path}")
+        except Exception as e:
+            logger.warning(f"Could not load geodesic table: {e}")
+            self._clear()
+
+    def save(self):
+        if not self.cache_path:
+            return
+        data = {
+            "signature": self._signature,
+            "names": self.names,
+            "coordinates": self.coords.tolist(),
+            "distances": self.distances.tolist(),
+            "paths": [{"from": a, "to": b, "endpoint_error": self.endpoint_error[(a, b)],
+                       "path": [list(p) for p in path]}
+                      for (a, b), path in self.paths.items()]
+        }
+        try:
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+        except Exception as e:
+            logger.error(f"Failed to save geodesic table: {e}")
+
+    def sync(self) -> int:
+        """Bring the table in line with the framework registry. Returns the number of pairs integrated."""
+        names, coords = HybridFrameworkGenerator.coordinate_array()
+        signature = self._current_signature()
+        if signature != self._signature:
+            self._clear()
+            self._signature = signature
+        old = {n: i for i, n in enumerate(self.names)}
+        known = [n in old and np.array_equal(self.coords[old[n]], c) for n, c in zip(names, coords)]
+        if names == self.names and all(known):
+            return 0
+
+        distances = np.zeros((len(names), len(names)))
+        todo = []
+        for i in range(len(names)):
+            for j in range(i + 1, len(names)):
+                if known[i] and known[j]:
+                    distances[i, j] = distances[j, i] = self.distances[old[names[i]], old[names[j]]]
+                else:
+                    todo.append((i, j))
+        paths = self.field_sim.geodesic_batch([(tuple(coords[i]), tuple(coords[j])) for i, j in todo],
+                                              self.n_points, workers=self.workers, mode=self.mode)
+        for (i, j), path in zip(todo, paths):
+            key = (names[i], names[j])
+            self.paths.pop((names[j], names[i]), None)
+            self.paths[key] = path
+            self.endpoint_error[key] = float(np.linalg.norm(np.asarray(path[-1]) - coords[j]))
+            length = self.field_sim.path_length(path)
+            if self.endpoint_error[key] > 1e-9:
+                length += float(self.field_sim.segment_lengths(path[-1], coords[j][None])[0])
+            straight = float(self.field_sim.segment_lengths(coords[i], coords[j][None])[0])
+            distances[i, j] = distances[j, i] = min(length, straight)
+
+        live = set(names)
+        for key in [k for k in self.paths if k[0] not in live or k[1] not in live]:
+            del self.paths[key]
+            del self.endpoint_error[key]
+        self.names, self.coords, self.distances = names, coords, distances
+        if todo:
+            logger.info(f"Geodesic table: integrated {len(todo)} framework pairs ({len(names)} frameworks)")
+            self.save()
+        return len(todo)
+
+    def index_of(self, coords: Tuple[float, ...], tol: float = 1e-9) -> Optional[int]:
+        if not len(self.names):
+            return None
+        hits = np.flatnonzero(np.all(np.abs(self.coords - np.asarray(coords, dtype=float)) <= tol, axis=1))
+        return int(hits[0]) if hits.size else None
+
+    def distance(self, a: str, b: str) -> float:
+        self.sync()
+        return float(self.distances[self.names.index(a), self.names.index(b)])
+
+    def path(self, a: str, b: str, n_points: Optional[int] = None) -> List[Tuple[float, ...]]:
+        self.sync()
+        if a == b:
+            return [tuple(self.coords[self.names.index(a)])]
+        path = self.paths.get((a, b))
+        if path is None:
+            path = self.paths[(b, a)][::-1]
+        return resample_path(path, n_points) if n_points else list(path)
+
+    def lookup_path(self, start: Tuple[float, ...], end: Tuple[float, ...],
+                    n_points: int) -> Optional[List[Tuple[float, ...]]]:
+        """Tabled path when both endpoints are framework coordinates, else None."""
+        self.sync()
+        i, j = self.index_of(start), self.index_of(end)
+        if i is None or j is None or i == j:
+            return None
+        return self.path(self.names[i], self.names[j], n_points)
+
+    def nearest(self, coords: Tuple[float, ...]) -> str:
+        """
+        Framework with the smallest geodesic distance bound from coords: the
+        straight conformal segment to each framework, or to any framework and
+        from there along a tabled geodesic, whichever is shorter.
+        """
+        self.sync()
+        reach = self.field_sim.segment_lengths(coords, self.coords)
+        bound = (reach[:, None] + self.distances).min(axis=0)
+        return self.names[int(np.argmin(bound))]
+
+    def neighbours(self, name: str, k: int = 3) -> List[Tuple[str, float]]:
+        self.sync()
+        row = self.distances[self.names.index(name)]
+        order = [i for i in np.argsort(row, kind='stable') if self.names[i] != name][:k]
+        return [(self.names[i], float(row[i])) for i in order]
+
 # ============================================================================
 # SOPHIA PHASE TRANSITION DETECTOR & HYBRID GENERATOR (with dynamic creation)
 # ============================================================================
@@ -613,14 +1687,15 @@ class SophiaPhaseTransition:
         """
         Generate a hybrid framework. If phase_mode is True, allow triple blending and mutation.
         """
-        frameworks = list(HybridFrameworkGenerator.FRAMEWORKS.keys())
+        registry = HybridFrameworkGenerator.current()
+        frameworks = list(registry.keys())
 
         if seed_context and seed_context.get("key_concepts"):
             concepts = seed_context["key_concepts"]
             scored = []
             for fw in frameworks:
                 score = 0
-                keywords = HybridFrameworkGenerator.FRAMEWORKS[fw].get("seed_keywords", [])
+                keywords = registry[fw].get("seed_keywords", [])
                 for concept in concepts[:3]:
                     if any(keyword in concept for keyword in keywords):
                         score += 1
@@ -642,24 +1717,24 @@ class SophiaPhaseTransition:
                 triple = False
 
         if triple:
-            coords1 = HybridFrameworkGenerator.FRAMEWORKS[parent1]["coordinates"]
-            coords2 = HybridFrameworkGenerator.FRAMEWORKS[parent2]["coordinates"]
-            coords3 = HybridFrameworkGenerator.FRAMEWORKS[parent3]["coordinates"]
+            coords1 = registry[parent1]["coordinates"]
+            coords2 = registry[parent2]["coordinates"]
+            coords3 = registry[parent3]["coordinates"]
             # Average coordinates
             hybrid_coords = tuple((a+b+c)/3 for a,b,c in zip(coords1, coords2, coords3))
             # Collect mechanisms and equations
-            mech_pool = (HybridFrameworkGenerator.FRAMEWORKS[parent1]["mechanisms"] +
-                         HybridFrameworkGenerator.FRAMEWORKS[parent2]["mechanisms"] +
-                         HybridFrameworkGenerator.FRAMEWORKS[parent3]["mechanisms"])
-            eq_pool = (HybridFrameworkGenerator.FRAMEWORKS[parent1]["equations"] +
-                       HybridFrameworkGenerator.FRAMEWORKS[parent2]["equations"] +
-                       HybridFrameworkGenerator.FRAMEWORKS[parent3]["equations"])
+            mech_pool = (registry[parent1]["mechanisms"] +
+                         registry[parent2]["mechanisms"] +
+                         registry[parent3]["mechanisms"])
+            eq_pool = (registry[parent1]["equations"] +
+                       registry[parent2]["equations"] +
+                       registry[parent3]["equations"])
             parent_names = [parent1, parent2, parent3]
         else:
-            coords1 = HybridFrameworkGenerator.FRAMEWORKS[parent1]["coordinates"]
-            coords2 = HybridFrameworkGenerator.FRAMEWORKS[parent2]["coordinates"]
-            w1 = HybridFrameworkGenerator.FRAMEWORKS[parent1]["signature_metrics"].get("elegance", 90)
-            w2 = HybridFrameworkGenerator.FRAMEWORKS[parent2]["signature_metrics"].get("elegance", 90)
+            coords1 = registry[parent1]["coordinates"]
+            coords2 = registry[parent2]["coordinates"]
+            w1 = registry[parent1]["signature_metrics"].get("elegance", 90)
+            w2 = registry[parent2]["signature_metrics"].get("elegance", 90)
             weight1 = w1 / (w1 + w2)
             weight2 = 1 - weight1
             if seed_context and "target_coordinates" in seed_context:
@@ -674,10 +1749,10 @@ class SophiaPhaseTransition:
                     a*weight1 + b*weight2 + random.uniform(-0.05, 0.05)
                     for a, b in zip(coords1, coords2)
                 )
-            mech_pool = (HybridFrameworkGenerator.FRAMEWORKS[parent1]["mechanisms"] +
-                         HybridFrameworkGenerator.FRAMEWORKS[parent2]["mechanisms"])
-            eq_pool = (HybridFrameworkGenerator.FRAMEWORKS[parent1]["equations"] +
-                       HybridFrameworkGenerator.FRAMEWORKS[parent2]["equations"])
+            mech_pool = (registry[parent1]["mechanisms"] +
+                         registry[parent2]["mechanisms"])
+            eq_pool = (registry[parent1]["equations"] +
+                       registry[parent2]["equations"])
             parent_names = [parent1, parent2]
 
         curvature_data = None
@@ -799,6 +1874,52 @@ class GoldenRatioDetector:
                         return True
         return False
 
+    @classmethod
+    def _ratio_matches(cls, values: np.ndarray, targets: Tuple[float, ...]) -> np.ndarray:
+        """(N, K, K) mask of pairs i < j of each row's values, sorted descending, whose ratio is near a target."""
+        ordered = -np.sort(-values, axis=-1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = ordered[:, :, None] / ordered[:, None, :]
+        near = np.zeros(ratio.shape, dtype=bool)
+        for target in targets:
+            near |= np.abs(ratio - target) < cls.TOLERANCE
+        return near & np.triu(np.ones(ratio.shape[1:], dtype=bool), k=1)
+
+    @classmethod
+    def check_metric_batch(cls, metrics: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        check_metric for an (N, 5, 5) stack of metrics. Returns the (N,) mask
+        and an (M, 3) array of matches (metric index, i, j), where i < j index
+        the eigenvalues in descending order.
+        """
+        metrics = np.asarray(metrics, dtype=float)
+        if metrics.ndim != 3 or metrics.shape[1:] != (5, 5):
+            raise ValueError(f"Expected an (N, 5, 5) stack of metrics, got shape {metrics.shape}")
+        near = cls._ratio_matches(np.linalg.eigvalsh(metrics), (cls.PHI, 1/cls.PHI))
+        return near.any(axis=(1, 2)), np.argwhere(near)
+
+    @classmethod
+    def check_curvature_batch(cls, ricci_scalars: np.ndarray,
+                              ricci_components: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        check_curvature for an (N,) array of Ricci scalars, e.g. a trajectory's
+        curvature column, with optional (N, K) components (pad ragged rows
+        with NaN). Returns the (N,) mask and an (M, 3) array of component
+        matches (row, i, j) indexing each row's components in descending order.
+        """
+        scalars = np.asarray(ricci_scalars, dtype=float)
+        mask = np.abs(scalars - cls.PHI) < cls.TOLERANCE
+        matches = np.empty((0, 3), dtype=np.int64)
+        if ricci_components is not None:
+            components = np.asarray(ricci_components, dtype=float)
+            if components.ndim != 2 or len(components) != len(scalars):
+                raise ValueError(f"Expected ({len(scalars)}, K) components, got shape {components.shape}")
+            if components.shape[1] >= 2:
+                near = cls._ratio_matches(components, (cls.PHI,))
+                mask |= near.any(axis=(1, 2))
+                matches = np.argwhere(near)
+        return mask, matches
+
 # ============================================================================
 # LEGACY ONTOLOGY TYPES AND ENGINE (unchanged, kept for compatibility)
 # ============================================================================
@@ -1072,7 +2193,8 @@ class AxiomForgeHybrid:
                  ptype: Optional[str] = None,
                  count: int = 1,
                  tone: str = "poetic",
-                 max_mech: int = 3) -> List[Dict[str, Any]]:
+                 max_mech: int = 3,
+                 as_record: bool = False) -> List[Dict[str, Any]]:
         results = []
         for _ in range(count):
             if ontology_name and ontology_name in self.ontologies:
@@ -1114,7 +2236,7 @@ class AxiomForgeHybrid:
                 },
                 "insights": ["Legacy ontology generation" + (" with meta enhancements" if ontology.is_meta else "")]
             }
-            results.append(result)
+            results.append(AxiomRecord.from_dict(result) if as_record else result)
         return results
 
 # ============================================================================
@@ -1145,10 +2267,158 @@ class MetaOntologyOperators:
                      f"modeled by {x}", f"captured by {x}"]
         return random.choice(templates)
 
+# ============================================================================
+# COMPACT AXIOM RECORDS (__slots__ + packed floats, read-only mapping view)
+# ============================================================================
+
+class _RecordLayout:
+    """Interned key structure of a record: shared by every record of the same shape."""
+    __slots__ = ("shape", "keys", "children", "obj_offsets", "float_offsets")
+
+    def __init__(self, shape: tuple):
+        self.shape = shape
+        _, self.keys, self.children = shape
+        self.obj_offsets, self.float_offsets = [], []
+        objs = floats = 0
+        for child in self.children:
+            self.obj_offsets.append(objs)
+            self.float_offsets.append(floats)
+            n_obj, n_float = _shape_size(child)
+            objs += n_obj
+            floats += n_float
+
+def _shape_size(shape) -> Tuple[int, int]:
+    if shape == "o":
+        return 1, 0
+    if shape == "f":
+        return 0, 1
+    kind = shape[0]
+    if kind in ("t", "lf"):
+        return 0, shape[1]
+    if kind == "l":
+        return shape[1], 0
+    objs = floats = 0
+    for child in shape[2]:
+        n_obj, n_float = _shape_size(child)
+        objs += n_obj
+        floats += n_float
+    return objs, floats
+
+class AxiomRecord(Mapping):
+    """
+    Memory-compact, immutable form of a generated axiom.
+
+    The nested dict is flattened into one tuple of non-float leaves and one
+    packed float array (metrics, coordinates, curvature); its key structure
+    is interned, so millions of records share a handful of layouts. Strings
+    and shared objects such as seed_context are kept by reference. The
+    record is a read-only Mapping over the original top-level keys, and
+    to_dict() rebuilds the exact original dict (key order, tuples and lists).
+    """
+    __slots__ = ("_layout", "_objs", "_floats")
+    SHARED_KEYS = frozenset({"seed_context"})
+    _layouts: Dict[tuple, _RecordLayout] = {}
+
+    def __init__(self, layout: _RecordLayout, objs: tuple, floats: array):
+        self._layout = layout
+        self._objs = objs
+        self._floats = floats
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AxiomRecord':
+        if isinstance(data, AxiomRecord):
+            return data
+        if type(data) is not dict:
+            data = dict(data)
+        objs: List[Any] = []
+        floats: List[float] = []
+        shape = cls._encode(data, objs, floats, top=True)
+        layout = cls._layouts.get(shape)
+        if layout is None:
+            layout = cls._layouts[shape] = _RecordLayout(shape)
+        return cls(layout, tuple(objs), array("d", floats))
+
+    @classmethod
+    def _encode(cls, value: Any, objs: List[Any], floats: List[float], top: bool = False):
+        if type(value) is float:
+            floats.append(value)
+            return "f"
+        if isinstance(value, tuple) and value and all(type(v) is float for v in value):
+            floats.extend(value)
+            return ("t", len(value))
+        if type(value) is list and value and all(type(v) is float for v in value):
+            floats.extend(value)
+            return ("lf", len(value))
+        if type(value) is list and all(isinstance(v, str) for v in value):
+            objs.extend(value)
+            return ("l", len(value))
+        if type(value) is dict:
+            children = []
+            for k, v in value.items():
+                if top and k in cls.SHARED_KEYS:
+                    objs.append(v)
+                    children.append("o")
+                else:
+                    children.append(cls._encode(v, objs, floats))
+            return ("d", tuple(value), tuple(children))
+        objs.append(value)
+        return "o"
+
+    @staticmethod
+    def _decode(shape, objs: tuple, floats: array, oi: int, fi: int) -> Tuple[Any, int, int]:
+        if shape == "o":
+            return objs[oi], oi + 1, fi
+        if shape == "f":
+            return floats[fi], oi, fi + 1
+        kind = shape[0]
+        if kind == "t":
+            n = shape[1]
+            return tuple(floats[fi:fi + n]), oi, fi + n
+        if kind == "lf":
+            n = shape[1]
+            return floats[fi:fi + n].tolist(), oi, fi + n
+        if kind == "l":
+            n = shape[1]
+            return list(objs[oi:oi + n]), oi + n, fi
+        out = {}
+        for key, child in zip(shape[1], shape[2]):
+            out[key], oi, fi = AxiomRecord._decode(child, objs, floats, oi, fi)
+        return out, oi, fi
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._decode(self._layout.shape, self._objs, self._floats, 0, 0)[0]
+
+    def __getitem__(self, key: str) -> Any:
+        layout = self._layout
+        try:
+            i = layout.keys.index(key)
+        except ValueError:
+            raise KeyError(key) from None
+        return self._decode(layout.children[i], self._objs, self._floats,
+                            layout.obj_offsets[i], layout.float_offsets[i])[0]
+
+    def __iter__(self):
+        return iter(self._layout.keys)
+
+    def __len__(self) -> int:
+        return len(self._layout.keys)
+
+    def __repr__(self) -> str:
+        return f"AxiomRecord({self.to_dict()!r})"
+
+    def __reduce__(self):
+        return AxiomRecord.from_dict, (self.to_dict(),)
+
 # ============================================================================
 # SEMANTIC FINGERPRINT & DIVERSITY TRACKER
 # ============================================================================
 
+# Input validation dominates the cost of refitting TF-IDF on ~20 short texts;
+# our inputs are always plain strings, so skip it (results are unchanged).
+_SKLEARN_FAST_CONFIG = {"assume_finite": True}
+if "skip_parameter_validation" in sklearn_get_config():
+    _SKLEARN_FAST_CONFIG["skip_parameter_validation"] = True
+
 class SemanticFingerprint:
     """Compute and compare semantic fingerprints of axioms using TF-IDF."""
 
@@ -1177,10 +2447,11 @@ class SemanticFingerprint:
         text = self._tokenize(axiom)
         all_texts = list(self.history) + [text]
         try:
-            vectors = self.vectorizer.fit_transform(all_texts)
-            new_vec = vectors[-1]
-            hist_vecs = vectors[:-1]
-            sims = cosine_similarity(new_vec, hist_vecs).flatten()
+            with sklearn_config_context(**_SKLEARN_FAST_CONFIG):
+                vectors = self.vectorizer.fit_transform(all_texts)
+                new_vec = vectors[-1]
+                hist_vecs = vectors[:-1]
+                sims = cosine_similarity(new_vec, hist_vecs).flatten()
             return float(np.max(sims))
         except:
             # Fallback: simple word overlap
@@ -1192,18 +2463,126 @@ class SemanticFingerprint:
                 max_overlap = max(max_overlap, overlap)
             return max_overlap
 
+def project_fields(record: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    """Keep only `fields` of a result; dotted names ("meta_ontology.sophia_score") select nested keys."""
+    projected: Dict[str, Any] = {}
+    for name in fields:
+        *parents, leaf = name.split(".")
+        src = record
+        for key in parents:
+            src = src.get(key) if isinstance(src, Mapping) else None
+        if not (isinstance(src, Mapping) and leaf in src):
+            continue
+        dst = projected
+        for key in parents:
+            dst = dst.setdefault(key, {})
+        dst[leaf] = src[leaf]
+    return projected
+
+def _encode_random_state(state: tuple) -> list:
+    version, internal, gauss = state
+    return [version, list(internal), gauss]
+
+def _decode_random_state(data: list) -> tuple:
+    version, internal, gauss = data
+    return (version, tuple(internal), gauss)
+
+def _encode_numpy_random_state(state: tuple) -> list:
+    name, keys, pos, has_gauss, cached = state
+    return [name, keys.tolist(), int(pos), int(has_gauss), float(cached)]
+
+def _decode_numpy_random_state(data: list) -> tuple:
+    name, keys, pos, has_gauss, cached = data
+    return (name, np.array(keys, dtype=np.uint32), pos, has_gauss, cached)
+
+# ============================================================================
+# VISITED-REGION DENSITY GRID (coordinate-space repulsion)
+# ============================================================================
+
+class VisitedRegionGrid:
+    """
+    Decaying 5D occupancy grid over the ontology phase space.
+
+    Every visit deposits unit weight in its cell and all weights decay by
+    `decay` per tick, so the grid measures how recently and how often a
+    region was explored. Lookups and deposits are O(1); decay is applied
+    lazily through a global scale factor. repulsion() points from the
+    crowded side of a cell towards its least visited neighbours.
+    """
+
+    def __init__(self, cells_per_axis: int = 8, decay: float = 0.98):
+        self.n = cells_per_axis
+        self.decay = decay
+        self.low, self.high = OntologyCoordinates.bounds()
+        self.width = (self.high - self.low) / self.n
+        self.grid = np.zeros((self.n,) * 5)
+        self.t = 0
+        # Stored weights are inflated by 1/_scale so decay never touches the array
+        self._scale = 1.0
+
+    def cells(self, coords) -> np.ndarray:
+        x = np.atleast_2d(np.asarray(coords, dtype=float))
+        return np.clip(((x - self.low) / self.width).astype(int), 0, self.n - 1)
+
+    def _density_at(self, cells: np.ndarray) -> np.ndarray:
+        return self.grid[tuple(cells.T)] * self._scale
+
+    def density(self, coords) -> np.ndarray:
+        return self._density_at(self.cells(coords))
+
+    def add(self, coords):
+        np.add.at(self.grid, tuple(self.cells(coords).T), 1.0 / self._scale)
+
+    def tick(self):
+        self.t += 1
+        self._scale *= self.decay
+        if self._scale < 1e-100:
+            self.grid *= self._scale
+            self._scale = 1.0
+
+    def repulsion(self, coords) -> np.ndarray:
+        """One-cell step per walker towards lower density (random direction on a flat neighbourhood)."""
+        c = self.cells(coords)
+        push = np.zeros(c.shape, dtype=float)
+        for axis in range(5):
+            minus, plus = c.copy(), c.copy()
+            minus[:, axis] = np.maximum(c[:, axis] - 1, 0)
+            plus[:, axis] = np.minimum(c[:, axis] + 1, self.n - 1)
+            push[:, axis] = self._density_at(minus) - self._density_at(plus)
+        norm = np.linalg.norm(push, axis=1, keepdims=True)
+        flat = norm[:, 0] < 1e-12
+        if flat.any():
+            push[flat] = np.random.normal(size=(int(flat.sum()), 5))
+            norm[flat] = np.linalg.norm(push[flat], axis=1, keepdims=True)
+        return push / np.maximum(norm, 1e-12) * self.width
+
+    def state(self) -> Dict[str, Any]:
+        nz = np.flatnonzero(self.grid)
+        return {"cells_per_axis": self.n, "decay": self.decay, "t": self.t, "scale": self._scale,
+                "index": nz.tolist(), "values": self.grid.flat[nz].tolist()}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'VisitedRegionGrid':
+        grid = cls(state["cells_per_axis"], state["decay"])
+        grid.t = state["t"]
+        grid._scale = state["scale"]
+        grid.grid.flat[state["index"]] = state["values"]
+        return grid
+
 # ============================================================================
 # META-ONTOLOGY ENGINE (with diversity enforcement, dynamic frameworks, content metrics)
 # ============================================================================
 
 class MetaOntologyEngine:
-    def __init__(self, data_root: str = "."):
+    def __init__(self, data_root: str = ".", load_frameworks: bool = True):
         self.data_root = Path(data_root)
         self.seed_processor = TextSeedProcessor(data_root)
-        HybridFrameworkGenerator.load_frameworks(self.data_root)
-        fw_coords = [np.array(fw["coordinates"]) for fw in HybridFrameworkGenerator.FRAMEWORKS.values()]
-        attractor = np.mean(fw_coords, axis=0)
-        self.field_sim = RelativisticFieldSimulator(attractor_point=tuple(attractor))
+        # Pool workers fed by SharedFrameworkTables already have the registry installed
+        if load_frameworks or not HybridFrameworkGenerator.FRAMEWORKS:
+            HybridFrameworkGenerator.load_frameworks(self.data_root)
+        attractor = np.mean(HybridFrameworkGenerator.current().coordinates, axis=0)
+        self.field_sim = RelativisticFieldSimulator(attractor_point=tuple(attractor),
+                                                    geodesic_cache=GeodesicCache())
         self.operators = MetaOntologyOperators()
         self.generated = []
         self.phase_transitions = []
@@ -1217,6 +2596,73 @@ class MetaOntologyEngine:
         }
         self.phase_mode_active = False
         self.phase_mode_remaining = 0
+        # Worker engines turn this off so parallel runs don't race on dynamic_frameworks.json
+        self.persist_dynamic_frameworks = True
+        # Long walks backed by a CoordinateStore turn this off to keep memory flat
+        self.retain_generated = True
+        # "geodesic" once use_geodesic_table() has built the framework distance table
+        self.framework_metric = "euclidean"
+        # Set by watch_frameworks(); reloads are applied by refresh_frameworks() on the engine's thread
+        self.framework_watcher: Optional[FrameworkWatcher] = None
+        self._reloaded_frameworks: Optional[FrameworkSnapshot] = None
+        self._applied_frameworks_version = HybridFrameworkGenerator.FRAMEWORKS.version
+
+    def pin_frameworks(self, snapshot: Optional[FrameworkSnapshot] = None):
+        """
+        Context manager pinning one framework registry version for the calls
+        made inside it (per thread/task), e.g. around a single request in a
+        threaded server. Dynamic frameworks created inside the block are
+        still published for everyone else.
+        """
+        return HybridFrameworkGenerator.pinned(snapshot)
+
+    def use_geodesic_table(self, workers: int = 1, persist: bool = True) -> FrameworkGeodesicTable:
+        """
+        Build (or load and extend) the all-pairs framework geodesic table and
+        switch nearest-framework lookups and framework-to-framework
+        explore_geodesic calls over to it.
+        """
+        cache = self.data_root / FrameworkGeodesicTable.CACHE_FILE if persist else None
+        table = FrameworkGeodesicTable(self.field_sim, workers=workers, cache_path=cache)
+        table.sync()
+        HybridFrameworkGenerator.GEODESIC_TABLE = table
+        self.framework_metric = "geodesic"
+        return table
+
+    def watch_frameworks(self, interval: float = 2.0) -> FrameworkWatcher:
+        """
+        Start polling the framework files every `interval` seconds. Changes are
+        parsed and published in the background; the attractor follows at the
+        next refresh_frameworks() (called by generate_meta_axiom), and a
+        geodesic table in use is rebuilt on the watcher thread and swapped in
+        when ready.
+        """
+        if self.framework_watcher is None:
+            self.framework_watcher = FrameworkWatcher(self.data_root, interval)
+            self.framework_watcher.subscribe(self._frameworks_reloaded).start()
+        return self.framework_watcher
+
+    def _frameworks_reloaded(self, snapshot: FrameworkSnapshot):
+        self._reloaded_frameworks = snapshot
+        table = HybridFrameworkGenerator.GEODESIC_TABLE
+        if self.framework_metric == "geodesic" and table is not None:
+            # Private simulator: the engine's own one is only touched from its thread
+            sim = RelativisticFieldSimulator(attractor_point=tuple(np.mean(snapshot.coordinates, axis=0)),
+                                             curvature_scale=self.field_sim.k)
+            rebuilt = FrameworkGeodesicTable(sim, n_points=table.n_points, workers=table.workers,
+                                             cache_path=table.cache_path, mode=table.mode)
+            rebuilt.sync()
+            HybridFrameworkGenerator.GEODESIC_TABLE = rebuilt
+
+    def refresh_frameworks(self) -> bool:
+        """Apply the latest hot-reloaded registry (attractor). Returns True if anything changed."""
+        snapshot = self._reloaded_frameworks
+        if snapshot is None or snapshot.version == self._applied_frameworks_version:
+            return False
+        self._applied_frameworks_version = snapshot.version
+        if len(snapshot):
+            self.field_sim.set_attractor(tuple(np.mean(snapshot.coordinates, axis=0)))
+        return True
 
     def generate_meta_axiom(self, target_coords: Optional[OntologyCoordinates] = None,
                             concept_seed: Optional[str] = None,
@@ -1225,11 +2671,35 @@ class MetaOntologyEngine:
                             enable_relativity: bool = True,
                             seed_weight: float = 0.5,
                             diversity_threshold: float = 0.7,
-                            reject_and_retry: int = 3) -> Dict[str, Any]:
+                            reject_and_retry: int = 3,
+                            framework_name: Optional[str] = None,
+                            deadline_ms: Optional[float] = None,
+                            fields: Optional[List[str]] = None,
+                            as_record: bool = False) -> Dict[str, Any]:
         """
         Generate a meta axiom with diversity enforcement.
         If too similar to recent history, retry up to reject_and_retry times.
+        framework_name pins the framework instead of using the nearest one
+        ("HYBRID" forces a freshly blended hybrid).
+        With deadline_ms, retries and optional work (random hybrid blending,
+        dynamic framework creation) stop once the deadline has passed and the
+        most diverse candidate so far is returned; the result then carries a
+        "deadline" entry with degraded=True and the skipped steps.
+        fields limits the returned (and retained) record to those keys (see
+        project_fields; dotted names such as "meta_ontology.sophia_score"
+        select nested keys); Sophia detection still runs because it drives
+        phase mode.
+        The engine retains results as compact AxiomRecords; as_record=True
+        returns that record instead of a plain dict.
         """
+        started = time.perf_counter()
+        skipped: List[str] = []
+
+        def past_deadline() -> bool:
+            return deadline_ms is not None and (time.perf_counter() - started) * 1000.0 >= deadline_ms
+
+        if self.framework_watcher is not None:
+            self.refresh_frameworks()
         self.stats["total"] += 1
         if concept_seed:
             self.stats["text_seeds_used"] += 1
@@ -1262,16 +2732,24 @@ class MetaOntologyEngine:
             self.phase_mode_active = False
 
         # Possibly create a hybrid framework first (if phase mode or random)
-        if phase_mode or random.random() < 0.3:
+        use_hybrid = framework_name == "HYBRID" or (framework_name is None and (phase_mode or random.random() < 0.3))
+        if use_hybrid and framework_name is None and past_deadline():
+            use_hybrid = False
+            skipped.append("hybrid_framework")
+        if use_hybrid:
             sophia = SophiaPhaseTransition(self.field_sim)
             hybrid = sophia.generate_hybrid_framework(seed_context, enable_relativity, phase_mode)
             # If phase mode and hybrid is Sophia-like, maybe create dynamic framework
-            if phase_mode and sophia.sophia_score(hybrid["signature_metrics"].get("coherence", 0.5),
-                                                   hybrid["signature_metrics"]) > 0.6:
+            create_dynamic = phase_mode and sophia.sophia_score(hybrid["signature_metrics"].get("coherence", 0.5),
+                                                                hybrid["signature_metrics"]) > 0.6
+            if create_dynamic and past_deadline():
+                create_dynamic = False
+                skipped.append("dynamic_framework")
+            if create_dynamic:
                 new_fw = sophia.create_dynamic_framework(hybrid)
                 # Add to frameworks
-                new_name = hybrid["name"] + f"_{len(HybridFrameworkGenerator.FRAMEWORKS)}"
-                HybridFrameworkGenerator.add_dynamic_framework(new_name, new_fw, self.data_root)
+                new_name, _ = HybridFrameworkGenerator.add_dynamic_framework(
+                    hybrid["name"], new_fw, self.data_root, persist=self.persist_dynamic_frameworks)
                 self.stats["dynamic_frameworks_created"] += 1
                 logger.info(f"Created dynamic framework: {new_name}")
             # Use hybrid coordinates as target
@@ -1280,11 +2758,18 @@ class MetaOntologyEngine:
             fw_name = "HYBRID"
             framework = hybrid
         else:
-            fw_name = HybridFrameworkGenerator.get_nearest_framework(target_coords.to_tuple())
+            fw_name = framework_name or HybridFrameworkGenerator.get_nearest_framework(
+                target_coords.to_tuple(), metric=self.framework_metric)
             framework = HybridFrameworkGenerator.get_framework(fw_name)
 
         # Attempt to generate an axiom with diversity check
+        best = None
         for attempt in range(reject_and_retry):
+            if attempt > 0 and past_deadline():
+                # Out of time: fall back to the most diverse candidate so far
+                core, mechanisms, equation, consequences, axiom_text, sim = best
+                skipped.append("diversity_retries")
+                break
             # Generate core, possibly blending seed
             core = self._generate_core(target_coords, framework, concept_seed, seed_context, seed_weight, phase_mode)
             mechanisms = self._generate_mechanisms(framework.get("mechanisms", []), seed_context, concept_seed)
@@ -1304,14 +2789,16 @@ class MetaOntologyEngine:
             sim = self.fingerprint_tracker.similarity_to_history(temp_axiom)
             if sim < diversity_threshold:
                 break
+            if best is None or sim < best[-1]:
+                best = (core, mechanisms, equation, consequences, axiom_text, sim)
             logger.debug(f"Rejected axiom (similarity {sim:.2f}), retry {attempt+1}")
         else:
             # All retries failed; accept anyway but log warning
             logger.warning("Could not generate diverse axiom after multiple retries.")
 
-        # Compute content-based metrics
+        # Compute content-based metrics (novelty reuses the similarity of the accepted candidate)
         computed_metrics = self._compute_content_metrics(core, mechanisms, equation, consequences,
-                                                          seed_context, ricci, fw_name)
+                                                          seed_context, ricci, fw_name, similarity=sim)
 
         # Sophia detection
         sophia_score = SophiaPhaseTransition().sophia_score(computed_metrics.get("coherence", 0.5),
@@ -1349,15 +2836,26 @@ class MetaOntologyEngine:
                 "sophia_score": sophia_score
             }
         }
+        if deadline_ms is not None:
+            result["deadline"] = {
+                "deadline_ms": deadline_ms,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000.0, 3),
+                "degraded": bool(skipped),
+                "skipped": skipped
+            }
 
         # Add to history for diversity tracking
         self.fingerprint_tracker.add(result)
-        self.generated.append(result)
+        if fields is not None:
+            result = project_fields(result, fields)
+        record = AxiomRecord.from_dict(result)
+        if self.retain_generated:
+            self.generated.append(record)
         if is_sophia:
-            self.phase_transitions.append(result)
+            self.phase_transitions.append(record)
             self.stats["phase_transitions"] += 1
         self.stats["meta"] += 1
-        return result
+        return record if as_record else result
 
     def _generate_core(self, coords: OntologyCoordinates, framework: Dict, seed: Optional[str],
                        ctx: Optional[Dict], seed_weight: float, phase_mode: bool) -> str:
@@ -1414,11 +2912,14 @@ class MetaOntologyEngine:
         return f"{core} — {via}; {encoded}; {entails}."
 
     def _compute_content_metrics(self, core: str, mechs: List[str], eq: str, conseq: List[str],
-                                   ctx: Optional[Dict], ricci: float, fw_name: str) -> Dict[str, float]:
+                                   ctx: Optional[Dict], ricci: float, fw_name: str,
+                                   similarity: Optional[float] = None) -> Dict[str, float]:
         """Dynamically compute metrics based on actual content."""
         # Novelty: 1 - average similarity to history (if history exists)
         novelty = 1.0
-        if len(self.fingerprint_tracker.history) > 0:
+        if similarity is not None:
+            novelty = 1.0 - similarity
+        elif len(self.fingerprint_tracker.history) > 0:
             # Use the tracker's similarity as inverse novelty
             temp_axiom = {"core_statement": core, "mechanisms": mechs, "ontology": {"framework_family": fw_name}}
             sim = self.fingerprint_tracker.similarity_to_history(temp_axiom)
@@ -1445,9 +2946,10 @@ class MetaOntologyEngine:
 
         # Hybridization index: number of distinct frameworks referenced
         frameworks_involved = {fw_name}
+        registry = HybridFrameworkGenerator.current()
         for m in mechs:
-            for fw in HybridFrameworkGenerator.FRAMEWORKS:
-                if any(kw in m.lower() for kw in HybridFrameworkGenerator.FRAMEWORKS[fw].get("seed_keywords", [])):
+            for fw, keywords in registry.keywords:
+                if any(kw in m.lower() for kw in keywords):
                     frameworks_involved.add(fw)
         hybridization_index = len(frameworks_involved) / 5.0  # normalized to ~1
 
@@ -1469,83 +2971,311 @@ class MetaOntologyEngine:
     def explore_phase_space(self, steps: int = 50, seed_text: Optional[str] = None,
                             enable_relativity: bool = True,
                             seed_weight: float = 0.3,
-                            diversity_threshold: float = 0.7) -> List[Dict[str, Any]]:
-        """Explore phase space with repulsion from already visited semantic regions."""
-        trajectory = []
+                            diversity_threshold: float = 0.7,
+                            checkpoint_path: Optional[Union[str, Path]] = None,
+                            checkpoint_every: int = 1000,
+                            resume: bool = False) -> List[Dict[str, Any]]:
+        """
+        Explore phase space with repulsion from recently visited regions.
+        With checkpoint_path, walker state is checkpointed every checkpoint_every
+        steps and each step is appended to <checkpoint_path>.steps.jsonl; resume=True
+        continues bit-identically from the last checkpoint (returning only the new steps).
+        """
+        return list(self.iter_phase_space(steps, seed_text, enable_relativity,
+                                          seed_weight, diversity_threshold,
+                                          checkpoint_path, checkpoint_every, resume))
+
+    def _engine_state(self) -> Dict[str, Any]:
+        """JSON-serializable snapshot of everything that influences the next generation."""
+        return {
+            "fingerprint_history": list(self.fingerprint_tracker.history),
+            "phase_mode_active": self.phase_mode_active,
+            "phase_mode_remaining": self.phase_mode_remaining,
+            "stats": dict(self.stats),
+            "attractor": [float(x) for x in self.field_sim._attractor],
+            "frameworks": convert_to_serializable(dict(HybridFrameworkGenerator.current())),
+            "random_state": _encode_random_state(random.getstate()),
+            "numpy_random_state": _encode_numpy_random_state(np.random.get_state()),
+        }
+
+    def _restore_engine_state(self, state: Dict[str, Any]):
+        """
+        Inverse of _engine_state(). Walk checkpoints carry "attractor" and
+        "frameworks" and get them back; callers that keep the registry loaded
+        from disk (MetaAxiomForge.load_state) leave them out.
+        """
+        self.fingerprint_tracker.history.clear()
+        self.fingerprint_tracker.history.extend(state["fingerprint_history"])
+        self.phase_mode_active = state["phase_mode_active"]
+        self.phase_mode_remaining = state["phase_mode_remaining"]
+        self.stats.update(state["stats"])
+        if "attractor" in state:
+            self.field_sim.set_attractor(tuple(state["attractor"]))
+        if "frameworks" in state:
+            HybridFrameworkGenerator.publish(state["frameworks"])
+        random.setstate(_decode_random_state(state["random_state"]))
+        np.random.set_state(_decode_numpy_random_state(state["numpy_random_state"]))
+
+    def _save_walk_checkpoint(self, path: Path, walker: Dict[str, Any]):
+        checkpoint = {"version": 1, "walker": walker, "engine": self._engine_state()}
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def iter_phase_space(self, steps: int = 50, seed_text: Optional[str] = None,
+                         enable_relativity: bool = True,
+                         seed_weight: float = 0.3,
+                         diversity_threshold: float = 0.7,
+                         checkpoint_path: Optional[Union[str, Path]] = None,
+                         checkpoint_every: int = 1000,
+                         resume: bool = False,
+                         coord_store: Optional['CoordinateStore'] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Same walk as explore_phase_space(), yielding each trajectory step as it is produced.
+        Steps are also appended to `coord_store` (flushed with every checkpoint; on resume,
+        rows past the checkpoint are dropped first).
+        """
         current = OntologyCoordinates(0.5,0.5,0.5,0.5,0.5)
         seed_context = None
-        if seed_text:
+        start_step = 0
+        steps_offset = 0
+        # Decaying occupancy of visited coordinates, used for repulsion
+        visited = VisitedRegionGrid()
+
+        checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        if resume and not checkpoint_path:
+            raise ValueError("resume=True requires a checkpoint_path")
+        if resume and not checkpoint_path.exists():
+            logger.warning(f"No checkpoint at {checkpoint_path}; starting a fresh walk.")
+            resume = False
+            if coord_store is not None:
+                coord_store.truncate(0)
+
+        if resume:
+            with open(checkpoint_path, 'r', encoding='utf-8') as f:
+                checkpoint = json.load(f)
+            walker = checkpoint["walker"]
+            if walker["seed_text"] != seed_text:
+                raise ValueError(f"Checkpoint was written for seed {walker['seed_text']!r}, not {seed_text!r}")
+            seed_context = walker["seed_context"]
+            if seed_context is not None:
+                seed_context["target_coordinates"] = OntologyCoordinates(*seed_context["target_coordinates"])
+                if seed_context.get("syntactic_structure"):
+                    seed_context["syntactic_structure"] = tuple(seed_context["syntactic_structure"])
+            current = OntologyCoordinates(*walker["current"])
+            visited = VisitedRegionGrid.from_state(walker["visited_region"])
+            start_step = walker["next_step"]
+            steps_offset = walker["steps_offset"]
+            self._restore_engine_state(checkpoint["engine"])
+            if coord_store is not None:
+                coord_store.truncate(int(np.searchsorted(coord_store.column("step"), start_step)))
+            logger.info(f"Resuming walk at step {start_step} from {checkpoint_path}")
+        elif seed_text:
             seed_context = self.seed_processor.process_text_seed(seed_text)
             random.seed(seed_context["seed_hash"])
             np.random.seed(seed_context["seed_hash"] % (2**32))
 
-        # Keep local history for repulsion
-        visited_fingerprints = []
+        steps_file = None
+        if checkpoint_path:
+            steps_path = checkpoint_path.with_name(checkpoint_path.name + ".steps.jsonl")
+            if resume and steps_path.exists():
+                # Drop steps written after the last checkpoint; they will be regenerated
+                steps_file = open(steps_path, 'r+b')
+                steps_file.truncate(steps_offset)
+                steps_file.seek(steps_offset)
+            else:
+                steps_file = open(steps_path, 'wb')
 
-        for step in range(steps):
-            # Generate axiom at current coordinates
-            axiom = self.generate_meta_axiom(
-                target_coords=current,
-                concept_seed=seed_text,
-                seed_context=seed_context,
-                enable_relativity=enable_relativity,
-                seed_weight=seed_weight,
-                diversity_threshold=diversity_threshold
+        try:
+            for step in range(start_step, steps):
+                record = self._phase_space_step(step, current, seed_text, seed_context, enable_relativity,
+                                                seed_weight, diversity_threshold, visited)
+                current = record["coordinates"]
+                record["coordinates"] = current.to_tuple()
+                if coord_store is not None:
+                    coord_store.append(record)
+
+                if steps_file:
+                    steps_file.write((json.dumps(convert_to_serializable(record), ensure_ascii=False)
+                                      + "\n").encode("utf-8"))
+                    steps_file.flush()
+                    if (step + 1) % checkpoint_every == 0 or step == steps - 1:
+                        os.fsync(steps_file.fileno())
+                        if coord_store is not None:
+                            coord_store.flush()
+                        self._save_walk_checkpoint(checkpoint_path, {
+                            "seed_text": seed_text,
+                            "seed_context": convert_to_serializable(seed_context),
+                            "current": list(current.to_tuple()),
+                            "visited_region": visited.state(),
+                            "next_step": step + 1,
+                            "steps_offset": steps_file.tell(),
+                        })
+                yield record
+        finally:
+            if steps_file:
+                steps_file.close()
+
+    def _phase_space_step(self, step: int, current: OntologyCoordinates,
+                          seed_text: Optional[str], seed_context: Optional[Dict],
+                          enable_relativity: bool, seed_weight: float,
+                          diversity_threshold: float,
+                          visited: VisitedRegionGrid,
+                          revisit_threshold: float = 0.5) -> Dict[str, Any]:
+        """Advance the walker one step; the returned record carries the new OntologyCoordinates."""
+        # Generate axiom at current coordinates
+        axiom = self.generate_meta_axiom(
+            target_coords=current,
+            concept_seed=seed_text,
+            seed_context=seed_context,
+            enable_relativity=enable_relativity,
+            seed_weight=seed_weight,
+            diversity_threshold=diversity_threshold
+        )
+
+        # Repulsion: if this region was explored recently, step towards the
+        # least visited neighbouring cells before continuing the walk
+        coords = current.to_tuple()
+        if visited.density(coords)[0] >= revisit_threshold:
+            current = OntologyCoordinates(*(np.array(coords) + visited.repulsion(coords)[0]))
+        visited.add(coords)
+        visited.tick()
+
+        # Update coordinates for next step (random walk with attraction)
+        if random.random() < 0.3:
+            fw_name = HybridFrameworkGenerator.get_nearest_framework(current.to_tuple(),
+                                                                     metric=self.framework_metric)
+            fw_coords = HybridFrameworkGenerator.get_framework(fw_name)["coordinates"]
+            current = OntologyCoordinates(
+                current.participation * 0.7 + fw_coords[0] * 0.3,
+                current.plasticity * 0.7 + fw_coords[1] * 0.3,
+                current.substrate * 0.7 + fw_coords[2] * 0.3,
+                current.temporal * 0.7 + fw_coords[3] * 0.3,
+                current.generative * 0.7 + fw_coords[4] * 0.3
+            )
+        else:
+            current = OntologyCoordinates(
+                current.participation + random.uniform(-0.1,0.1),
+                current.plasticity + random.uniform(-0.1,0.1),
+                current.substrate + random.uniform(-0.1,0.1),
+                current.temporal + random.uniform(-0.1,0.1),
+                current.generative + random.uniform(-0.1,0.1)
             )
 
-            # Compute fingerprint and check if too similar to visited
-            fp = SemanticFingerprint()
-            fp.add(axiom)
-            if visited_fingerprints:
-                sims = [cosine_similarity([fp._tokenize(axiom)], [fp2])[0][0] for fp2 in visited_fingerprints[-10:]]
-                max_sim = max(sims) if sims else 0
-                if max_sim > diversity_threshold:
-                    # Apply repulsion: move coordinates away from the region that produced similar axioms
-                    # Simple: add a large random jump
-                    current = OntologyCoordinates(
-                        current.participation + random.uniform(-0.3, 0.3),
-                        current.plasticity + random.uniform(-0.3, 0.3),
-                        current.substrate + random.uniform(-0.3, 0.3),
-                        current.temporal + random.uniform(-0.3, 0.3),
-                        current.generative + random.uniform(-0.3, 0.3)
-                    )
-            visited_fingerprints.append(fp._tokenize(axiom))
+        return {
+            "step": step,
+            "coordinates": current,
+            "axiom": axiom["core_statement"],
+            "framework": axiom["ontology"]["framework_family"],
+            "is_sophia": axiom["meta_ontology"]["phase_transition"],
+            "coherence": axiom["metrics"].get("coherence", 0.5),
+            "curvature": axiom["metrics"]["ricci_scalar"]
+        }
 
-            # Update coordinates for next step (random walk with attraction)
-            if random.random() < 0.3:
-                fw_name = HybridFrameworkGenerator.get_nearest_framework(current.to_tuple())
-                fw_coords = HybridFrameworkGenerator.get_framework(fw_name)["coordinates"]
-                current = OntologyCoordinates(
-                    current.participation * 0.7 + fw_coords[0] * 0.3,
-                    current.plasticity * 0.7 + fw_coords[1] * 0.3,
-                    current.substrate * 0.7 + fw_coords[2] * 0.3,
-                    current.temporal * 0.7 + fw_coords[3] * 0.3,
-                    current.generative * 0.7 + fw_coords[4] * 0.3
-                )
-            else:
-                current = OntologyCoordinates(
-                    current.participation + random.uniform(-0.1,0.1),
-                    current.plasticity + random.uniform(-0.1,0.1),
-                    current.substrate + random.uniform(-0.1,0.1),
-                    current.temporal + random.uniform(-0.1,0.1),
-                    current.generative + random.uniform(-0.1,0.1)
-                )
+    def explore_ensemble(self, walkers: int = 1000, steps: int = 50,
+                         start: Optional[Tuple[float, ...]] = None,
+                         enable_relativity: bool = True,
+                         materialize_steps: Optional[List[int]] = None,
+                         materialize_walkers: int = 0,
+                         seed_text: Optional[str] = None,
+                         seed_weight: float = 0.3,
+                         diversity_threshold: float = 0.7,
+                         record_every: int = 1,
+                         repulsion: bool = True) -> Dict[str, Any]:
+        """
+        Advance `walkers` walkers together as a (W, 5) array using the same
+        random walk and framework attraction as explore_phase_space. With
+        `repulsion`, walkers in cells more crowded than the ensemble average
+        are pushed towards less visited neighbours of a shared VisitedRegionGrid.
+        Curvature is computed for every walker and step; axiom text is only
+        generated for the first `materialize_walkers` walkers at the steps in
+        `materialize_steps`. Coordinates and curvature are recorded every
+        `record_every` steps (plus the final state).
+        """
+        low, high = OntologyCoordinates.bounds()
+        fw_names, fw_coords = HybridFrameworkGenerator.coordinate_array()
+        seed_context = None
+        if seed_text:
+            seed_context = self.seed_processor.process_text_seed(seed_text)
+            random.seed(seed_context["seed_hash"])
+            np.random.seed(seed_context["seed_hash"] % (2**32))
 
-            trajectory.append({
-                "step": step,
-                "coordinates": current.to_tuple(),
-                "axiom": axiom["core_statement"],
-                "framework": axiom["ontology"]["framework_family"],
-                "is_sophia": axiom["meta_ontology"]["phase_transition"],
-                "coherence": axiom["metrics"].get("coherence", 0.5),
-                "curvature": axiom["metrics"]["ricci_scalar"]
-            })
-        return trajectory
+        current = np.empty((walkers, 5))
+        current[:] = start if start is not None else (0.5, 0.5, 0.5, 0.5, 0.5)
+        current = np.clip(current, low, high)
+        materialize = set(materialize_steps or [])
+        n_mat = min(materialize_walkers, walkers)
+        visited = VisitedRegionGrid()
+
+        recorded_steps, coord_history, curv_history, fw_history = [], [], [], []
+        axioms = []
+        for step in range(steps):
+            if step in materialize and n_mat:
+                for w in range(n_mat):
+                    axiom = self.generate_meta_axiom(
+                        target_coords=OntologyCoordinates(*current[w]),
+                        concept_seed=seed_text,
+                        seed_context=seed_context,
+                        enable_relativity=enable_relativity,
+                        seed_weight=seed_weight,
+                        diversity_threshold=diversity_threshold
+                    )
+                    axioms.append({
+                        "step": step,
+                        "walker": w,
+                        "coordinates": tuple(float(c) for c in current[w]),
+                        "axiom": axiom["core_statement"],
+                        "framework": axiom["ontology"]["framework_family"],
+                        "is_sophia": axiom["meta_ontology"]["phase_transition"],
+                        "coherence": axiom["metrics"].get("coherence", 0.5),
+                        "curvature": axiom["metrics"]["ricci_scalar"]
+                    })
+
+            # Random walk with attraction to the nearest framework
+            d2 = np.sum((current[:, None, :] - fw_coords[None, :, :])**2, axis=2)
+            nearest = np.argmin(d2, axis=1)
+            attract = np.random.random(walkers) < 0.3
+            jump = np.random.uniform(-0.1, 0.1, size=(walkers, 5))
+            current = np.where(attract[:, None],
+                               current * 0.7 + fw_coords[nearest] * 0.3,
+                               current + jump)
+            current = np.clip(current, low, high)
+
+            if repulsion:
+                density = visited.density(current)
+                crowded = density > density.mean()
+                if crowded.any():
+                    current[crowded] = np.clip(current[crowded] + visited.repulsion(current[crowded]), low, high)
+                visited.add(current)
+                visited.tick()
+
+            if (step + 1) % record_every == 0 or step == steps - 1:
+                recorded_steps.append(step)
+                coord_history.append(current.copy())
+                curv_history.append(self.field_sim.ricci_scalar_batch(current) if enable_relativity
+                                    else np.zeros(walkers))
+                fw_history.append(np.argmin(np.sum((current[:, None, :] - fw_coords[None, :, :])**2, axis=2),
+                                            axis=1))
+
+        return {
+            "walkers": walkers,
+            "steps": steps,
+            "recorded_steps": np.array(recorded_steps, dtype=int),
+            "coordinates": np.array(coord_history).reshape(len(recorded_steps), walkers, 5),
+            "curvature": np.array(curv_history).reshape(len(recorded_steps), walkers),
+            "framework_ids": np.array(fw_history, dtype=int).reshape(len(recorded_steps), walkers),
+            "framework_names": fw_names,
+            "axioms": axioms,
+        }
 
     def simulate_framework_evolution(self, framework_name: str, steps: int = 100,
                                      dt: float = 0.005) -> Dict[str, Any]:
-        if framework_name not in HybridFrameworkGenerator.FRAMEWORKS:
-            logger.error(f"Unknown framework '{framework_name}'. Available: {list(HybridFrameworkGenerator.FRAMEWORKS.keys())}")
+        registry = HybridFrameworkGenerator.current()
+        if framework_name not in registry:
+            logger.error(f"Unknown framework '{framework_name}'. Available: {list(registry.keys())}")
             return {}
         framework = HybridFrameworkGenerator.get_framework(framework_name)
         coords = framework["coordinates"]
@@ -1557,12 +3287,78 @@ class MetaOntologyEngine:
             "final_coords": flow[-1]
         }
 
+    def simulate_ensemble_evolution(self, steps: int = 100, dt: float = 0.005,
+                                    interaction: float = 0.0,
+                                    interaction_range: float = 0.25) -> Dict[str, Any]:
+        """
+        Flow every registered framework (base and dynamic) together as one
+        (F, 5) array. Returns the (T+1, F, 5) trajectory, the (T+1, F) Ricci
+        scalars along it and the step at which each framework stopped (-1 if
+        it flowed for all steps).
+        """
+        names, coords = HybridFrameworkGenerator.coordinate_array()
+        trajectory, stopped = self.field_sim.curvature_gradient_flow_batch(
+            coords, steps=steps, dt=dt, interaction=interaction, interaction_range=interaction_range)
+        with np.errstate(over='ignore', invalid='ignore'):
+            curvature = self.field_sim.ricci_scalar_batch(trajectory)
+        return {
+            "frameworks": names,
+            "trajectory": trajectory,
+            "curvature": curvature,
+            "stopped_step": stopped
+        }
+
     def explore_geodesic(self, start_coords: Tuple[float, ...], end_coords: Tuple[float, ...],
                          steps: int = 20, plot: bool = False,
                          seed_text: Optional[str] = None,
+                         seed_weight: float = 0.2,
+                         diversity_threshold: float = 0.7,
+                         mode: str = "shooting") -> List[Dict[str, Any]]:
+        path = None
+        if HybridFrameworkGenerator.GEODESIC_TABLE is not None:
+            path = HybridFrameworkGenerator.GEODESIC_TABLE.lookup_path(start_coords, end_coords, steps)
+        if path is None:
+            path = self.field_sim.geodesic(start_coords, end_coords, n_points=steps, mode=mode)
+        trajectory = self.trajectory_along(path, seed_text, seed_weight, diversity_threshold)
+
+        if plot and HAS_MATPLOTLIB:
+            fig, ax = plt.subplots()
+            xs = [p[0] for p in path]
+            ys = [p[1] for p in path]
+            ax.plot(xs, ys, 'o-', label='Geodesic')
+            ax.set_xlabel('Participation')
+            ax.set_ylabel('Plasticity')
+            ax.set_title(f'Geodesic from {start_coords[:2]} to {end_coords[:2]}')
+            ax.grid(True)
+            plt.show()
+        elif plot and not HAS_MATPLOTLIB:
+            logger.warning("matplotlib not installed, skipping plot.")
+
+        return trajectory
+
+    def geodesic_paths(self, pairs: List[Tuple[Tuple[float, ...], Tuple[float, ...]]],
+                       steps: int = 20, workers: int = 1,
+                       mode: str = "shooting") -> List[List[Tuple[float, ...]]]:
+        """
+        Geodesic paths for many (start, end) pairs, in input order. Pairs of
+        framework coordinates come from the geodesic table when one is in use;
+        the rest are integrated together by field_sim.geodesic_batch.
+        """
+        paths: List[Optional[List[Tuple[float, ...]]]] = [None] * len(pairs)
+        table = HybridFrameworkGenerator.GEODESIC_TABLE
+        if table is not None:
+            for i, (start, end) in enumerate(pairs):
+                paths[i] = table.lookup_path(start, end, steps)
+        todo = [i for i, path in enumerate(paths) if path is None]
+        for i, path in zip(todo, self.field_sim.geodesic_batch([pairs[i] for i in todo], steps,
+                                                               workers=workers, mode=mode)):
+            paths[i] = path
+        return paths
+
+    def trajectory_along(self, path: List[Tuple[float, ...]], seed_text: Optional[str] = None,
                          seed_weight: float = 0.2,
                          diversity_threshold: float = 0.7) -> List[Dict[str, Any]]:
-        path = self.field_sim.geodesic(start_coords, end_coords, n_points=steps)
+        """Generate one axiom per point of a path (the explore_geodesic trajectory format)."""
         trajectory = []
         seed_context = None
         if seed_text:
@@ -1587,20 +3383,6 @@ class MetaOntologyEngine:
                 "coherence": axiom["metrics"].get("coherence", 0.5),
                 "curvature": axiom["metrics"]["ricci_scalar"]
             })
-
-        if plot and HAS_MATPLOTLIB:
-            fig, ax = plt.subplots()
-            xs = [p[0] for p in path]
-            ys = [p[1] for p in path]
-            ax.plot(xs, ys, 'o-', label='Geodesic')
-            ax.set_xlabel('Participation')
-            ax.set_ylabel('Plasticity')
-            ax.set_title(f'Geodesic from {start_coords[:2]} to {end_coords[:2]}')
-            ax.grid(True)
-            plt.show()
-        elif plot and not HAS_MATPLOTLIB:
-            logger.warning("matplotlib not installed, skipping plot.")
-
         return trajectory
 
     def get_framework_summary(self, framework_name: str) -> Dict[str, Any]:
@@ -1613,11 +3395,628 @@ class MetaOntologyEngine:
     def get_stats(self) -> Dict[str, Any]:
         return self.stats
 
+# ============================================================================
+# QUALITY-DIVERSITY SEARCH (MAP-Elites over the 5D phase space)
+# ============================================================================
+
+_WORKER_ENGINE: Optional['MetaOntologyEngine'] = None
+_WORKER_TABLES: Optional[SharedFrameworkTables] = None
+
+def _init_search_worker(data_root: str, seed: int, index: int = 0,
+                        tables: Optional[Tuple[str, Dict[str, Any]]] = None):
+    """
+    Process-pool initializer: one private engine per worker, no dynamic-framework
+    writes. With `tables` (a SharedFrameworkTables handle) the registry and
+    corpus come from the parent's shared block instead of the data files.
+    Worker `index` is seeded from SeedSequence(seed).spawn()[index].
+    """
+    global _WORKER_ENGINE, _WORKER_TABLES
+    logging.getLogger().setLevel(logging.WARNING)
+    if tables is not None:
+        _WORKER_TABLES = SharedFrameworkTables.attach(tables)
+        _WORKER_TABLES.install()
+    _WORKER_ENGINE = MetaOntologyEngine(data_root, load_frameworks=tables is None)
+    _WORKER_ENGINE.persist_dynamic_frameworks = False
+    worker_seed = int(np.random.SeedSequence(seed, spawn_key=(index,)).generate_state(1)[0])
+    random.seed(worker_seed)
+    np.random.seed(worker_seed)
+
+def _open_search_pool(engine: 'MetaOntologyEngine', workers: int,
+                      seed: int) -> Tuple[List[ProcessPoolExecutor], SharedFrameworkTables]:
+    """
+    One single-process pool per worker, all attached to one shared copy of the
+    framework tables. Chunk i of every batch always goes to worker i, so a
+    worker's engine history (and thus the run) doesn't depend on scheduling.
+    """
+    tables = SharedFrameworkTables.create()
+    pools: List[ProcessPoolExecutor] = []
+    try:
+        for index in range(workers):
+            pools.append(ProcessPoolExecutor(max_workers=1, initializer=_init_search_worker,
+                                             initargs=(str(engine.data_root), seed, index, tables.handle)))
+    except Exception:
+        for pool in pools:
+            pool.shutdown()
+        tables.unlink()
+        raise
+    return pools, tables
+
+def _evaluate_in_worker(batch: List[Tuple[Tuple[float, ...], Dict[str, Any]]], objective: str,
+                        enable_relativity: bool) -> List[Tuple[Tuple[float, ...], float, Dict[str, Any]]]:
+    return [_evaluate_axiom(_WORKER_ENGINE, coords, objective, enable_relativity, **kwargs)
+            for coords, kwargs in batch]
+
+def _evaluate_batch(engine: 'MetaOntologyEngine', pools: Optional[List[ProcessPoolExecutor]],
+                    batch: List[Tuple[Tuple[float, ...], Dict[str, Any]]], objective: str,
+                    enable_relativity: bool) -> List[Tuple[Tuple[float, ...], float, Dict[str, Any]]]:
+    """Evaluate (coords, generate kwargs) pairs in order, across `pools` when given."""
+    if pools is None:
+        return [_evaluate_axiom(engine, coords, objective, enable_relativity, **kwargs)
+                for coords, kwargs in batch]
+    workers = len(pools)
+    chunks = [batch[i::workers] for i in range(workers) if batch[i::workers]]
+    futures = [pool.submit(_evaluate_in_worker, c, objective, enable_relativity)
+               for pool, c in zip(pools, chunks)]
+    results = [f.result() for f in futures]
+    # Undo the round-robin split so results line up with `batch`
+    return [results[i % len(chunks)][i // len(chunks)] for i in range(len(batch))]
+
+def _evaluate_axiom(engine: 'MetaOntologyEngine', coords: Tuple[float, ...], objective: str,
+                    enable_relativity: bool = True, **generate_kwargs) -> Tuple[Tuple[float, ...], float, Dict[str, Any]]:
+    """Generate one axiom at `coords`; return (coordinates actually used, fitness, axiom)."""
+    axiom = engine.generate_meta_axiom(target_coords=OntologyCoordinates(*coords),
+                                       enable_relativity=enable_relativity, **generate_kwargs)
+    if objective == "sophia_score":
+        fitness = axiom["meta_ontology"]["sophia_score"]
+    else:
+        fitness = axiom["metrics"][objective]
+    return tuple(float(c) for c in axiom["ontology"]["coordinates"]), float(fitness), axiom
+
+class MapElitesSearch:
+    """
+    MAP-Elites quality-diversity search over the 5 OntologyCoordinates axes.
+
+    The phase space is cut into cells_per_axis^5 cells and the archive keeps
+    the best axiom (by `objective`) found in each cell. After `init_samples`
+    uniform samples, new candidates are Gaussian mutations of randomly chosen
+    elites, so evaluations flow into empty or weak cells instead of
+    re-sampling well covered regions. Candidates are evaluated in batches,
+    optionally across a process pool with one engine per worker.
+    """
+
+    OBJECTIVES = ("elegance", "novelty", "coherence", "sophia_score")
+
+    def __init__(self, engine: 'MetaOntologyEngine', cells_per_axis: int = 5,
+                 objective: str = "elegance", init_samples: int = 100,
+                 mutation_sigma: float = 0.1, batch_size: int = 32,
+                 workers: int = 1, enable_relativity: bool = True, seed: int = 0):
+        if objective not in self.OBJECTIVES:
+            raise ValueError(f"Unknown objective '{objective}'. Use one of: {', '.join(self.OBJECTIVES)}")
+        self.engine = engine
+        self.n = cells_per_axis
+        self.objective = objective
+        self.init_samples = init_samples
+        self.mutation_sigma = mutation_sigma
+        self.batch_size = batch_size
+        self.workers = workers
+        self.enable_relativity = enable_relativity
+        self.seed = seed
+        self.low, self.high = OntologyCoordinates.bounds()
+        self.archive: Dict[Tuple[int, ...], Dict[str, Any]] = {}
+        self.coverage_curve: List[Dict[str, float]] = []
+        self.evaluations = 0
+
+    def cell(self, coords: Tuple[float, ...]) -> Tuple[int, ...]:
+        idx = ((np.asarray(coords) - self.low) / (self.high - self.low) * self.n).astype(int)
+        return tuple(int(i) for i in np.clip(idx, 0, self.n - 1))
+
+    def _propose(self, count: int) -> List[Tuple[float, ...]]:
+        proposals = []
+        elites = list(self.archive.values())
+        for _ in range(count):
+            if self.evaluations + len(proposals) < self.init_samples or not elites:
+                x = np.random.uniform(self.low, self.high)
+            else:
+                parent = elites[np.random.randint(len(elites))]["coordinates"]
+                x = np.asarray(parent) + np.random.normal(0, self.mutation_sigma, 5) * (self.high - self.low)
+            proposals.append(tuple(float(v) for v in np.clip(x, self.low, self.high)))
+        return proposals
+
+    def _insert(self, coords: Tuple[float, ...], fitness: float, axiom: Dict[str, Any]):
+        cell = self.cell(coords)
+        incumbent = self.archive.get(cell)
+        if incumbent is None or fitness > incumbent["fitness"]:
+            self.archive[cell] = {"cell": cell, "fitness": fitness, "coordinates": coords, "axiom": axiom}
+
+    def run(self, budget: int = 1000) -> Dict[str, Any]:
+        """Spend `budget` evaluations and return the filled archive and coverage curve."""
+        pools = tables = None
+        if self.workers > 1:
+            pools, tables = _open_search_pool(self.engine, self.workers, self.seed)
+        try:
+            while self.evaluations < budget:
+                n = min(self.batch_size, budget - self.evaluations)
+                batch = [(c, {}) for c in self._propose(n)]
+                results = _evaluate_batch(self.engine, pools, batch,
+                                          self.objective, self.enable_relativity)
+                for coords, fitness, axiom in results:
+                    self._insert(coords, fitness, axiom)
+                self.evaluations += n
+                self.coverage_curve.append({
+                    "evaluations": self.evaluations,
+                    "filled_cells": len(self.archive),
+                    "coverage": len(self.archive) / self.n ** 5,
+                    "qd_score": sum(e["fitness"] for e in self.archive.values()),
+                    "best_fitness": max(e["fitness"] for e in self.archive.values()),
+                })
+        finally:
+            if pools is not None:
+                for pool in pools:
+                    pool.shutdown()
+                tables.unlink()
+        return self.export()
+
+    def export(self) -> Dict[str, Any]:
+        elites = sorted(self.archive.values(), key=lambda e: e["cell"])
+        return {
+            "objective": self.objective,
+            "cells_per_axis": self.n,
+            "evaluations": self.evaluations,
+            "elites": elites,
+            "coverage_curve": self.coverage_curve,
+        }
+
+# ============================================================================
+# SOPHIA-POINT SEARCH (CMA-ES over coordinates, seed weight and framework)
+# ============================================================================
+
+class SophiaSearch:
+    """
+    Derivative-free search that maximizes sophia_score instead of waiting
+    for Sophia points to turn up during generation or exploration.
+
+    Continuous variables (the 5 coordinates, plus seed_weight when a concept
+    seed is given) are scaled to the unit cube and driven by CMA-ES; the
+    framework is a categorical variable whose sampling distribution is pulled
+    towards the frameworks of each generation's best candidates. Every
+    generation is one batch of `population` evaluations.
+    """
+
+    def __init__(self, engine: 'MetaOntologyEngine', concept_seed: Optional[str] = None,
+                 seed_context: Optional[Dict] = None, population: int = 16, sigma: float = 0.3,
+                 framework_rate: float = 0.3, threshold: Optional[float] = None,
+                 workers: int = 1, enable_relativity: bool = True, seed: int = 0):
+        self.engine = engine
+        self.concept_seed = concept_seed
+        self.seed_context = seed_context
+        self.threshold = SophiaPhaseTransition().sophia_threshold if threshold is None else threshold
+        self.workers = workers
+        self.enable_relativity = enable_relativity
+        self.seed = seed
+        self.low, self.high = OntologyCoordinates.bounds()
+        self.frameworks = list(HybridFrameworkGenerator.current().keys()) + ["HYBRID"]
+        self.framework_probs = np.full(len(self.frameworks), 1.0 / len(self.frameworks))
+        self.framework_rate = framework_rate
+
+        n = self.dim = 6 if concept_seed else 5
+        self.lam = max(population, 4)
+        self.mu = self.lam // 2
+        w = np.log(self.mu + 0.5) - np.log(np.arange(1, self.mu + 1))
+        self.weights = w / w.sum()
+        self.mueff = 1.0 / np.sum(self.weights ** 2)
+        self.cc = (4 + self.mueff / n) / (n + 4 + 2 * self.mueff / n)
+        self.cs = (self.mueff + 2) / (n + self.mueff + 5)
+        self.c1 = 2 / ((n + 1.3) ** 2 + self.mueff)
+        self.cmu = min(1 - self.c1, 2 * (self.mueff - 2 + 1 / self.mueff) / ((n + 2) ** 2 + self.mueff))
+        self.damps = 1 + 2 * max(0.0, math.sqrt((self.mueff - 1) / (n + 1)) - 1) + self.cs
+        self.chi_n = math.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n ** 2))
+        self.mean = np.full(n, 0.5)
+        self.sigma = sigma
+        self.C = np.eye(n)
+        self.pc = np.zeros(n)
+        self.ps = np.zeros(n)
+        self.generation = 0
+
+        self.evaluations = 0
+        self.evaluations_to_first_sophia: Optional[int] = None
+        self.best: Optional[Dict[str, Any]] = None
+        self.history: List[Dict[str, float]] = []
+
+    def _decode(self, x: np.ndarray, framework: str) -> Tuple[Tuple[float, ...], Dict[str, Any]]:
+        coords = tuple(float(v) for v in self.low + x[:5] * (self.high - self.low))
+        kwargs = {"framework_name": framework, "concept_seed": self.concept_seed,
+                  "seed_context": self.seed_context}
+        if self.concept_seed:
+            kwargs["seed_weight"] = float(x[5])
+        return coords, kwargs
+
+    def _record(self, score: float, axiom: Dict[str, Any], x: np.ndarray, framework: str):
+        self.evaluations += 1
+        if self.evaluations_to_first_sophia is None and score >= self.threshold:
+            self.evaluations_to_first_sophia = self.evaluations
+        if self.best is None or score > self.best["sophia_score"]:
+            coords, kwargs = self._decode(x, framework)
+            self.best = {"sophia_score": score, "coordinates": coords, "framework": framework,
+                         "seed_weight": kwargs.get("seed_weight"), "evaluation": self.evaluations,
+                         "axiom": axiom}
+
+    def _tell(self, y: np.ndarray, scores: np.ndarray, frameworks: List[str]):
+        """Standard (mu/mu_w, lambda)-CMA-ES update, maximizing `scores`."""
+        n = self.dim
+        order = np.argsort(-scores)[:self.mu]
+        eigvals, B = np.linalg.eigh(self.C)
+        D = np.sqrt(np.maximum(eigvals, 1e-20))
+        inv_sqrt_C = B @ np.diag(1 / D) @ B.T
+
+        yw = self.weights @ y[order]
+        self.mean = self.mean + self.sigma * yw
+        self.generation += 1
+        self.ps = (1 - self.cs) * self.ps + math.sqrt(self.cs * (2 - self.cs) * self.mueff) * (inv_sqrt_C @ yw)
+        ps_norm = np.linalg.norm(self.ps)
+        hsig = ps_norm / math.sqrt(1 - (1 - self.cs) ** (2 * self.generation)) / self.chi_n < 1.4 + 2 / (n + 1)
+        self.pc = (1 - self.cc) * self.pc + hsig * math.sqrt(self.cc * (2 - self.cc) * self.mueff) * yw
+        rank_mu = (y[order].T * self.weights) @ y[order]
+        self.C = ((1 - self.c1 - self.cmu) * self.C
+                  + self.c1 * (np.outer(self.pc, self.pc) + (1 - hsig) * self.cc * (2 - self.cc) * self.C)
+                  + self.cmu * rank_mu)
+        self.C = (self.C + self.C.T) / 2
+        self.sigma *= math.exp((self.cs / self.damps) * (ps_norm / self.chi_n - 1))
+        self.sigma = min(self.sigma, 1.0)
+
+        selected = np.zeros(len(self.frameworks))
+        for i, wi in zip(order, self.weights):
+            selected[self.frameworks.index(frameworks[i])] += wi
+        probs = (1 - self.framework_rate) * self.framework_probs + self.framework_rate * selected
+        # Keep every framework reachable so the search can still switch families
+        probs = np.maximum(probs, 0.1 / len(self.frameworks))
+        self.framework_probs = probs / probs.sum()
+
+    def run(self, budget: int = 500, stop_at_sophia: bool = False) -> Dict[str, Any]:
+        """Spend up to `budget` evaluations in batches of `population`."""
+        pools = tables = None
+        if self.workers > 1:
+            pools, tables = _open_search_pool(self.engine, self.workers, self.seed)
+        try:
+            while self.evaluations < budget:
+                lam = min(self.lam, budget - self.evaluations)
+                eigvals, B = np.linalg.eigh(self.C)
+                BD = B * np.sqrt(np.maximum(eigvals, 1e-20))
+                z = np.random.normal(size=(lam, self.dim))
+                # Clip to the box and update from the clipped step, so the mean stays feasible
+                x = np.clip(self.mean + self.sigma * (z @ BD.T), 0.0, 1.0)
+                y = (x - self.mean) / self.sigma
+                frameworks = [self.frameworks[i] for i in
+                              np.random.choice(len(self.frameworks), size=lam, p=self.framework_probs)]
+                batch = [self._decode(xi, fw) for xi, fw in zip(x, frameworks)]
+                results = _evaluate_batch(self.engine, pools, batch,
+                                          "sophia_score", self.enable_relativity)
+                scores = np.array([score for _, score, _ in results])
+                for xi, fw, (_, score, axiom) in zip(x, frameworks, results):
+                    self._record(score, axiom, xi, fw)
+                self.history.append({"evaluations": self.evaluations, "best_score": self.best["sophia_score"],
+                                     "batch_mean": float(scores.mean()), "sigma": self.sigma})
+                if lam == self.lam:
+                    self._tell(y, scores, frameworks)
+                if stop_at_sophia and self.evaluations_to_first_sophia is not None:
+                    break
+        finally:
+            if pools is not None:
+                for pool in pools:
+                    pool.shutdown()
+                tables.unlink()
+        return self.export()
+
+    def random_baseline(self, budget: int) -> Dict[str, Any]:
+        """Plain generate_meta_axiom calls at random coordinates, for comparison."""
+        first, best = None, -math.inf
+        for i in range(budget):
+            axiom = self.engine.generate_meta_axiom(concept_seed=self.concept_seed, seed_context=self.seed_context,
+                                                    enable_relativity=self.enable_relativity)
+            score = axiom["meta_ontology"]["sophia_score"]
+            best = max(best, score)
+            if first is None and score >= self.threshold:
+                first = i + 1
+        return {"evaluations": budget, "evaluations_to_first_sophia": first, "best_score": best}
+
+    def export(self) -> Dict[str, Any]:
+        return {
+            "threshold": self.threshold,
+            "evaluations": self.evaluations,
+            "evaluations_to_first_sophia": self.evaluations_to_first_sophia,
+            "best": self.best,
+            "framework_probabilities": dict(zip(self.frameworks, self.framework_probs.tolist())),
+            "history": self.history,
+        }
+
+# ============================================================================
+# STREAMING STATISTICS (constant-memory aggregates over generation runs)
+# ============================================================================
+
+class RunningMoments:
+    """Count, mean, variance (Welford), min and max of a stream."""
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x: float):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        if not self.count:
+            return {"count": 0}
+        return {"count": self.count, "mean": self.mean, "std": math.sqrt(self.variance),
+                "min": self.min, "max": self.max}
+
+    def to_state(self) -> list:
+        return [self.count, self.mean, self.m2, self.min, self.max]
+
+    @classmethod
+    def from_state(cls, state: list) -> 'RunningMoments':
+        moments = cls()
+        moments.count, moments.mean, moments.m2, moments.min, moments.max = state
+        return moments
+
+class TDigest:
+    """
+    Merging t-digest (Dunning & Ertl) for streaming quantiles.
+
+    Points are buffered and periodically merged into at most ~compression
+    centroids using the arcsine scale function, so memory is bounded and
+    tail quantiles stay accurate.
+    """
+
+    def __init__(self, compression: float = 100.0, buffer_size: int = 500):
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.means = np.zeros(0)
+        self.weights = np.zeros(0)
+        self._buffer: List[float] = []
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x: float):
+        self._buffer.append(x)
+        self.count += 1
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+        if len(self._buffer) >= self.buffer_size:
+            self._merge()
+
+    def _k(self, q: float) -> float:
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _k_inv(self, k: float) -> float:
+        return (math.sin(min(k * 2 * math.pi / self.compression, math.pi / 2)) + 1) / 2
+
+    def _merge(self):
+        if not self._buffer:
+            return
+        means = np.concatenate([self.means, self._buffer])
+        weights = np.concatenate([self.weights, np.ones(len(self._buffer))])
+        self._buffer = []
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        new_means, new_weights = [], []
+        cur_mean, cur_weight = means[0], weights[0]
+        done = 0.0
+        q_limit = self._k_inv(self._k(0.0) + 1)
+        for m, w in zip(means[1:], weights[1:]):
+            if (done + cur_weight + w) / total <= q_limit:
+                cur_weight += w
+                cur_mean += (m - cur_mean) * w / cur_weight
+            else:
+                new_means.append(cur_mean)
+                new_weights.append(cur_weight)
+                done += cur_weight
+                q_limit = self._k_inv(self._k(done / total) + 1)
+                cur_mean, cur_weight = m, w
+        new_means.append(cur_mean)
+        new_weights.append(cur_weight)
+        self.means = np.array(new_means)
+        self.weights = np.array(new_weights)
+
+    def quantile(self, q: float) -> float:
+        self._merge()
+        if self.count == 0:
+            return math.nan
+        # Centroid centres sit at the middle of their cumulative weight
+        centres = np.cumsum(self.weights) - self.weights / 2
+        xs = np.concatenate([[0.0], centres, [self.count]])
+        ys = np.concatenate([[self.min], self.means, [self.max]])
+        return float(np.interp(q * self.count, xs, ys))
+
+    def to_state(self) -> Dict[str, Any]:
+        return {"means": self.means.tolist(), "weights": self.weights.tolist(), "buffer": list(self._buffer),
+                "count": self.count, "min": self.min, "max": self.max}
+
+    def load_state(self, state: Dict[str, Any]) -> 'TDigest':
+        self.means = np.array(state["means"], dtype=float)
+        self.weights = np.array(state["weights"], dtype=float)
+        self._buffer = list(state["buffer"])
+        self.count, self.min, self.max = state["count"], state["min"], state["max"]
+        return self
+
+class StreamingHistogram:
+    """Fixed-bin histogram with underflow/overflow counts."""
+
+    def __init__(self, low: float, high: float, bins: int = 20):
+        self.edges = np.linspace(low, high, bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+
+    def add(self, x: float):
+        if x < self.edges[0]:
+            self.underflow += 1
+        elif x > self.edges[-1]:
+            self.overflow += 1
+        else:
+            i = min(int(np.searchsorted(self.edges, x, side="right")) - 1, len(self.counts) - 1)
+            self.counts[i] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        return {"edges": self.edges.tolist(), "counts": self.counts.tolist(),
+                "underflow": self.underflow, "overflow": self.overflow}
+
+    def load_state(self, state: Dict[str, Any]) -> 'StreamingHistogram':
+        self.counts = np.array(state["counts"], dtype=np.int64)
+        self.underflow, self.overflow = state["underflow"], state["overflow"]
+        return self
+
+class GenerationStatistics:
+    """
+    Per-axiom streaming aggregates for a generation run: moments, t-digest
+    quantiles and histograms of the main metrics, a per-framework breakdown
+    and Sophia hit rates overall and over sliding windows. Memory does not
+    grow with the number of axioms.
+    """
+
+    # metric -> histogram range
+    METRICS = {
+        "novelty": (0.0, 1.0),
+        "elegance": (0.0, 100.0),
+        "coherence": (0.0, 1.0),
+        "ricci_scalar": (-500.0, 500.0),
+        "sophia_score": (-1.0, 1.0),
+    }
+    QUANTILES = (0.01, 0.1, 0.5, 0.9, 0.99)
+
+    def __init__(self, windows: Tuple[int, ...] = (100, 1000), bins: int = 20):
+        self.count = 0
+        self.moments = {m: RunningMoments() for m in self.METRICS}
+        self.digests = {m: TDigest() for m in self.METRICS}
+        self.histograms = {m: StreamingHistogram(lo, hi, bins) for m, (lo, hi) in self.METRICS.items()}
+        self.frameworks: Dict[str, Dict[str, Any]] = {}
+        self.sophia_hits = 0
+        self.windows = {w: deque(maxlen=w) for w in windows}
+        self._window_hits = {w: 0 for w in windows}
+
+    @staticmethod
+    def _values(axiom: Dict[str, Any]) -> Dict[str, float]:
+        metrics = axiom.get("metrics") or {}
+        values = {m: metrics[m] for m in ("novelty", "elegance", "coherence", "ricci_scalar") if m in metrics}
+        meta = axiom.get("meta_ontology") or {}
+        if "sophia_score" in meta:
+            values["sophia_score"] = meta["sophia_score"]
+        return {m: float(v) for m, v in values.items() if v is not None}
+
+    def update(self, axiom: Dict[str, Any]):
+        self.count += 1
+        values = self._values(axiom)
+        for m, v in values.items():
+            self.moments[m].add(v)
+            self.digests[m].add(v)
+            self.histograms[m].add(v)
+
+        ontology = axiom.get("ontology") or {}
+        is_sophia = bool(ontology.get("sophia_point") or (axiom.get("meta_ontology") or {}).get("phase_transition"))
+        self.sophia_hits += is_sophia
+        for w, window in self.windows.items():
+            if len(window) == w:
+                self._window_hits[w] -= window[0]
+            window.append(is_sophia)
+            self._window_hits[w] += is_sophia
+
+        name = ontology.get("framework_family") or ontology.get("name") or "UNKNOWN"
+        fw = self.frameworks.get(name)
+        if fw is None:
+            fw = self.frameworks[name] = {"count": 0, "sophia": 0,
+                                          "moments": {m: RunningMoments() for m in self.METRICS}}
+        fw["count"] += 1
+        fw["sophia"] += is_sophia
+        for m, v in values.items():
+            fw["moments"][m].add(v)
+
+    def summary(self, histograms: bool = True) -> Dict[str, Any]:
+        metrics = {}
+        for m in self.METRICS:
+            entry = self.moments[m].summary()
+            if entry["count"]:
+                entry["quantiles"] = {f"p{int(q * 100):02d}": self.digests[m].quantile(q) for q in self.QUANTILES}
+                if histograms:
+                    entry["histogram"] = self.histograms[m].summary()
+            metrics[m] = entry
+        return {
+            "count": self.count,
+            "metrics": metrics,
+            "sophia_rate": dict({"overall": self.sophia_hits / self.count if self.count else 0.0},
+                                **{f"last_{w}": self._window_hits[w] / len(window) if window else 0.0
+                                   for w, window in self.windows.items()}),
+            "frameworks": {name: {"count": fw["count"],
+                                  "sophia_rate": fw["sophia"] / fw["count"],
+                                  "metrics": {m: mo.summary() for m, mo in fw["moments"].items() if mo.count}}
+                           for name, fw in sorted(self.frameworks.items(), key=lambda kv: -kv[1]["count"])},
+        }
+
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-serializable aggregate state (restored by load_state())."""
+        return {
+            "count": self.count,
+            "moments": {m: v.to_state() for m, v in self.moments.items()},
+            "digests": {m: d.to_state() for m, d in self.digests.items()},
+            "histograms": {m: h.summary() for m, h in self.histograms.items()},
+            "frameworks": {name: {"count": fw["count"], "sophia": fw["sophia"],
+                                  "moments": {m: v.to_state() for m, v in fw["moments"].items()}}
+                           for name, fw in self.frameworks.items()},
+            "sophia_hits": self.sophia_hits,
+            "windows": [[w, [bool(x) for x in window]] for w, window in self.windows.items()],
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> 'GenerationStatistics':
+        self.count = state["count"]
+        self.moments = {m: RunningMoments.from_state(v) for m, v in state["moments"].items()}
+        for m, d in state["digests"].items():
+            self.digests[m].load_state(d)
+        for m, h in state["histograms"].items():
+            self.histograms[m].load_state(h)
+        self.frameworks = {name: {"count": fw["count"], "sophia": fw["sophia"],
+                                  "moments": {m: RunningMoments.from_state(v) for m, v in fw["moments"].items()}}
+                           for name, fw in state["frameworks"].items()}
+        self.sophia_hits = state["sophia_hits"]
+        self.windows = {w: deque(window, maxlen=w) for w, window in state["windows"]}
+        self._window_hits = {w: sum(window) for w, window in self.windows.items()}
+        return self
+
+    def format_summary(self) -> str:
+        """Compact multi-line report for the CLI session summary."""
+        s = self.summary(histograms=False)
+        lines = [f"Distribution over {s['count']} axioms:"]
+        for m, e in s["metrics"].items():
+            if e["count"]:
+                q = e["quantiles"]
+                lines.append(f"  {m:<13} mean {e['mean']:9.3f} ± {e['std']:8.3f}   "
+                             f"p10 {q['p10']:9.3f}  p50 {q['p50']:9.3f}  p90 {q['p90']:9.3f}  p99 {q['p99']:9.3f}")
+        lines.append("  Sophia rate   " + "  ".join(f"{k} {v * 100:.1f}%" for k, v in s["sophia_rate"].items()))
+        for name, fw in list(s["frameworks"].items())[:8]:
+            elegance = fw["metrics"].get("elegance", {}).get("mean")
+            lines.append(f"  {name:<28} {fw['count']:6d} axioms  Sophia {fw['sophia_rate'] * 100:5.1f}%"
+                         + (f"  elegance {elegance:6.2f}" if elegance is not None else ""))
+        return "\n".join(lines)
+
 # ============================================================================
 # ENHANCED HYBRID FORGE v5.0 (unified interface)
 # ============================================================================
 
 class MetaAxiomForge:
+    STATE_FORMAT = "sillyaxioms-state"
+    STATE_VERSION = 1
+
     def __init__(self, data_root: str = "."):
         self.data_root = Path(data_root)
         self.meta_engine = MetaOntologyEngine(data_root)
@@ -1635,6 +4034,7 @@ class MetaAxiomForge:
             "dynamic_frameworks_created": 0
         }
         self.current_coordinates = OntologyCoordinates(0.5, 0.5, 0.5, 0.5, 0.5)
+        self.distributions = GenerationStatistics()
 
     def generate(self,
                  mode: str = "hybrid",
@@ -1645,8 +4045,33 @@ class MetaAxiomForge:
                  concept_seed: Optional[str] = None,
                  enable_relativity: bool = True,
                  seed_weight: float = 0.5,
-                 diversity_threshold: float = 0.7) -> List[Dict[str, Any]]:
-        results = []
+                 diversity_threshold: float = 0.7,
+                 deadline_ms: Optional[float] = None,
+                 fields: Optional[List[str]] = None,
+                 as_record: bool = False) -> List[Dict[str, Any]]:
+        return list(self.iter_generate(mode, count, target_quadrant, explore_sophia, legacy_params,
+                                       concept_seed, enable_relativity, seed_weight,
+                                       diversity_threshold, deadline_ms, fields, as_record))
+
+    def iter_generate(self,
+                      mode: str = "hybrid",
+                      count: int = 1,
+                      target_quadrant: Optional[str] = None,
+                      explore_sophia: bool = False,
+                      legacy_params: Optional[Dict] = None,
+                      concept_seed: Optional[str] = None,
+                      enable_relativity: bool = True,
+                      seed_weight: float = 0.5,
+                      diversity_threshold: float = 0.7,
+                      deadline_ms: Optional[float] = None,
+                      fields: Optional[List[str]] = None,
+                      as_record: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Same as generate(), but yields each axiom as soon as it is produced.
+        deadline_ms bounds each meta axiom (see MetaOntologyEngine.generate_meta_axiom);
+        fields limits each result to those (optionally dotted) keys; as_record
+        yields compact AxiomRecords for callers that keep many results in memory.
+        """
         seed_context = None
         if concept_seed and isinstance(concept_seed, str) and concept_seed.strip():
             seed_context = self.seed_processor.process_text_seed(concept_seed)
@@ -1655,6 +4080,7 @@ class MetaAxiomForge:
             np.random.seed(seed_context["seed_hash"] % (2**32))
 
         for _ in range(count):
+            started = time.perf_counter()
             if mode == "meta" or (mode == "hybrid" and random.random() < 0.7):
                 target_coords = None
                 if target_quadrant and target_quadrant != "random":
@@ -1672,13 +4098,17 @@ class MetaAxiomForge:
                 if explore_sophia:
                     hybrid = self.sophia.generate_hybrid_framework(seed_context, enable_relativity)
                     coords_obj = OntologyCoordinates(*hybrid["coordinates"])
+                    remaining_ms = None
+                    if deadline_ms is not None:
+                        remaining_ms = deadline_ms - (time.perf_counter() - started) * 1000.0
                     axiom = self.meta_engine.generate_meta_axiom(
                         target_coords=coords_obj,
                         concept_seed=concept_seed,
                         seed_context=seed_context,
                         enable_relativity=enable_relativity,
                         seed_weight=seed_weight,
-                        diversity_threshold=diversity_threshold
+                        diversity_threshold=diversity_threshold,
+                        deadline_ms=remaining_ms
                     )
                     # Override with hybrid details if not already
                     if hybrid["name"] not in axiom["ontology"]["name"]:
@@ -1694,7 +4124,8 @@ class MetaAxiomForge:
                         seed_context=seed_context,
                         enable_relativity=enable_relativity,
                         seed_weight=seed_weight,
-                        diversity_threshold=diversity_threshold
+                        diversity_threshold=diversity_threshold,
+                        deadline_ms=deadline_ms
                     )
                 self.generation_stats["meta"] += 1
                 self.generation_stats["new_frameworks"] += 1
@@ -1723,30 +4154,98 @@ class MetaAxiomForge:
                 axiom["ontology"]["is_new"] = ontology_name == "meta" or axiom["ontology"].get("is_new", False)
                 self.generation_stats["legacy"][ontology_name] += 1
             self.generation_stats["total"] += 1
-            results.append(axiom)
-
-        # Update dynamic frameworks count
-        self.generation_stats["dynamic_frameworks_created"] = self.meta_engine.stats["dynamic_frameworks_created"]
-        return results
+            # Update dynamic frameworks count
+            self.generation_stats["dynamic_frameworks_created"] = self.meta_engine.stats["dynamic_frameworks_created"]
+            self.distributions.update(axiom)
+            if fields is not None:
+                axiom = project_fields(axiom, fields)
+            yield AxiomRecord.from_dict(axiom) if as_record else axiom
 
     def explore_phase_space(self, steps: int = 50, seed_text: Optional[str] = None,
                             enable_relativity: bool = True,
                             seed_weight: float = 0.3,
-                            diversity_threshold: float = 0.7) -> List[Dict[str, Any]]:
+                            diversity_threshold: float = 0.7,
+                            checkpoint_path: Optional[Union[str, Path]] = None,
+                            checkpoint_every: int = 1000,
+                            resume: bool = False) -> List[Dict[str, Any]]:
         return self.meta_engine.explore_phase_space(steps, seed_text, enable_relativity,
-                                                     seed_weight, diversity_threshold)
+                                                     seed_weight, diversity_threshold,
+                                                     checkpoint_path, checkpoint_every, resume)
+
+    def iter_phase_space(self, steps: int = 50, seed_text: Optional[str] = None,
+                         enable_relativity: bool = True,
+                         seed_weight: float = 0.3,
+                         diversity_threshold: float = 0.7,
+                         checkpoint_path: Optional[Union[str, Path]] = None,
+                         checkpoint_every: int = 1000,
+                         resume: bool = False,
+                         coord_store: Optional['CoordinateStore'] = None) -> Iterator[Dict[str, Any]]:
+        return self.meta_engine.iter_phase_space(steps, seed_text, enable_relativity,
+                                                 seed_weight, diversity_threshold,
+                                                 checkpoint_path, checkpoint_every, resume,
+                                                 coord_store)
+
+    def explore_ensemble(self, walkers: int = 1000, steps: int = 50,
+                         start: Optional[Tuple[float, ...]] = None,
+                         enable_relativity: bool = True,
+                         materialize_steps: Optional[List[int]] = None,
+                         materialize_walkers: int = 0,
+                         seed_text: Optional[str] = None,
+                         seed_weight: float = 0.3,
+                         diversity_threshold: float = 0.7,
+                         record_every: int = 1,
+                         repulsion: bool = True) -> Dict[str, Any]:
+        return self.meta_engine.explore_ensemble(walkers, steps, start, enable_relativity,
+                                                 materialize_steps, materialize_walkers,
+                                                 seed_text, seed_weight, diversity_threshold,
+                                                 record_every, repulsion)
+
+    def map_elites(self, budget: int = 1000, cells_per_axis: int = 5,
+                   objective: str = "elegance", init_samples: int = 100,
+                   mutation_sigma: float = 0.1, batch_size: int = 32,
+                   workers: int = 1, enable_relativity: bool = True,
+                   seed: int = 0) -> Dict[str, Any]:
+        search = MapElitesSearch(self.meta_engine, cells_per_axis, objective, init_samples,
+                                 mutation_sigma, batch_size, workers, enable_relativity, seed)
+        return search.run(budget)
+
+    def sophia_search(self, budget: int = 500, concept_seed: Optional[str] = None,
+                      population: int = 16, sigma: float = 0.3, threshold: Optional[float] = None,
+                      workers: int = 1, enable_relativity: bool = True, stop_at_sophia: bool = False,
+                      compare_random: bool = False, seed: int = 0) -> Dict[str, Any]:
+        seed_context = None
+        if concept_seed and concept_seed.strip():
+            seed_context = self.seed_processor.process_text_seed(concept_seed)
+        search = SophiaSearch(self.meta_engine, concept_seed, seed_context, population, sigma,
+                              threshold=threshold, workers=workers,
+                              enable_relativity=enable_relativity, seed=seed)
+        result = search.run(budget, stop_at_sophia)
+        if compare_random:
+            result["random_baseline"] = search.random_baseline(budget)
+        return result
 
     def simulate_framework_evolution(self, framework_name: str, steps: int = 100,
                                      dt: float = 0.005) -> Dict[str, Any]:
         return self.meta_engine.simulate_framework_evolution(framework_name, steps, dt)
 
+    def simulate_ensemble_evolution(self, steps: int = 100, dt: float = 0.005,
+                                    interaction: float = 0.0,
+                                    interaction_range: float = 0.25) -> Dict[str, Any]:
+        return self.meta_engine.simulate_ensemble_evolution(steps, dt, interaction, interaction_range)
+
     def explore_geodesic(self, start_coords: Tuple[float, ...], end_coords: Tuple[float, ...],
                          steps: int = 20, plot: bool = False,
                          seed_text: Optional[str] = None,
                          seed_weight: float = 0.2,
-                         diversity_threshold: float = 0.7) -> List[Dict[str, Any]]:
+                         diversity_threshold: float = 0.7,
+                         mode: str = "shooting") -> List[Dict[str, Any]]:
         return self.meta_engine.explore_geodesic(start_coords, end_coords, steps, plot,
-                                                  seed_text, seed_weight, diversity_threshold)
+                                                  seed_text, seed_weight, diversity_threshold, mode)
+
+    def geodesic_paths(self, pairs: List[Tuple[Tuple[float, ...], Tuple[float, ...]]],
+                       steps: int = 20, workers: int = 1,
+                       mode: str = "shooting") -> List[List[Tuple[float, ...]]]:
+        return self.meta_engine.geodesic_paths(pairs, steps, workers, mode)
 
     def get_framework_summary(self, framework_name: str) -> Dict[str, Any]:
         return self.meta_engine.get_framework_summary(framework_name)
@@ -1755,6 +4254,78 @@ class MetaAxiomForge:
                            dt: float = 0.005) -> List[Tuple[float, ...]]:
         return self.meta_engine.compute_ricci_flow(coordinates, iterations, dt)
 
+    def save_state(self, path: Union[str, Path]):
+        """
+        Save what a restarted forge needs to carry on where this one stopped:
+        - fingerprint history and phase-mode counters
+        - session stats and streaming distributions
+        - Python and NumPy RNG state
+        - dynamic frameworks, for restarts whose files don't have them
+        The file is a compressed npz. RNG keys are binary arrays; everything
+        else is a single JSON blob. It is written atomically.
+        """
+        engine = self.meta_engine._engine_state()
+        random_version, random_internal, random_gauss = engine.pop("random_state")
+        np_name, np_keys, np_pos, np_has_gauss, np_cached = engine.pop("numpy_random_state")
+        engine.pop("attractor")
+        base_names = HybridFrameworkGenerator.get_base_framework_names(self.data_root)
+        engine["frameworks"] = {name: fw for name, fw in engine["frameworks"].items() if name not in base_names}
+        meta = {
+            "format": self.STATE_FORMAT,
+            "version": self.STATE_VERSION,
+            "engine": engine,
+            "random": [random_version, random_gauss],
+            "numpy_random": [np_name, np_pos, np_has_gauss, np_cached],
+            "generation_stats": convert_to_serializable(self.generation_stats),
+            "current_coordinates": list(self.current_coordinates.to_tuple()),
+            "distributions": self.distributions.to_state(),
+        }
+        arrays = {
+            "meta": np.frombuffer(json.dumps(meta, ensure_ascii=False).encode("utf-8"), dtype=np.uint8),
+            "random_state": np.array(random_internal, dtype=np.uint32),
+            "numpy_random_state": np.array(np_keys, dtype=np.uint32),
+        }
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, 'wb') as f:
+            np.savez_compressed(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def load_state(self, path: Union[str, Path]):
+        """
+        Restore the session saved by save_state(); the next axiom continues it.
+        Framework definitions stay as loaded from disk: saved dynamic
+        frameworks are only added if the registry lacks them, and the
+        attractor is recomputed from the result.
+        """
+        with np.load(path, allow_pickle=False) as npz:
+            meta = json.loads(npz["meta"].tobytes().decode("utf-8"))
+            random_internal = npz["random_state"].tolist()
+            np_keys = npz["numpy_random_state"]
+        if meta.get("format") != self.STATE_FORMAT:
+            raise ValueError(f"{path} is not a forge state file")
+        if meta.get("version") != self.STATE_VERSION:
+            raise ValueError(f"Unsupported forge state version {meta.get('version')}")
+        engine = meta["engine"]
+        saved_frameworks = engine.pop("frameworks", {})
+        engine["random_state"] = [meta["random"][0], random_internal, meta["random"][1]]
+        np_name, np_pos, np_has_gauss, np_cached = meta["numpy_random"]
+        engine["numpy_random_state"] = [np_name, np_keys, np_pos, np_has_gauss, np_cached]
+        self.meta_engine._restore_engine_state(engine)
+        registry = HybridFrameworkGenerator.current()
+        base_names = HybridFrameworkGenerator.get_base_framework_names(self.data_root)
+        missing = {name: fw for name, fw in saved_frameworks.items()
+                   if name not in registry and name not in base_names}
+        if missing:
+            registry = HybridFrameworkGenerator.publish(missing, merge=True)
+        if len(registry):
+            self.meta_engine.field_sim.set_attractor(tuple(np.mean(registry.coordinates, axis=0)))
+        self.generation_stats = meta["generation_stats"]
+        self.current_coordinates = OntologyCoordinates(*meta["current_coordinates"])
+        self.distributions.load_state(meta["distributions"])
+
     def get_stats(self) -> Dict[str, Any]:
         stats = self.generation_stats.copy()
         if stats["total"] > 0:
@@ -1768,6 +4339,7 @@ class MetaAxiomForge:
             }
             legacy_counts = stats["legacy"]
             stats["most_productive_legacy"] = max(legacy_counts.items(), key=lambda x: x[1])[0]
+            stats["distributions"] = self.distributions.summary()
         return stats
 
 # ============================================================================
@@ -1777,6 +4349,8 @@ class MetaAxiomForge:
 def convert_to_serializable(obj: Any) -> Any:
     if isinstance(obj, OntologyCoordinates):
         return obj.to_tuple()
+    elif isinstance(obj, AxiomRecord):
+        return convert_to_serializable(obj.to_dict())
     elif isinstance(obj, dict):
         return {k: convert_to_serializable(v) for k, v in obj.items()}
     elif isinstance(obj, list):
@@ -1795,60 +4369,1052 @@ def convert_to_serializable(obj: Any) -> Any:
     else:
         return obj
 
-def write_output_files(results: List[Dict[str, Any]], output_format: str, base_filename: str = "axioms", is_trajectory: bool = False):
-    output_dir = Path("./output")
-    output_dir.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    serializable_results = convert_to_serializable(results)
-
-    if output_format in ("json", "both"):
-        json_filename = output_dir / f"{base_filename}_{timestamp}.json"
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(serializable_results, f, indent=2, ensure_ascii=False)
-        logger.info(f"JSON output written to: {json_filename}")
-
-    if output_format in ("text", "both"):
-        text_filename = output_dir / f"{base_filename}_{timestamp}.txt"
-        with open(text_filename, 'w', encoding='utf-8') as f:
-            if is_trajectory:
-                f.write("Ontological Phase Space Exploration Trajectory\n")
-                f.write("=" * 60 + "\n\n")
-                for step in results:
-                    f.write(f"Step {step['step']:3d}:\n")
-                    f.write(f"  Coordinates: {step['coordinates']}\n")
-                    f.write(f"  Framework: {step['framework']}\n")
-                    f.write(f"  Axiom: {step['axiom']}\n")
-                    if step.get('is_sophia'):
-                        f.write("  ✨ SOPHIA POINT (phase transition)\n")
-                    f.write(f"  Coherence: {step.get('coherence', 0):.3f}\n")
-                    f.write(f"  Curvature: {step.get('curvature', 0):.3f}\n\n")
-                sophia_points = sum(1 for step in results if step.get('is_sophia'))
-                avg_coherence = np.mean([step.get('coherence', 0) for step in results])
-                avg_curvature = np.mean([step.get('curvature', 0) for step in results])
-                f.write("\n" + "=" * 60 + "\n")
-                f.write(f"Exploration Summary:\n")
-                f.write(f"  Total steps: {len(results)}\n")
-                f.write(f"  Sophia points: {sophia_points}\n")
-                f.write(f"  Average coherence: {avg_coherence:.3f}\n")
-                f.write(f"  Average curvature: {avg_curvature:.3f}\n")
+def _format_text_record(record: Dict[str, Any], index: int, is_trajectory: bool) -> str:
+    """Render one result the way the text output files always have."""
+    lines = []
+    if is_trajectory:
+        lines.append(f"Step {record['step']:3d}:\n")
+        lines.append(f"  Coordinates: {record['coordinates']}\n")
+        lines.append(f"  Framework: {record['framework']}\n")
+        lines.append(f"  Axiom: {record['axiom']}\n")
+        if record.get('is_sophia'):
+            lines.append("  ✨ SOPHIA POINT (phase transition)\n")
+        lines.append(f"  Coherence: {record.get('coherence', 0):.3f}\n")
+        lines.append(f"  Curvature: {record.get('curvature', 0):.3f}\n\n")
+    else:
+        lines.append(f"=== Axiom {index} ===\n")
+        lines.append(f"{record['axiom_text']}\n\n")
+        if record['ontology'].get('is_new'):
+            lines.append(f"[NEW ONTOLOGY: {record['ontology']['name']}]\n")
+        if record.get('seed_context'):
+            lines.append(f"[Seed-influenced generation]\n")
+        if record.get('meta_ontology', {}).get('curvature_data'):
+            lines.append(f"[Relativistic framework]\n")
+        if 'metrics' in record:
+            lines.append(f"\n📊 Metrics:\n")
+            for key, value in list(record['metrics'].items())[:5]:
+                lines.append(f"  {key}: {value}\n")
+        if 'meta_ontology' in record and record['meta_ontology'].get('curvature_data'):
+            lines.append(f"\n🎭 Ricci scalar: {record['meta_ontology']['curvature_data'].get('ricci_scalar', 'N/A')}\n")
+        lines.append("\n" + "="*40 + "\n\n")
+    return "".join(lines)
+
+class CompactArchiveEncoder:
+    """
+    Encode results for the compact JSON layout.
+
+    Each distinct seed_context is stored once in a side table and referenced
+    from its axioms by "seed_ref" (the seed_hash, suffixed if the same seed
+    produced a different context). Repeated core statement, mechanism,
+    equation, consequence and framework strings are interned into a string
+    pool and replaced by their index. expand_compact_archive() reverses the encoding exactly.
+    """
+
+    FORMAT = "sillyaxioms-compact"
+    VERSION = 1
+    # (parent key or None, field, is_list)
+    INTERNED_FIELDS = [
+        (None, "core_statement", False),
+        (None, "seed_concept", False),
+        (None, "axiom", False),
+        (None, "mechanisms", True),
+        (None, "consequences", True),
+        (None, "equations", True),
+        (None, "framework", False),
+        ("ontology", "type", False),
+        ("ontology", "name", False),
+        ("ontology", "framework_family", False),
+    ]
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self.seed_contexts: Dict[str, Dict[str, Any]] = {}
+        self._seed_keys: Dict[str, str] = {}
+
+    def _intern(self, value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        idx = self._string_ids.get(value)
+        if idx is None:
+            idx = len(self.strings)
+            self._string_ids[value] = idx
+            self.strings.append(value)
+        return idx
+
+    def _seed_ref(self, ctx: Dict[str, Any]) -> str:
+        canonical = json.dumps(ctx, sort_keys=True, ensure_ascii=False)
+        key = self._seed_keys.get(canonical)
+        if key is None:
+            base = str(ctx.get("seed_hash", len(self.seed_contexts)))
+            key, n = base, 1
+            while key in self.seed_contexts:
+                key = f"{base}-{n}"
+                n += 1
+            self._seed_keys[canonical] = key
+            self.seed_contexts[key] = ctx
+        return key
+
+    def encode(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Encode one already-serializable record."""
+        out = dict(record)
+        if isinstance(out.get("seed_context"), dict):
+            out["seed_ref"] = self._seed_ref(out.pop("seed_context"))
+        for parent, key, is_list in self.INTERNED_FIELDS:
+            if parent is None:
+                target = out
+            elif isinstance(out.get(parent), dict):
+                target = out[parent] = dict(out[parent])
+            else:
+                continue
+            if key not in target:
+                continue
+            if is_list and isinstance(target[key], list):
+                target[key] = [self._intern(v) for v in target[key]]
+            elif not is_list:
+                target[key] = self._intern(target[key])
+        return out
+
+    def header(self) -> Dict[str, Any]:
+        return {"format": self.FORMAT, "version": self.VERSION}
+
+    def tables(self) -> Dict[str, Any]:
+        return {"seed_contexts": self.seed_contexts, "strings": self.strings}
+
+def expand_compact_archive(doc: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Turn a compact-layout document back into the full list of result dicts."""
+    strings = doc.get("strings", [])
+    seed_contexts = doc.get("seed_contexts", {})
+
+    def lookup(v):
+        return strings[v] if isinstance(v, int) and not isinstance(v, bool) else v
+
+    results = []
+    for rec in doc.get("axioms", []):
+        rec = dict(rec)
+        for parent, key, is_list in CompactArchiveEncoder.INTERNED_FIELDS:
+            if parent is None:
+                target = rec
+            elif isinstance(rec.get(parent), dict):
+                target = rec[parent] = dict(rec[parent])
+            else:
+                continue
+            if key not in target:
+                continue
+            if is_list and isinstance(target[key], list):
+                target[key] = [lookup(v) for v in target[key]]
+            elif not is_list:
+                target[key] = lookup(target[key])
+        if "seed_ref" in rec:
+            rec["seed_context"] = seed_contexts[rec.pop("seed_ref")]
+        results.append(rec)
+    return results
+
+def load_axiom_archive(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Load a JSON output file (plain, .gz or .xz; full or compact layout) as result dicts."""
+    path = Path(path)
+    opener = {".gz": gzip.open, ".xz": lzma.open}.get(path.suffix, open)
+    with opener(path, 'rt', encoding='utf-8') as f:
+        doc = json.load(f)
+    if isinstance(doc, dict) and doc.get("format") == CompactArchiveEncoder.FORMAT:
+        return expand_compact_archive(doc)
+    return doc
+
+# "<base>_<YYYYmmdd_HHMMSS>" (older releases) or the streaming writer's
+# "<base>_<timestamp_us>_<pid>_<n>[_partNNNN][-k]", then .json[.gz|.xz]
+OUTPUT_FILE_PATTERN = re.compile(r"_\d{8}_\d{6}(?:_\d{6}_\d+_\d+)?(?:_part\d{4})?(?:-\d+)?\.json(?:\.gz|\.xz)?$")
+
+def find_output_files(directory: Union[str, Path]) -> List[Path]:
+    """JSON output files under `directory`, skipping checkpoints, tables and other JSON data."""
+    return sorted(p for p in Path(directory).rglob("*.json*")
+                  if p.is_file() and OUTPUT_FILE_PATTERN.search(p.name))
+
+class _ColumnBuffer:
+    """Per-part column accumulator for npz output (typed arrays, dictionary-encoded strings)."""
+
+    STRING_COLUMNS = ("framework", "axiom")
+
+    def __init__(self):
+        self.step = array("q")
+        self.walker = array("q")
+        self.coordinates = array("d")
+        self.curvature = array("d")
+        self.coherence = array("d")
+        self.is_sophia = array("b")
+        self.ids = {name: array("i") for name in self.STRING_COLUMNS}
+        self.dictionaries = {name: {} for name in self.STRING_COLUMNS}
+        self.has_walker = False
+
+    def append(self, record: Dict[str, Any]):
+        self.step.append(int(record.get("step", len(self.step))))
+        self.walker.append(int(record.get("walker", -1)))
+        self.has_walker = self.has_walker or "walker" in record
+        coords = record.get("coordinates")
+        if isinstance(coords, OntologyCoordinates):
+            coords = coords.to_tuple()
+        self.coordinates.extend(coords if coords is not None else (math.nan,) * 5)
+        self.curvature.append(float(record.get("curvature", math.nan)))
+        self.coherence.append(float(record.get("coherence", math.nan)))
+        self.is_sophia.append(bool(record.get("is_sophia", False)))
+        for name in self.STRING_COLUMNS:
+            value = record.get(name) or ""
+            dictionary = self.dictionaries[name]
+            self.ids[name].append(dictionary.setdefault(value, len(dictionary)))
+
+    def nbytes(self) -> int:
+        return len(self.step) * (8 * 9 + 1 + 4 * len(self.STRING_COLUMNS))
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        cols = {
+            "step": np.frombuffer(self.step, dtype=np.int64),
+            "coordinates": np.frombuffer(self.coordinates, dtype=np.float64).reshape(-1, 5),
+            "curvature": np.frombuffer(self.curvature, dtype=np.float64),
+            "coherence": np.frombuffer(self.coherence, dtype=np.float64),
+            "is_sophia": np.frombuffer(self.is_sophia, dtype=np.int8).astype(bool),
+        }
+        if self.has_walker:
+            cols["walker"] = np.frombuffer(self.walker, dtype=np.int64)
+        for name in self.STRING_COLUMNS:
+            cols.update(dictionary_encode(name, np.frombuffer(self.ids[name], dtype=np.int32),
+                                          list(self.dictionaries[name])))
+        return cols
+
+def dictionary_encode(name: str, ids: np.ndarray, values: List[str]) -> Dict[str, np.ndarray]:
+    """Arrow-style dictionary column: int32 ids plus UTF-8 dictionary data and int64 offsets."""
+    encoded = [v.encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(b) for b in encoded])
+    return {f"{name}_ids": np.asarray(ids, dtype=np.int32),
+            f"{name}_dict_offsets": offsets,
+            f"{name}_dict_data": np.frombuffer(b"".join(encoded), dtype=np.uint8)}
+
+def decode_dictionary(columns: Dict[str, np.ndarray], name: str) -> List[str]:
+    """Dictionary values of a string column written by dictionary_encode()."""
+    data = np.asarray(columns[f"{name}_dict_data"]).tobytes()
+    offsets = np.asarray(columns[f"{name}_dict_offsets"])
+    return [data[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(len(offsets) - 1)]
+
+def load_columnar_trajectory(path: Union[str, Path], mmap_mode: Optional[str] = "r") -> Dict[str, np.ndarray]:
+    """
+    Load an npz trajectory written with --outputfile npz.
+
+    Members of uncompressed files are memory-mapped in place (no parsing or
+    copying, regardless of length); compressed files, or mmap_mode=None,
+    fall back to np.load.
+    """
+    path = Path(path)
+    with zipfile.ZipFile(path) as zf:
+        infos = zf.infolist()
+    if mmap_mode is None or any(info.compress_type != zipfile.ZIP_STORED for info in infos):
+        with np.load(path) as npz:
+            return {name: npz[name] for name in npz.files}
+    columns = {}
+    with open(path, 'rb') as f:
+        for info in infos:
+            # Skip the local file header to reach the .npy payload
+            f.seek(info.header_offset)
+            header = f.read(30)
+            name_len, extra_len = struct.unpack("<HH", header[26:30])
+            f.seek(info.header_offset + 30 + name_len + extra_len)
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            name = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+            if int(np.prod(shape)) == 0:
+                columns[name] = np.zeros(shape, dtype=dtype)
+            else:
+                columns[name] = np.memmap(path, dtype=dtype, mode=mmap_mode, offset=f.tell(), shape=shape,
+                                          order='F' if fortran_order else 'C')
+    return columns
+
+def write_columnar_arrays(arrays: Dict[str, np.ndarray], base_filename: str,
+                          output_dir: Union[str, Path] = "./output", compressed: bool = False) -> Path:
+    """Write named arrays to a fresh .npz (uncompressed unless `compressed`, so it can be memory-mapped)."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = (f"{base_filename}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+            f"_{os.getpid()}_{next(StreamingOutputWriter._run_counter)}")
+    attempt = 0
+    while True:
+        path = output_dir / (f"{stem}.npz" if attempt == 0 else f"{stem}-{attempt}.npz")
+        try:
+            f = open(path, 'xb')
+            break
+        except FileExistsError:
+            attempt += 1
+    with f:
+        (np.savez_compressed if compressed else np.savez)(f, **arrays)
+    logger.info(f"Output written to: {path}")
+    return path
+
+class StreamingOutputWriter:
+    """
+    Stream results to ./output on a background thread.
+
+    Records are queued by write() and serialized by a worker thread, so the
+    generating thread never blocks on disk I/O and the full result set never
+    has to be held in memory. JSON files stay valid JSON arrays; text files
+    keep the legacy layout (trajectory files get a per-file summary).
+    With layout="compact", JSON parts use the CompactArchiveEncoder layout
+    (axioms first, then the seed-context and string tables). The "npz"
+    format stores trajectory steps column-wise (see load_columnar_trajectory).
+    Files are optionally gzip/xz compressed and rotated once a part exceeds
+    max_bytes (bytes on disk, approximate while compressing) or max_records.
+    """
+
+    COMPRESSION_SUFFIXES = {None: "", "gz": ".gz", "xz": ".xz"}
+    _run_counter = itertools.count()
+
+    def __init__(self, output_format: str = "json", base_filename: str = "axioms",
+                 output_dir: Union[str, Path] = "./output",
+                 is_trajectory: bool = False,
+                 compression: Optional[str] = None,
+                 max_bytes: Optional[int] = None,
+                 max_records: Optional[int] = None,
+                 layout: str = "full",
+                 queue_size: int = 1024):
+        if compression not in self.COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unknown compression '{compression}'. Use one of: gz, xz")
+        if layout not in ("full", "compact"):
+            raise ValueError(f"Unknown layout '{layout}'. Use one of: full, compact")
+        self.layout = layout
+        self.formats = {"json": ["json"], "text": ["text"], "both": ["json", "text"],
+                        "npz": ["npz"]}[output_format]
+        self.base_filename = base_filename
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.is_trajectory = is_trajectory
+        self.compression = compression
+        self.max_bytes = max_bytes
+        self.max_records = max_records
+        # Microsecond timestamp + pid + per-process counter keeps concurrent runs apart;
+        # files are still opened with O_EXCL in case two hosts share an output dir.
+        self.run_id = (f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+                       f"_{os.getpid()}_{next(self._run_counter)}")
+        self.paths: List[Path] = []
+        self.records_written = 0
+        self._streams: Dict[str, Dict[str, Any]] = {}
+        self._part = 0
+        self._part_records = 0
+        self._error: Optional[BaseException] = None
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="axiom-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, record: Dict[str, Any]):
+        if self._closed:
+            raise ValueError("write() on a closed StreamingOutputWriter")
+        if self._error is not None:
+            raise RuntimeError(f"Output writer failed: {self._error}") from self._error
+        self._queue.put(record)
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def close(self) -> List[Path]:
+        """Flush pending records, finish the open files and return every path written."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+            for path in self.paths:
+                logger.info(f"Output written to: {path}")
+        if self._error is not None:
+            raise RuntimeError(f"Output writer failed: {self._error}") from self._error
+        return list(self.paths)
+
+    # -- worker thread ------------------------------------------------------
+
+    def _run(self):
+        try:
+            while True:
+                record = self._queue.get()
+                if record is None:
+                    break
+                self._write_record(record)
+            self._close_part()
+        except BaseException as e:
+            self._error = e
+            try:
+                self._close_part()
+            except Exception:
+                pass
+            # Keep draining so producers blocked on a full queue are released
+            while self._queue.get() is not None:
+                pass
+
+    def _open_part(self):
+        part_tag = f"_part{self._part:04d}" if (self.max_bytes or self.max_records) else ""
+        for fmt in self.formats:
+            ext = {"json": "json", "text": "txt", "npz": "npz"}[fmt]
+            # npz members are compressed inside the archive instead
+            suffix = "" if fmt == "npz" else self.COMPRESSION_SUFFIXES[self.compression]
+            stem = f"{self.base_filename}_{self.run_id}{part_tag}"
+            attempt = 0
+            while True:
+                name = f"{stem}.{ext}{suffix}" if attempt == 0 else f"{stem}-{attempt}.{ext}{suffix}"
+                path = self.output_dir / name
+                try:
+                    raw = open(path, 'xb')
+                    break
+                except FileExistsError:
+                    attempt += 1
+            if fmt == "npz":
+                stream = raw
+            elif self.compression == "gz":
+                stream = gzip.GzipFile(filename=path.name[:-len(suffix)], mode='wb', fileobj=raw)
+            elif self.compression == "xz":
+                stream = lzma.LZMAFile(raw, mode='wb')
+            else:
+                stream = raw
+            self._streams[fmt] = {"raw": raw, "stream": stream, "path": path, "count": 0,
+                                  "sophia": 0, "coherence": 0.0, "curvature": 0.0}
+            self.paths.append(path)
+            if fmt == "npz":
+                self._streams[fmt]["columns"] = _ColumnBuffer()
+            elif fmt == "json" and self.layout == "compact":
+                # Each part is self-contained, so start a fresh encoder
+                self._streams[fmt]["encoder"] = CompactArchiveEncoder()
+                header = json.dumps(self._streams[fmt]["encoder"].header())
+                stream.write((header[:-1] + ', "axioms": [\n').encode("utf-8"))
+            elif fmt == "json":
+                stream.write(b"[\n")
+            elif self.is_trajectory:
+                stream.write(("Ontological Phase Space Exploration Trajectory\n"
+                              + "=" * 60 + "\n\n").encode("utf-8"))
+        self._part_records = 0
+
+    def _close_part(self):
+        for fmt, s in self._streams.items():
+            stream = s["stream"]
+            if fmt == "npz":
+                (np.savez_compressed if self.compression else np.savez)(stream, **s["columns"].arrays())
+            elif fmt == "json" and self.layout == "compact":
+                tables = json.dumps(s["encoder"].tables(), separators=(",", ":"), ensure_ascii=False)
+                stream.write(("\n], " + tables[1:] + "\n").encode("utf-8"))
+            elif fmt == "json":
+                stream.write(b"\n]\n" if s["count"] else b"]\n")
+            elif self.is_trajectory:
+                n = s["count"]
+                summary = ("\n" + "=" * 60 + "\n"
+                           + "Exploration Summary:\n"
+                           + f"  Total steps: {n}\n"
+                           + f"  Sophia points: {s['sophia']}\n"
+                           + f"  Average coherence: {(s['coherence'] / n if n else float('nan')):.3f}\n"
+                           + f"  Average curvature: {(s['curvature'] / n if n else float('nan')):.3f}\n")
+                stream.write(summary.encode("utf-8"))
+            if stream is not s["raw"]:
+                stream.close()
+            s["raw"].close()
+        self._streams = {}
+
+    def _write_record(self, record: Dict[str, Any]):
+        if not self._streams:
+            self._open_part()
+        elif ((self.max_records and self._part_records >= self.max_records) or
+              (self.max_bytes and any((s["columns"].nbytes() if "columns" in s else s["raw"].tell()) >= self.max_bytes
+                                      for s in self._streams.values()))):
+            self._close_part()
+            self._part += 1
+            self._open_part()
+
+        self.records_written += 1
+        self._part_records += 1
+        for fmt, s in self._streams.items():
+            if fmt == "npz":
+                s["columns"].append(record)
+                s["count"] += 1
+                continue
+            if fmt == "json" and self.layout == "compact":
+                body = json.dumps(s["encoder"].encode(convert_to_serializable(record)),
+                                  separators=(",", ":"), ensure_ascii=False)
+                chunk = ("" if s["count"] == 0 else ",\n") + body
+            elif fmt == "json":
+                body = json.dumps(convert_to_serializable(record), indent=2, ensure_ascii=False)
+                chunk = ("" if s["count"] == 0 else ",\n") + body
+            else:
+                chunk = _format_text_record(record, self.records_written, self.is_trajectory)
+                if self.is_trajectory:
+                    s["sophia"] += 1 if record.get('is_sophia') else 0
+                    s["coherence"] += record.get('coherence', 0)
+                    s["curvature"] += record.get('curvature', 0)
+            s["stream"].write(chunk.encode("utf-8"))
+            s["count"] += 1
+
+def write_output_files(results: List[Dict[str, Any]], output_format: str, base_filename: str = "axioms",
+                       is_trajectory: bool = False, compression: Optional[str] = None,
+                       max_bytes: Optional[int] = None,
+                       max_records: Optional[int] = None,
+                       layout: str = "full") -> List[Path]:
+    """Write results to ./output via StreamingOutputWriter; `results` may be any iterable."""
+    with StreamingOutputWriter(output_format, base_filename, is_trajectory=is_trajectory,
+                               compression=compression, max_bytes=max_bytes,
+                               max_records=max_records, layout=layout) as writer:
+        writer.write_many(results)
+    return writer.paths
+
+# ============================================================================
+# MEMORY-MAPPED COORDINATE STORE (constant-memory storage for long walks)
+# ============================================================================
+
+class CoordinateStore:
+    """
+    Growable on-disk table of walk steps, written through np.memmap.
+
+    Each row holds step, coordinates, curvature, coherence, Sophia flag and a
+    framework id (names live in `<path>.frameworks.json`). Rows are written
+    through a memory map of one chunk at a time and the file grows by whole
+    chunks, so a writer's resident memory stays flat however long the walk
+    runs. The row count lives in the file header and is updated after every
+    row, so readers in this or another process can index and slice the store
+    while it is still being written.
+    """
+
+    MAGIC = b"SAXCOORD"
+    VERSION = 1
+    HEADER_BYTES = 4096
+    DTYPE = np.dtype([("step", "<i8"), ("coordinates", "<f8", (5,)), ("curvature", "<f8"),
+                      ("coherence", "<f8"), ("is_sophia", "?"), ("framework_id", "<i4")])
+
+    def __init__(self, path: Union[str, Path], mode: str = "r", chunk_rows: int = 65536):
+        if mode not in ("r", "w", "a"):
+            raise ValueError(f"Unknown mode '{mode}'. Use one of: r, w, a")
+        self.path = Path(path)
+        self.mode = mode
+        self.chunk_rows = chunk_rows
+        self.frameworks_path = self.path.with_name(self.path.name + ".frameworks.json")
+        if mode == "w" or (mode == "a" and not self.path.exists()):
+            with open(self.path, 'wb') as f:
+                f.write(self.MAGIC)
+                f.write(np.array([self.VERSION, 0, 0], dtype="<u8").tobytes())
+                f.truncate(self.HEADER_BYTES)
+            self._write_frameworks([])
+        with open(self.path, 'rb') as f:
+            if f.read(len(self.MAGIC)) != self.MAGIC:
+                raise ValueError(f"{self.path} is not a coordinate store")
+        # [version, length, capacity]
+        self._header = np.memmap(self.path, dtype="<u8", mode="r" if mode == "r" else "r+",
+                                 offset=len(self.MAGIC), shape=(3,))
+        if int(self._header[0]) != self.VERSION:
+            raise ValueError(f"Unsupported coordinate store version {int(self._header[0])}")
+        self.framework_names: List[str] = self._read_frameworks()
+        self._framework_ids = {name: i for i, name in enumerate(self.framework_names)}
+        self._chunk = None
+        self._chunk_index = -1
+        self._view = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return int(self._header[1])
+
+    @property
+    def capacity(self) -> int:
+        return int(self._header[2])
+
+    def _read_frameworks(self) -> List[str]:
+        if not self.frameworks_path.exists():
+            return []
+        with open(self.frameworks_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_frameworks(self, names: List[str]):
+        tmp = self.frameworks_path.with_name(self.frameworks_path.name + ".tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(names, f)
+        os.replace(tmp, self.frameworks_path)
+
+    def _framework_id(self, name: str) -> int:
+        fid = self._framework_ids.get(name)
+        if fid is None:
+            fid = self._framework_ids[name] = len(self.framework_names)
+            self.framework_names.append(name)
+            self._write_frameworks(self.framework_names)
+        return fid
+
+    def _map_chunk(self, index: int):
+        if self._chunk is not None:
+            self._chunk.flush()
+        needed = (index + 1) * self.chunk_rows
+        if needed > self.capacity:
+            # Grow by whole chunks; the new space is sparse until written
+            with open(self.path, 'r+b') as f:
+                f.truncate(self.HEADER_BYTES + needed * self.DTYPE.itemsize)
+            self._header[2] = needed
+        self._chunk = np.memmap(self.path, dtype=self.DTYPE, mode="r+",
+                                offset=self.HEADER_BYTES + index * self.chunk_rows * self.DTYPE.itemsize,
+                                shape=(self.chunk_rows,))
+        self._chunk_index = index
+
+    def append(self, record: Dict[str, Any]):
+        if self.mode == "r":
+            raise ValueError("append() on a read-only CoordinateStore")
+        n = len(self)
+        index, offset = divmod(n, self.chunk_rows)
+        if index != self._chunk_index:
+            self._map_chunk(index)
+        coords = record["coordinates"]
+        if isinstance(coords, OntologyCoordinates):
+            coords = coords.to_tuple()
+        self._chunk[offset] = (record.get("step", n), coords, record.get("curvature", math.nan),
+                               record.get("coherence", math.nan), bool(record.get("is_sophia", False)),
+                               self._framework_id(record.get("framework") or ""))
+        self._header[1] = n + 1
+
+    def truncate(self, length: int):
+        """Drop rows from `length` on (e.g. steps after the last checkpoint)."""
+        if self.mode == "r":
+            raise ValueError("truncate() on a read-only CoordinateStore")
+        self._header[1] = min(length, len(self))
+
+    def rows(self) -> np.ndarray:
+        """Read-only memory-mapped view of every row written so far."""
+        n = len(self)
+        if self._view is None or len(self._view) < n:
+            capacity = self.capacity
+            if capacity == 0:
+                return np.zeros(0, dtype=self.DTYPE)
+            self._view = np.memmap(self.path, dtype=self.DTYPE, mode="r",
+                                   offset=self.HEADER_BYTES, shape=(capacity,))
+        return self._view[:n]
+
+    def column(self, name: str) -> np.ndarray:
+        return self.rows()[name]
+
+    def __getitem__(self, index):
+        return self.rows()[index]
+
+    def framework(self, framework_id: int) -> str:
+        if framework_id >= len(self.framework_names):
+            self.framework_names = self._read_frameworks()
+        return self.framework_names[framework_id]
+
+    def flush(self):
+        if self._chunk is not None:
+            self._chunk.flush()
+        if self.mode != "r":
+            self._header.flush()
+
+    def close(self):
+        self.flush()
+        self._chunk = None
+        self._chunk_index = -1
+        self._view = None
+
+# ============================================================================
+# AXIOM ARCHIVE STORE (SQLite with R-tree over the 5D coordinates)
+# ============================================================================
+
+class AxiomArchive:
+    """
+    Indexed local store for generated axioms and trajectory steps.
+
+    Rows keep the full record as JSON plus indexed columns for framework
+    family, Sophia flag, seed hash, timestamp and the main metrics. The 5D
+    coordinates live in an R-tree virtual table, so "near this point" queries
+    only touch the rows inside the search box.
+    """
+
+    METRIC_COLUMNS = ["novelty", "elegance", "coherence", "ricci_scalar",
+                      "paradox_intensity", "sophia_score"]
+    COMMIT_EVERY = 500
+
+    def __init__(self, path: Union[str, Path] = "axioms.sqlite"):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._pending = 0
+        self._create_schema()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _create_schema(self):
+        metric_cols = ", ".join(f"{m} REAL" for m in self.METRIC_COLUMNS)
+        self.conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS axioms (
+                id INTEGER PRIMARY KEY,
+                framework_family TEXT,
+                sophia_point INTEGER,
+                seed_hash INTEGER,
+                timestamp TEXT,
+                source TEXT,
+                {metric_cols},
+                axiom_text TEXT,
+                record TEXT NOT NULL,
+                record_hash TEXT
+            )""")
+        if "record_hash" not in {row[1] for row in self.conn.execute("PRAGMA table_info(axioms)")}:
+            # Archives from before import de-duplication: add and backfill the hash
+            self.conn.execute("ALTER TABLE axioms ADD COLUMN record_hash TEXT")
+            self.conn.executemany("UPDATE axioms SET record_hash = ? WHERE id = ?",
+                                  [(self._record_hash(json.loads(record)), rowid) for rowid, record in
+                                   self.conn.execute("SELECT id, record FROM axioms").fetchall()])
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_axioms_record_hash ON axioms(record_hash)")
+        for col in ["framework_family", "sophia_point", "seed_hash", "timestamp"] + self.METRIC_COLUMNS:
+            self.conn.execute(f"CREATE INDEX IF NOT EXISTS idx_axioms_{col} ON axioms({col})")
+        self.conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS axiom_coords USING rtree(
+                id, p_min, p_max, l_min, l_max, s_min, s_max, t_min, t_max, g_min, g_max
+            )""")
+        self.conn.commit()
+
+    @staticmethod
+    def _record_hash(record: Dict[str, Any]) -> str:
+        return hashlib.sha1(json.dumps(record, sort_keys=True, separators=(",", ":"),
+                                       ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _row(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Pull the indexed columns out of a result dict or a trajectory step."""
+        ontology = record.get("ontology") or {}
+        meta = record.get("meta_ontology") or {}
+        metrics = dict(record.get("metrics") or {})
+        if "coherence" in record and "coherence" not in metrics:
+            metrics["coherence"] = record["coherence"]
+        if "curvature" in record and "ricci_scalar" not in metrics:
+            metrics["ricci_scalar"] = record["curvature"]
+        if "sophia_score" in meta:
+            metrics["sophia_score"] = meta["sophia_score"]
+        coords = ontology.get("coordinates", record.get("coordinates"))
+        seed_ctx = record.get("seed_context") or {}
+        sophia = ontology.get("sophia_point", record.get("is_sophia"))
+        return {
+            "framework_family": ontology.get("framework_family", record.get("framework")),
+            "sophia_point": None if sophia is None else int(bool(sophia)),
+            "seed_hash": seed_ctx.get("seed_hash") if isinstance(seed_ctx, dict) else None,
+            "timestamp": record.get("timestamp"),
+            "metrics": {m: (float(metrics[m]) if isinstance(metrics.get(m), (int, float)) else None)
+                        for m in AxiomArchive.METRIC_COLUMNS},
+            "axiom_text": record.get("axiom_text", record.get("axiom")),
+            "coordinates": tuple(float(c) for c in coords) if coords is not None else None,
+        }
+
+    def insert(self, record: Dict[str, Any], source: Optional[str] = None,
+               skip_duplicates: bool = False) -> Optional[int]:
+        """Insert one record and return its row id (None if skip_duplicates and it is already stored)."""
+        record = convert_to_serializable(record)
+        record_hash = self._record_hash(record)
+        if skip_duplicates and self.conn.execute(
+                "SELECT 1 FROM axioms WHERE record_hash = ? LIMIT 1", (record_hash,)).fetchone():
+            return None
+        row = self._row(record)
+        cols = ["framework_family", "sophia_point", "seed_hash", "timestamp", "source"] + \
+               self.METRIC_COLUMNS + ["axiom_text", "record", "record_hash"]
+        values = [row["framework_family"], row["sophia_point"], row["seed_hash"], row["timestamp"], source] + \
+                 [row["metrics"][m] for m in self.METRIC_COLUMNS] + \
+                 [row["axiom_text"], json.dumps(record, separators=(",", ":"), ensure_ascii=False), record_hash]
+        cur = self.conn.execute(
+            f"INSERT INTO axioms ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))})", values)
+        rowid = cur.lastrowid
+        if row["coordinates"] is not None and len(row["coordinates"]) == 5:
+            box = [v for c in row["coordinates"] for v in (c, c)]
+            self.conn.execute("INSERT INTO axiom_coords VALUES (?,?,?,?,?,?,?,?,?,?,?)", [rowid] + box)
+        self._pending += 1
+        if self._pending >= self.COMMIT_EVERY:
+            self.commit()
+        return rowid
+
+    def insert_many(self, records, source: Optional[str] = None, skip_duplicates: bool = False) -> int:
+        """Insert `records` and return how many were stored."""
+        n = 0
+        for record in records:
+            if self.insert(record, source, skip_duplicates=skip_duplicates) is not None:
+                n += 1
+        self.commit()
+        return n
+
+    def import_json(self, path: Union[str, Path]) -> int:
+        """
+        Bulk-import an existing axioms_*.json archive (any layout/compression).
+        Records already in the archive (same content) are skipped, so
+        re-importing a file or directory is harmless.
+        """
+        path = Path(path)
+        records = load_axiom_archive(path)
+        n = self.insert_many(records, source=str(path), skip_duplicates=True)
+        skipped = f" ({len(records) - n} already present)" if n < len(records) else ""
+        logger.info(f"Imported {n} records from {path}{skipped}")
+        return n
+
+    def commit(self):
+        self.conn.commit()
+        self._pending = 0
+
+    def close(self):
+        self.commit()
+        self.conn.close()
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM axioms").fetchone()[0]
+
+    def query(self, framework_family: Optional[str] = None,
+              sophia_point: Optional[bool] = None,
+              seed_hash: Optional[int] = None,
+              since: Optional[str] = None,
+              until: Optional[str] = None,
+              metric_ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+              near: Optional[Tuple[float, ...]] = None,
+              radius: float = 0.1,
+              limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Return stored records matching every given filter. With `near`, only
+        records within `radius` (Euclidean) of the point are returned, nearest first.
+        framework_family matches as a prefix when it ends with '*'.
+        """
+        where, params = [], []
+        tables = "axioms a"
+        if framework_family:
+            if framework_family.endswith("*"):
+                where.append("a.framework_family LIKE ?")
+                params.append(framework_family[:-1] + "%")
             else:
-                for i, axiom in enumerate(results, 1):
-                    f.write(f"=== Axiom {i} ===\n")
-                    f.write(f"{axiom['axiom_text']}\n\n")
-                    if axiom['ontology'].get('is_new'):
-                        f.write(f"[NEW ONTOLOGY: {axiom['ontology']['name']}]\n")
-                    if axiom.get('seed_context'):
-                        f.write(f"[Seed-influenced generation]\n")
-                    if axiom.get('meta_ontology', {}).get('curvature_data'):
-                        f.write(f"[Relativistic framework]\n")
-                    if 'metrics' in axiom:
-                        f.write(f"\n📊 Metrics:\n")
-                        for key, value in list(axiom['metrics'].items())[:5]:
-                            f.write(f"  {key}: {value}\n")
-                    if 'meta_ontology' in axiom and axiom['meta_ontology'].get('curvature_data'):
-                        f.write(f"\n🎭 Ricci scalar: {axiom['meta_ontology']['curvature_data'].get('ricci_scalar', 'N/A')}\n")
-                    f.write("\n" + "="*40 + "\n\n")
-        logger.info(f"Text output written to: {text_filename}")
+                where.append("a.framework_family = ?")
+                params.append(framework_family)
+        if sophia_point is not None:
+            where.append("a.sophia_point = ?")
+            params.append(int(sophia_point))
+        if seed_hash is not None:
+            where.append("a.seed_hash = ?")
+            params.append(seed_hash)
+        if since:
+            where.append("a.timestamp >= ?")
+            params.append(since)
+        if until:
+            where.append("a.timestamp <= ?")
+            params.append(until)
+        for metric, (lo, hi) in (metric_ranges or {}).items():
+            if metric not in self.METRIC_COLUMNS:
+                raise ValueError(f"Unknown metric '{metric}'. Indexed metrics: {self.METRIC_COLUMNS}")
+            if lo is not None:
+                where.append(f"a.{metric} >= ?")
+                params.append(lo)
+            if hi is not None:
+                where.append(f"a.{metric} <= ?")
+                params.append(hi)
+        select = "SELECT a.record"
+        if near is not None:
+            tables += " JOIN axiom_coords c ON c.id = a.id"
+            for axis, x in zip("plstg", near):
+                where.append(f"c.{axis}_max >= ? AND c.{axis}_min <= ?")
+                params.extend([x - radius, x + radius])
+            select += ", c.p_min, c.l_min, c.s_min, c.t_min, c.g_min"
+        sql = f"{select} FROM {tables}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        if limit is not None and near is None:
+            sql += f" LIMIT {int(limit)}"
+
+        rows = self.conn.execute(sql, params).fetchall()
+        if near is None:
+            return [json.loads(r[0]) for r in rows]
+        hits = []
+        for r in rows:
+            d = math.sqrt(sum((a - b) ** 2 for a, b in zip(r[1:], near)))
+            if d <= radius:
+                hits.append((d, r[0]))
+        hits.sort(key=lambda h: h[0])
+        if limit is not None:
+            hits = hits[:limit]
+        return [json.loads(rec) for _, rec in hits]
+
+# ============================================================================
+# ARCHIVE DEDUPLICATION (streaming MinHash/LSH)
+# ============================================================================
+
+def iter_json_records(path: Union[str, Path], chunk_size: int = 1 << 16) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the records of a JSON output file one at a time.
+
+    Plain JSON arrays (optionally .gz/.xz) are decoded incrementally, so the
+    file is never held in memory as a whole. Compact-layout files keep their
+    tables at the end and are expanded via load_axiom_archive instead.
+    Files that are neither (framework tables, checkpoints, JSON Lines) are
+    skipped with a warning, as are array entries that aren't objects.
+    """
+    path = Path(path)
+    opener = {".gz": gzip.open, ".xz": lzma.open}.get(path.suffix, open)
+    decoder = json.JSONDecoder()
+    with opener(path, 'rt', encoding='utf-8') as f:
+        buf = f.read(chunk_size).lstrip()
+        if buf.startswith("{"):
+            try:
+                records = load_axiom_archive(path)
+            except json.JSONDecodeError:
+                records = None
+            if not isinstance(records, list):
+                logger.warning(f"Skipping {path}: not an axiom archive")
+                return
+            yield from (rec for rec in records if isinstance(rec, dict))
+            return
+        if not buf.startswith("["):
+            logger.warning(f"Skipping {path}: not a JSON array of records")
+            return
+        pos, eof = 1, False
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos < len(buf) and buf[pos] == "]":
+                return
+            try:
+                record, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                more = f.read(chunk_size)
+                eof = not more
+                buf = buf[pos:] + more
+                pos = 0
+                continue
+            if isinstance(record, dict):
+                yield record
+            pos = end
+            if pos > chunk_size:
+                buf, pos = buf[pos:], 0
+
+class MinHasher:
+    """MinHash signatures over word 3-gram shingles using multiply-shift hashing."""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self.a = rng.randint(1, 2**63 - 1, size=num_perm, dtype=np.int64).astype(np.uint64) | np.uint64(1)
+        self.b = rng.randint(0, 2**63 - 1, size=num_perm, dtype=np.int64).astype(np.uint64)
+
+    @staticmethod
+    def shingles(text: str, k: int = 3) -> List[str]:
+        words = re.findall(r"\w+", text.lower())
+        if len(words) <= k:
+            return [" ".join(words)]
+        return [" ".join(words[i:i+k]) for i in range(len(words) - k + 1)]
+
+    def signature(self, text: str) -> np.ndarray:
+        # crc32 is stable across processes, unlike the salted built-in hash()
+        x = np.array([zlib.crc32(s.encode("utf-8")) for s in set(self.shingles(text))], dtype=np.uint64)
+        with np.errstate(over='ignore'):
+            h = (x[:, None] * self.a[None, :] + self.b[None, :]) >> np.uint64(32)
+        return h.min(axis=0).astype(np.uint32)
+
+    @staticmethod
+    def lsh_params(num_perm: int, threshold: float) -> Tuple[int, int]:
+        """Pick (bands, rows) with bands*rows == num_perm whose S-curve knee is closest to threshold."""
+        best = (num_perm, 1)
+        best_err = float('inf')
+        for rows in range(1, num_perm + 1):
+            if num_perm % rows:
+                continue
+            bands = num_perm // rows
+            err = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+            if err < best_err:
+                best, best_err = (bands, rows), err
+        return best
+
+def _record_text(record: Dict[str, Any]) -> str:
+    return str(record.get("axiom_text") or record.get("axiom") or record.get("core_statement") or "")
+
+def _signature_file(args: Tuple[str, int, int]) -> Tuple[str, np.ndarray]:
+    """Worker: stream one archive file and return its (n, num_perm) signature matrix."""
+    path, num_perm, seed = args
+    hasher = MinHasher(num_perm, seed)
+    sigs = [hasher.signature(_record_text(rec)) for rec in iter_json_records(path)]
+    return path, (np.vstack(sigs) if sigs else np.zeros((0, num_perm), dtype=np.uint32))
+
+def dedupe_archives(paths: List[Union[str, Path]], output_format: str = "json",
+                    base_filename: str = "deduped", threshold: float = 0.8,
+                    num_perm: int = 64, workers: Optional[int] = None,
+                    compression: Optional[str] = None, layout: str = "full",
+                    max_bytes: Optional[int] = None, max_records: Optional[int] = None,
+                    seed: int = 1, output_dir: Union[str, Path] = "./output") -> Dict[str, Any]:
+    """
+    Cluster near-duplicate axioms across archive files and write one
+    representative per cluster (the first record seen) with its cluster size.
+
+    Pass 1 computes MinHash signatures in a process pool, one file per task.
+    LSH banding proposes candidate pairs, which are merged with union-find
+    when their estimated Jaccard similarity reaches `threshold`. Pass 2
+    streams the files again and writes only the representatives.
+    """
+    files = [str(p) for p in paths]
+    tasks = [(f, num_perm, seed) for f in files]
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(files))) as pool:
+            sig_by_file = dict(pool.map(_signature_file, tasks))
+    else:
+        sig_by_file = dict(map(_signature_file, tasks))
+    # Files that held no records (skipped as non-archives) aren't read again in pass 2
+    files = [f for f in files if len(sig_by_file[f])]
+
+    offsets, blocks, start = {}, [], 0
+    for f in files:
+        offsets[f] = start
+        blocks.append(sig_by_file[f])
+        start += len(sig_by_file[f])
+    signatures = np.vstack(blocks) if start else np.zeros((0, num_perm), dtype=np.uint32)
+    n = len(signatures)
+
+    parent = np.arange(n)
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    bands, rows = MinHasher.lsh_params(num_perm, threshold)
+    for band in range(bands):
+        buckets: Dict[bytes, int] = {}
+        chunk = np.ascontiguousarray(signatures[:, band*rows:(band+1)*rows])
+        for i in range(n):
+            key = chunk[i].tobytes()
+            j = buckets.setdefault(key, i)
+            if j == i:
+                continue
+            ri, rj = find(i), find(j)
+            if ri != rj and np.mean(signatures[i] == signatures[j]) >= threshold:
+                parent[max(ri, rj)] = min(ri, rj)
+
+    roots = np.array([find(i) for i in range(n)], dtype=np.int64)
+    sizes = np.bincount(roots, minlength=n)
+    representatives = set(np.flatnonzero(roots == np.arange(n)).tolist())
+
+    written = 0
+    with StreamingOutputWriter(output_format, base_filename, output_dir=output_dir,
+                               compression=compression, max_bytes=max_bytes,
+                               max_records=max_records, layout=layout) as writer:
+        for f in files:
+            for k, rec in enumerate(iter_json_records(f)):
+                idx = offsets[f] + k
+                if idx in representatives:
+                    rec["cluster"] = {"id": int(idx), "size": int(sizes[idx])}
+                    writer.write(rec)
+                    written += 1
+    return {
+        "input_records": int(n),
+        "clusters": written,
+        "largest_cluster": int(sizes.max()) if n else 0,
+        "lsh_bands": bands,
+        "lsh_rows": rows,
+        "output_files": [str(p) for p in writer.paths],
+    }
 
 # ============================================================================
 # COMMAND LINE INTERFACE v5.0
@@ -1864,6 +5430,72 @@ def parse_coordinates(s: str) -> Tuple[float, ...]:
     except Exception as e:
         raise argparse.ArgumentTypeError(f"Invalid coordinate format: {e}. Use: 0.5,0.5,0.5,0.5,0.5")
 
+def load_geodesic_pairs(path: Union[str, Path]) -> List[Tuple[Tuple[float, ...], Tuple[float, ...]]]:
+    """
+    Read (start, end) pairs for geodesic --pairs-file. Accepts a JSON list of
+    [start, end] or {"start": ..., "end": ...} entries, or text with one
+    "start end" pair per line. Each endpoint is 5 coordinates (a list or a
+    comma-separated string) or a framework name.
+    """
+    def endpoint(value: Any) -> Tuple[float, ...]:
+        if isinstance(value, str) and value in HybridFrameworkGenerator.current():
+            return tuple(HybridFrameworkGenerator.current()[value]["coordinates"])
+        if isinstance(value, str):
+            return parse_coordinates(value)
+        if len(value) != 5:
+            raise ValueError(f"Need exactly 5 coordinates, got {value}")
+        return tuple(float(v) for v in value)
+
+    text = Path(path).read_text(encoding='utf-8')
+    try:
+        entries = json.loads(text)
+    except json.JSONDecodeError:
+        entries = [line.replace(';', ' ').split() for line in text.splitlines()
+                   if line.strip() and not line.lstrip().startswith('#')]
+    pairs = []
+    for entry in entries:
+        start, end = (entry["start"], entry["end"]) if isinstance(entry, dict) else entry
+        pairs.append((endpoint(start), endpoint(end)))
+    return pairs
+
+def add_file_writer_arguments(parser: argparse.ArgumentParser):
+    """Options shared by every subcommand that supports --outputfile."""
+    parser.add_argument('--compress', choices=['gz', 'xz'],
+                        help='Compress output files')
+    parser.add_argument('--rotate-bytes', type=int,
+                        help='Start a new output file once the current one reaches this size')
+    parser.add_argument('--rotate-records', type=int,
+                        help='Start a new output file after this many records')
+    parser.add_argument('--layout', choices=['full', 'compact'], default='full',
+                        help='JSON file layout; compact stores each seed context once and interns repeated strings')
+
+def add_geodesic_table_arguments(parser: argparse.ArgumentParser):
+    """Options for subcommands that can route framework lookups through the geodesic table."""
+    parser.add_argument('--geodesic-table', action='store_true',
+                        help='Use the precomputed framework geodesic table for nearest-framework lookups '
+                             'and framework-to-framework geodesics (built and cached in the data root)')
+    parser.add_argument('--table-workers', type=int, default=1,
+                        help='Processes used to integrate missing table entries')
+
+def add_state_arguments(parser: argparse.ArgumentParser):
+    """Options for subcommands that can continue a previous session's engine state."""
+    parser.add_argument('--state', type=str, metavar='FILE', default=None,
+                        help='Restore engine state (fingerprint history, phase mode, stats, RNG) from FILE '
+                             'if it exists, and save it back there at the end of the run')
+
+def add_watch_arguments(parser: argparse.ArgumentParser):
+    """Options for long-running subcommands that can hot-reload the framework files."""
+    parser.add_argument('--watch-frameworks', type=float, metavar='SECONDS', default=None,
+                        help='Poll frameworks.json and dynamic_frameworks.json every SECONDS and '
+                             'reload changed frameworks without restarting')
+
+def open_output_writer(args, is_trajectory: bool = False) -> Optional[StreamingOutputWriter]:
+    if not args.outputfile:
+        return None
+    return StreamingOutputWriter(args.outputfile, args.filename, is_trajectory=is_trajectory,
+                                 compression=args.compress, max_bytes=args.rotate_bytes,
+                                 max_records=args.rotate_records, layout=args.layout)
+
 def main():
     parser = argparse.ArgumentParser(
         description="META-AXIOMFORGE v5.0 - Truly Generative, Emergent & Non-Repetitive",
@@ -1892,6 +5524,10 @@ def main():
                             help='Maximum similarity allowed to recent axioms (0-1)')
     gen_parser.add_argument('--numeric-seed', type=int, help='Numeric seed')
     gen_parser.add_argument('--no-relativity', action='store_true', help='Disable relativistic enhancements')
+    gen_parser.add_argument('--fields', type=str,
+                            help='Comma-separated result fields to keep (dotted for nested), e.g. axiom_text,ontology.coordinates')
+    gen_parser.add_argument('--deadline-ms', type=float,
+                            help='Per-axiom latency budget; past it, return the best candidate so far (flagged degraded)')
     gen_parser.add_argument('--ontology', choices=['alien', 'counter', 'bridge', 'meta'],
                             help='Legacy ontology (for legacy mode)')
     gen_parser.add_argument('--paradox-type', type=str, default='random',
@@ -1904,6 +5540,11 @@ def main():
     gen_parser.add_argument('--outputfile', choices=['json', 'text', 'both'],
                             help='File output format (writes to /output/)')
     gen_parser.add_argument('--filename', type=str, default='axioms', help='Base filename for output')
+    add_file_writer_arguments(gen_parser)
+    gen_parser.add_argument('--archive', type=str, help='Also insert each axiom into this archive database')
+    add_geodesic_table_arguments(gen_parser)
+    add_watch_arguments(gen_parser)
+    add_state_arguments(gen_parser)
     gen_parser.add_argument('--simple', action='store_true', help='Simple output format')
 
     # Explore command
@@ -1916,24 +5557,58 @@ def main():
                             help='Maximum similarity allowed to recent steps')
     exp_parser.add_argument('--no-relativity', action='store_true', help='Disable relativistic enhancements')
     exp_parser.add_argument('--output', choices=['json', 'text', 'both'], default='text')
-    exp_parser.add_argument('--outputfile', choices=['json', 'text', 'both'])
+    exp_parser.add_argument('--outputfile', choices=['json', 'text', 'both', 'npz'])
     exp_parser.add_argument('--filename', type=str, default='explore')
+    add_file_writer_arguments(exp_parser)
+    exp_parser.add_argument('--archive', type=str, help='Also insert each step into this archive database')
+    add_geodesic_table_arguments(exp_parser)
+    add_watch_arguments(exp_parser)
+    add_state_arguments(exp_parser)
+    exp_parser.add_argument('--checkpoint', type=str,
+                            help='Checkpoint walker state here and append steps to <checkpoint>.steps.jsonl')
+    exp_parser.add_argument('--checkpoint-every', type=int, default=1000, help='Steps between checkpoints')
+    exp_parser.add_argument('--resume', action='store_true', help='Continue from the last --checkpoint')
+    exp_parser.add_argument('--coord-store', type=str,
+                            help='Write steps to this memory-mapped coordinate store instead of keeping them in memory')
+    exp_parser.add_argument('--walkers', type=int,
+                            help='Ensemble mode: advance this many walkers together as one array')
+    exp_parser.add_argument('--materialize-every', type=int, default=0,
+                            help='Ensemble mode: generate axioms every N steps (0 = never)')
+    exp_parser.add_argument('--materialize-walkers', type=int, default=1,
+                            help='Ensemble mode: number of walkers to generate axioms for')
+    exp_parser.add_argument('--record-every', type=int, default=1,
+                            help='Ensemble mode: record coordinates/curvature every N steps')
 
     # Simulate command
     sim_parser = subparsers.add_parser('simulate', help='Simulate framework evolution')
-    sim_parser.add_argument('framework', type=str, help='Framework name')
+    sim_parser.add_argument('framework', type=str, nargs='?', help='Framework name')
+    sim_parser.add_argument('--all', action='store_true',
+                            help='Flow every registered framework together as one ensemble')
+    sim_parser.add_argument('--interaction', type=float, default=0.0,
+                            help='With --all: pairwise pull towards nearby frameworks (negative pushes apart)')
+    sim_parser.add_argument('--interaction-range', type=float, default=0.25,
+                            help='With --all: Gaussian width of the pairwise interaction')
     sim_parser.add_argument('--steps', type=int, default=100, help='Number of flow steps')
     sim_parser.add_argument('--dt', type=float, default=0.005, help='Step size for gradient flow')
-    sim_parser.add_argument('--outputfile', choices=['json', 'text', 'both'])
+    sim_parser.add_argument('--outputfile', choices=['json', 'text', 'both', 'npz'])
     sim_parser.add_argument('--filename', type=str, default='simulation')
+    add_file_writer_arguments(sim_parser)
 
     # Geodesic command
     geo_parser = subparsers.add_parser('geodesic', help='Explore geodesic path')
-    geo_parser.add_argument('--start', type=parse_coordinates, required=True,
+    geo_parser.add_argument('--start', type=parse_coordinates,
                             help='Start coordinates (5 floats comma-separated)')
-    geo_parser.add_argument('--end', type=parse_coordinates, required=True,
+    geo_parser.add_argument('--end', type=parse_coordinates,
                             help='End coordinates')
+    geo_parser.add_argument('--pairs-file', type=str,
+                            help='Integrate every start/end pair in this file together (JSON or one pair per line)')
+    geo_parser.add_argument('--workers', type=int, default=1,
+                            help='Processes for --pairs-file integration')
+    geo_parser.add_argument('--with-axioms', action='store_true',
+                            help='With --pairs-file, also generate axioms along every path')
     geo_parser.add_argument('--steps', type=int, default=20, help='Number of points along geodesic')
+    geo_parser.add_argument('--bvp', action='store_true',
+                            help='Solve the two-point boundary-value problem so paths end exactly at --end')
     geo_parser.add_argument('--seed', type=str, help='Text seed to influence generation')
     geo_parser.add_argument('--seed-weight', type=float, default=0.2,
                             help='Weight of seed influence (0-1)')
@@ -1941,8 +5616,14 @@ def main():
                             help='Maximum similarity allowed between steps')
     geo_parser.add_argument('--plot', action='store_true', help='Plot the geodesic (requires matplotlib)')
     geo_parser.add_argument('--output', choices=['json', 'text', 'both'], default='text')
-    geo_parser.add_argument('--outputfile', choices=['json', 'text', 'both'])
+    geo_parser.add_argument('--outputfile', choices=['json', 'text', 'both', 'npz'])
     geo_parser.add_argument('--filename', type=str, default='geodesic')
+    add_file_writer_arguments(geo_parser)
+    add_geodesic_table_arguments(geo_parser)
+    geo_parser.add_argument('--geodesic-cache', type=str,
+                            help='Persist integrated geodesics in this SQLite file and reuse them across runs')
+    geo_parser.add_argument('--cache-precision', type=int, default=6,
+                            help='Decimals endpoints are rounded to when matching cached geodesics')
 
     # Analyze command
     ana_parser = subparsers.add_parser('analyze', help='Analyze a seed without generating')
@@ -1957,8 +5638,74 @@ def main():
     rf_parser.add_argument('coords', type=parse_coordinates, help='Starting coordinates')
     rf_parser.add_argument('--iterations', type=int, default=10, help='Number of iterations')
     rf_parser.add_argument('--dt', type=float, default=0.005, help='Step size')
-    rf_parser.add_argument('--outputfile', choices=['json', 'text', 'both'])
+    rf_parser.add_argument('--outputfile', choices=['json', 'text', 'both', 'npz'])
     rf_parser.add_argument('--filename', type=str, default='ricci')
+    add_file_writer_arguments(rf_parser)
+
+    # Archive command
+    arc_parser = subparsers.add_parser('archive', help='Import and query the indexed axiom archive')
+    arc_parser.add_argument('--db', type=str, default='axioms.sqlite', help='Archive database file')
+    arc_sub = arc_parser.add_subparsers(dest='archive_command')
+    arc_import = arc_sub.add_parser('import', help='Bulk-import axioms_*.json files or directories')
+    arc_import.add_argument('paths', nargs='+', help='JSON files or directories to import')
+    arc_query = arc_sub.add_parser('query', help='Query the archive')
+    arc_query.add_argument('--framework', type=str, help='Framework family (trailing * for prefix match)')
+    arc_query.add_argument('--sophia', action='store_true', default=None, help='Only Sophia points')
+    arc_query.add_argument('--seed-hash', type=int, help='Seed hash')
+    arc_query.add_argument('--since', type=str, help='Earliest timestamp (ISO 8601)')
+    arc_query.add_argument('--until', type=str, help='Latest timestamp (ISO 8601)')
+    arc_query.add_argument('--metric', action='append', default=[], metavar='NAME:LO:HI',
+                           help='Metric range, e.g. elegance:60: or coherence:0.5:0.7 (repeatable)')
+    arc_query.add_argument('--near', type=parse_coordinates, help='Only records near these coordinates')
+    arc_query.add_argument('--radius', type=float, default=0.1, help='Search radius for --near')
+    arc_query.add_argument('--limit', type=int, help='Maximum number of records')
+    arc_query.add_argument('--output', choices=['json', 'text'], default='text')
+
+    # Dedupe command
+    dd_parser = subparsers.add_parser('dedupe', help='Cluster near-duplicate axioms in archives and compact them')
+    dd_parser.add_argument('paths', nargs='+', help='JSON archive files or directories')
+    dd_parser.add_argument('--threshold', type=float, default=0.8,
+                           help='Estimated Jaccard similarity (word 3-grams) that counts as a duplicate')
+    dd_parser.add_argument('--num-perm', type=int, default=64, help='MinHash permutations')
+    dd_parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    dd_parser.add_argument('--outputfile', choices=['json', 'text', 'both'], default='json')
+    dd_parser.add_argument('--filename', type=str, default='deduped')
+    add_file_writer_arguments(dd_parser)
+
+    # MAP-Elites command
+    me_parser = subparsers.add_parser('map-elites', help='Quality-diversity search over the 5D phase space')
+    me_parser.add_argument('--budget', type=int, default=1000, help='Total axiom evaluations')
+    me_parser.add_argument('--cells', type=int, default=5, help='Cells per axis')
+    me_parser.add_argument('--objective', choices=list(MapElitesSearch.OBJECTIVES), default='elegance',
+                           help='Fitness kept per cell')
+    me_parser.add_argument('--init', type=int, default=100, help='Uniform random samples before mutating elites')
+    me_parser.add_argument('--sigma', type=float, default=0.1, help='Mutation scale (fraction of each axis)')
+    me_parser.add_argument('--batch-size', type=int, default=32, help='Candidates evaluated per batch')
+    me_parser.add_argument('--workers', type=int, default=1, help='Worker processes for evaluation')
+    me_parser.add_argument('--no-relativity', action='store_true', help='Disable relativistic enhancements')
+    me_parser.add_argument('--numeric-seed', type=int, help='Numeric seed')
+    me_parser.add_argument('--output', choices=['json', 'text'], default='text')
+    me_parser.add_argument('--outputfile', choices=['json', 'text', 'both'])
+    me_parser.add_argument('--filename', type=str, default='map_elites')
+    add_file_writer_arguments(me_parser)
+
+    # Sophia-point search command
+    ss_parser = subparsers.add_parser('sophia-search', help='Optimize coordinates/framework for Sophia points (CMA-ES)')
+    ss_parser.add_argument('--budget', type=int, default=500, help='Maximum axiom evaluations')
+    ss_parser.add_argument('--seed', type=str, help='Text seed (adds seed_weight as a search variable)')
+    ss_parser.add_argument('--population', type=int, default=16, help='Candidates per CMA-ES generation')
+    ss_parser.add_argument('--sigma', type=float, default=0.3, help='Initial step size (unit-cube scale)')
+    ss_parser.add_argument('--threshold', type=float, help='Sophia score that counts as a hit (default: 0.8)')
+    ss_parser.add_argument('--workers', type=int, default=1, help='Worker processes for evaluation')
+    ss_parser.add_argument('--stop-at-sophia', action='store_true', help='Stop at the first Sophia point')
+    ss_parser.add_argument('--compare-random', action='store_true',
+                           help='Also run the same budget of random generations for comparison')
+    ss_parser.add_argument('--no-relativity', action='store_true', help='Disable relativistic enhancements')
+    ss_parser.add_argument('--numeric-seed', type=int, help='Numeric seed')
+    ss_parser.add_argument('--output', choices=['json', 'text'], default='text')
+    ss_parser.add_argument('--outputfile', choices=['json', 'text', 'both'])
+    ss_parser.add_argument('--filename', type=str, default='sophia_search')
+    add_file_writer_arguments(ss_parser)
 
     # Test command (comprehensive)
     test_parser = subparsers.add_parser('test', help='Run built-in tests')
@@ -1972,6 +5719,11 @@ def main():
     # Initialize forge
     forge = MetaAxiomForge(data_root=args.data_root)
 
+    if getattr(args, 'geodesic_table', False):
+        forge.meta_engine.use_geodesic_table(workers=args.table_workers)
+    if getattr(args, 'watch_frameworks', None):
+        forge.meta_engine.watch_frameworks(interval=args.watch_frameworks)
+
     # Seed handling
     if hasattr(args, 'numeric_seed') and args.numeric_seed:
         random.seed(args.numeric_seed)
@@ -1983,6 +5735,13 @@ def main():
         np.random.seed(seed_hash % (2**32))
         logger.info(f"Using text seed: '{args.seed}' (hash: {seed_hash})")
 
+    # A saved state carries its own RNG state, so it takes over from the seeds above
+    state_path = getattr(args, 'state', None)
+    if state_path and Path(state_path).exists():
+        forge.load_state(state_path)
+        logger.info(f"Restored forge state from {state_path} "
+                    f"({forge.generation_stats['total']} axioms so far)")
+
     # Dispatch commands
     if args.command == 'generate':
         target_quadrant = None if args.quadrant == 'random' else args.quadrant
@@ -1994,68 +5753,239 @@ def main():
                 "tone": args.tone,
                 "max_mech": args.max_mech
             }
-        results = forge.generate(
-            mode=args.mode,
-            count=args.count,
-            target_quadrant=target_quadrant,
-            legacy_params=legacy_params,
-            concept_seed=args.seed,
-            enable_relativity=not args.no_relativity,
-            seed_weight=args.seed_weight,
-            diversity_threshold=args.diversity_threshold
-        )
-        if args.outputfile:
-            write_output_files(results, args.outputfile, args.filename)
-        if args.simple:
-            if args.output == 'json':
-                print(json.dumps(convert_to_serializable(results), indent=2))
-            else:
-                for i, ax in enumerate(results, 1):
-                    print(f"Axiom {i}: {ax['axiom_text']}")
-        else:
-            if args.output in ('json','both'):
-                print(json.dumps(convert_to_serializable(results), indent=2))
-            if args.output in ('text','both'):
+        # Stream axioms to the file writer and console as they are generated; only
+        # JSON console output needs the whole result set in memory.
+        keep_results = args.output == 'json' if args.simple else args.output in ('json', 'both')
+        stream_text = args.output != 'json' if args.simple else args.output in ('text', 'both')
+        fields = None
+        if args.fields:
+            fields = [f.strip() for f in args.fields.split(",") if f.strip()]
+            if stream_text and "axiom_text" not in fields:
+                fields.append("axiom_text")
+        results = []
+        writer = open_output_writer(args)
+        archive = AxiomArchive(args.archive) if args.archive else None
+        try:
+            for i, ax in enumerate(forge.iter_generate(
+                    mode=args.mode,
+                    count=args.count,
+                    target_quadrant=target_quadrant,
+                    legacy_params=legacy_params,
+                    concept_seed=args.seed,
+                    enable_relativity=not args.no_relativity,
+                    seed_weight=args.seed_weight,
+                    diversity_threshold=args.diversity_threshold,
+                    deadline_ms=args.deadline_ms,
+                    fields=fields), 1):
+                if writer:
+                    writer.write(ax)
+                if archive:
+                    archive.insert(ax, source="generate")
+                if keep_results:
+                    results.append(ax)
+                if stream_text and not keep_results:
+                    if args.simple:
+                        print(f"Axiom {i}: {ax['axiom_text']}")
+                    else:
+                        print(f"\n✨ AXIOM {i}")
+                        print(ax['axiom_text'])
+        finally:
+            if writer:
+                writer.close()
+            if archive:
+                archive.close()
+        if keep_results:
+            print(json.dumps(convert_to_serializable(results), indent=2))
+            if stream_text:
                 for i, ax in enumerate(results, 1):
                     print(f"\n✨ AXIOM {i}")
                     print(ax['axiom_text'])
         stats = forge.get_stats()
+        stats.pop("distributions", None)
         logger.info(f"Session stats: {stats}")
-
-    elif args.command == 'explore':
-        traj = forge.explore_phase_space(steps=args.steps, seed_text=args.seed,
-                                          enable_relativity=not args.no_relativity,
-                                          seed_weight=args.seed_weight,
-                                          diversity_threshold=args.diversity_threshold)
-        if args.outputfile:
-            write_output_files(traj, args.outputfile, args.filename, is_trajectory=True)
+        if forge.distributions.count:
+            logger.info(forge.distributions.format_summary())
+
+    elif args.command == 'explore' and args.walkers:
+        every = args.materialize_every
+        ens = forge.explore_ensemble(walkers=args.walkers, steps=args.steps,
+                                     enable_relativity=not args.no_relativity,
+                                     materialize_steps=list(range(0, args.steps, every)) if every else None,
+                                     materialize_walkers=args.materialize_walkers,
+                                     seed_text=args.seed, seed_weight=args.seed_weight,
+                                     diversity_threshold=args.diversity_threshold,
+                                     record_every=args.record_every)
+        if args.outputfile == 'npz':
+            columns = {"step": np.asarray(ens["recorded_steps"], dtype=np.int64),
+                       "coordinates": ens["coordinates"],
+                       "curvature": ens["curvature"]}
+            columns.update(dictionary_encode("framework", ens["framework_ids"], ens["framework_names"]))
+            write_columnar_arrays(columns, args.filename, compressed=bool(args.compress))
+        elif args.outputfile:
+            write_output_files(ens["axioms"], args.outputfile, args.filename, is_trajectory=True,
+                               compression=args.compress, max_bytes=args.rotate_bytes,
+                               max_records=args.rotate_records, layout=args.layout)
+        final_ids = ens["framework_ids"][-1]
+        summary = {
+            "walkers": ens["walkers"],
+            "steps": ens["steps"],
+            "mean_curvature": float(np.mean(ens["curvature"])),
+            "final_framework_occupancy": {ens["framework_names"][i]: int(c)
+                                          for i, c in enumerate(np.bincount(final_ids, minlength=len(ens["framework_names"])))
+                                          if c},
+            "final_coordinate_spread": np.std(ens["coordinates"][-1], axis=0).tolist(),
+            "materialized_axioms": len(ens["axioms"]),
+        }
         if args.output in ('json','both'):
-            print(json.dumps(convert_to_serializable(traj), indent=2))
+            print(json.dumps(convert_to_serializable({"summary": summary, "axioms": ens["axioms"]}), indent=2))
         if args.output in ('text','both'):
-            for step in traj[:10]:
-                print(f"Step {step['step']}: {step['axiom'][:60]}...")
-            logger.info(f"Explored {len(traj)} steps, {sum(1 for s in traj if s['is_sophia'])} Sophia points")
+            for step in ens["axioms"][:10]:
+                print(f"Step {step['step']} walker {step['walker']}: {step['axiom'][:60]}...")
+            logger.info(f"Ensemble summary: {summary}")
+
+    elif args.command == 'explore':
+        traj = []
+        writer = open_output_writer(args, is_trajectory=True)
+        archive = AxiomArchive(args.archive) if args.archive else None
+        store = None
+        if args.coord_store:
+            # Steps go to the memory-mapped store only, so memory stays flat for any --steps
+            store = CoordinateStore(args.coord_store, mode='a' if args.resume else 'w')
+            forge.meta_engine.retain_generated = False
+        try:
+            for step in forge.iter_phase_space(steps=args.steps, seed_text=args.seed,
+                                               enable_relativity=not args.no_relativity,
+                                               seed_weight=args.seed_weight,
+                                               diversity_threshold=args.diversity_threshold,
+                                               checkpoint_path=args.checkpoint,
+                                               checkpoint_every=args.checkpoint_every,
+                                               resume=args.resume,
+                                               coord_store=store):
+                if writer:
+                    writer.write(step)
+                if archive:
+                    archive.insert(step, source="explore")
+                if store is None:
+                    traj.append(step)
+        finally:
+            if writer:
+                writer.close()
+            if archive:
+                archive.close()
+            if store is not None:
+                store.close()
+        if store is not None:
+            rows = store.rows()
+            logger.info(f"Coordinate store {args.coord_store}: {len(rows)} steps, "
+                        f"{int(rows['is_sophia'].sum())} Sophia points, "
+                        f"mean curvature {float(rows['curvature'].mean()) if len(rows) else float('nan'):.3f}")
+        else:
+            if args.output in ('json','both'):
+                print(json.dumps(convert_to_serializable(traj), indent=2))
+            if args.output in ('text','both'):
+                for step in traj[:10]:
+                    print(f"Step {step['step']}: {step['axiom'][:60]}...")
+                logger.info(f"Explored {len(traj)} steps, {sum(1 for s in traj if s['is_sophia'])} Sophia points")
+
+    elif args.command == 'simulate' and args.all:
+        ens = forge.simulate_ensemble_evolution(args.steps, dt=args.dt, interaction=args.interaction,
+                                                interaction_range=args.interaction_range)
+        names, traj, stopped = ens["frameworks"], ens["trajectory"], ens["stopped_step"]
+        if args.outputfile == 'npz':
+            columns = {"step": np.arange(len(traj), dtype=np.int64),
+                       "coordinates": traj,
+                       "curvature": ens["curvature"],
+                       "stopped_step": stopped}
+            columns.update(dictionary_encode("framework", np.arange(len(names)), names))
+            write_columnar_arrays(columns, args.filename, compressed=bool(args.compress))
+        elif args.outputfile:
+            # Same record shape as single-framework simulate, one per framework
+            write_output_files(({"framework": name,
+                                 "initial_coords": tuple(traj[0, i]),
+                                 "flow": [tuple(p) for p in traj[:(stopped[i] if stopped[i] >= 0 else len(traj) - 1) + 1, i]],
+                                 "final_coords": tuple(traj[-1, i])}
+                                for i, name in enumerate(names)),
+                               args.outputfile, args.filename, compression=args.compress,
+                               max_bytes=args.rotate_bytes, max_records=args.rotate_records,
+                               layout=args.layout)
+        summary = {
+            "frameworks": len(names),
+            "steps": len(traj) - 1,
+            "interaction": args.interaction,
+            "final_coords": {name: tuple(traj[-1, i]) for i, name in enumerate(names)},
+            "stopped_step": {name: int(stopped[i]) for i, name in enumerate(names) if stopped[i] >= 0},
+            "mean_curvature": {"initial": float(np.mean(ens["curvature"][0])),
+                               "final": float(np.mean(ens["curvature"][-1]))},
+            "final_coordinate_spread": np.std(traj[-1], axis=0).tolist()
+        }
+        print(json.dumps(convert_to_serializable(summary), indent=2))
 
     elif args.command == 'simulate':
+        if not args.framework:
+            sim_parser.error("a framework name is required unless --all is given")
         sim = forge.simulate_framework_evolution(args.framework, args.steps, dt=args.dt)
         if not sim:
             sys.exit(1)
-        if args.outputfile:
-            write_output_files([sim], args.outputfile, args.filename)
+        if args.outputfile == 'npz':
+            flow = np.asarray(sim["flow"], dtype=np.float64)
+            columns = {"step": np.arange(len(flow), dtype=np.int64),
+                       "coordinates": flow,
+                       "curvature": forge.meta_engine.field_sim.ricci_scalar_batch(flow)}
+            columns.update(dictionary_encode("framework", np.zeros(1), [args.framework]))
+            write_columnar_arrays(columns, args.filename, compressed=bool(args.compress))
+        elif args.outputfile:
+            write_output_files([sim], args.outputfile, args.filename, compression=args.compress,
+                               max_bytes=args.rotate_bytes, max_records=args.rotate_records,
+                               layout=args.layout)
         print(json.dumps(convert_to_serializable(sim), indent=2))
 
     elif args.command == 'geodesic':
-        traj = forge.explore_geodesic(args.start, args.end, args.steps,
-                                      plot=args.plot, seed_text=args.seed,
-                                      seed_weight=args.seed_weight,
-                                      diversity_threshold=args.diversity_threshold)
-        if args.outputfile:
-            write_output_files(traj, args.outputfile, args.filename, is_trajectory=True)
-        if args.output in ('json','both'):
-            print(json.dumps(convert_to_serializable(traj), indent=2))
-        if args.output in ('text','both'):
-            for step in traj:
-                print(f"Step {step['step']}: {step['axiom'][:60]}...")
+        if args.geodesic_cache or args.cache_precision != 6:
+            forge.meta_engine.field_sim.enable_geodesic_cache(precision=args.cache_precision,
+                                                              path=args.geodesic_cache)
+        if args.pairs_file:
+            if args.outputfile not in (None, 'json'):
+                geo_parser.error("--pairs-file only supports --outputfile json")
+            pairs = load_geodesic_pairs(args.pairs_file)
+            field_sim = forge.meta_engine.field_sim
+            records = []
+            paths = forge.geodesic_paths(pairs, args.steps, workers=args.workers,
+                                         mode="bvp" if args.bvp else "shooting")
+            for i, ((start, end), path) in enumerate(zip(pairs, paths)):
+                record = {"pair": i, "start": start, "end": end,
+                          "length": field_sim.path_length(path),
+                          "endpoint_error": float(np.linalg.norm(np.subtract(path[-1], end))),
+                          "path": path}
+                if args.with_axioms:
+                    record["trajectory"] = forge.meta_engine.trajectory_along(
+                        path, args.seed, args.seed_weight, args.diversity_threshold)
+                records.append(record)
+            if args.outputfile:
+                write_output_files(records, 'json', args.filename, compression=args.compress,
+                                   max_bytes=args.rotate_bytes, max_records=args.rotate_records)
+            if args.output in ('json','both'):
+                print(json.dumps(convert_to_serializable(records), indent=2))
+            if args.output in ('text','both'):
+                for r in records:
+                    print(f"Pair {r['pair']}: {len(r['path'])} points, length {r['length']:.4f}, "
+                          f"endpoint error {r['endpoint_error']:.4f}")
+        else:
+            if args.start is None or args.end is None:
+                geo_parser.error("--start and --end are required without --pairs-file")
+            traj = forge.explore_geodesic(args.start, args.end, args.steps,
+                                          plot=args.plot, seed_text=args.seed,
+                                          seed_weight=args.seed_weight,
+                                          diversity_threshold=args.diversity_threshold,
+                                          mode="bvp" if args.bvp else "shooting")
+            if args.outputfile:
+                write_output_files(traj, args.outputfile, args.filename, is_trajectory=True,
+                                   compression=args.compress, max_bytes=args.rotate_bytes,
+                                   max_records=args.rotate_records, layout=args.layout)
+            if args.output in ('json','both'):
+                print(json.dumps(convert_to_serializable(traj), indent=2))
+            if args.output in ('text','both'):
+                for step in traj:
+                    print(f"Step {step['step']}: {step['axiom'][:60]}...")
 
     elif args.command == 'analyze':
         analysis = forge.seed_processor.process_text_seed(args.seed)
@@ -2067,11 +5997,112 @@ def main():
 
     elif args.command == 'ricci':
         flow = forge.compute_ricci_flow(args.coords, args.iterations, dt=args.dt)
-        if args.outputfile:
-            write_output_files([{"flow": flow}], args.outputfile, args.filename)
+        if args.outputfile == 'npz':
+            curvature = forge.meta_engine.field_sim.ricci_scalar_batch(np.asarray(flow))
+            write_output_files(({"step": i, "coordinates": pt, "curvature": float(r)}
+                                for i, (pt, r) in enumerate(zip(flow, curvature))),
+                               'npz', args.filename, compression=args.compress,
+                               max_bytes=args.rotate_bytes, max_records=args.rotate_records)
+        elif args.outputfile:
+            write_output_files([{"flow": flow}], args.outputfile, args.filename,
+                               compression=args.compress, max_bytes=args.rotate_bytes,
+                               max_records=args.rotate_records, layout=args.layout)
         for i, pt in enumerate(flow):
             print(f"{i}: {pt}")
 
+    elif args.command == 'archive':
+        with AxiomArchive(args.db) as archive:
+            if args.archive_command == 'import':
+                total = 0
+                for p in args.paths:
+                    p = Path(p)
+                    files = find_output_files(p) if p.is_dir() else [p]
+                    for f in files:
+                        total += archive.import_json(f)
+                logger.info(f"Imported {total} records; archive now holds {archive.count()}")
+            elif args.archive_command == 'query':
+                metric_ranges = {}
+                for spec in args.metric:
+                    name, lo, hi = (spec.split(":") + ["", ""])[:3]
+                    metric_ranges[name] = (float(lo) if lo else None, float(hi) if hi else None)
+                hits = archive.query(framework_family=args.framework, sophia_point=args.sophia,
+                                     seed_hash=args.seed_hash, since=args.since, until=args.until,
+                                     metric_ranges=metric_ranges, near=args.near,
+                                     radius=args.radius, limit=args.limit)
+                if args.output == 'json':
+                    print(json.dumps(hits, indent=2, ensure_ascii=False))
+                else:
+                    for i, rec in enumerate(hits, 1):
+                        print(f"{i}: {rec.get('axiom_text', rec.get('axiom'))}")
+                    logger.info(f"{len(hits)} matching records")
+            else:
+                arc_parser.print_help()
+
+    elif args.command == 'dedupe':
+        files = []
+        for p in args.paths:
+            p = Path(p)
+            files.extend(find_output_files(p) if p.is_dir() else [p])
+        report = dedupe_archives(files, args.outputfile, args.filename, threshold=args.threshold,
+                                 num_perm=args.num_perm, workers=args.workers,
+                                 compression=args.compress, layout=args.layout,
+                                 max_bytes=args.rotate_bytes, max_records=args.rotate_records)
+        print(json.dumps(report, indent=2))
+
+    elif args.command == 'map-elites':
+        result = forge.map_elites(budget=args.budget, cells_per_axis=args.cells,
+                                  objective=args.objective, init_samples=args.init,
+                                  mutation_sigma=args.sigma, batch_size=args.batch_size,
+                                  workers=args.workers, enable_relativity=not args.no_relativity,
+                                  seed=args.numeric_seed or 0)
+        if args.outputfile:
+            elites = [dict(e["axiom"], map_elites={"cell": e["cell"], "fitness": e["fitness"]})
+                      for e in result["elites"]]
+            write_output_files(elites, args.outputfile, args.filename, compression=args.compress,
+                               max_bytes=args.rotate_bytes, max_records=args.rotate_records,
+                               layout=args.layout)
+            write_output_files([{"objective": result["objective"], "cells_per_axis": result["cells_per_axis"],
+                                 "coverage_curve": result["coverage_curve"]}],
+                               'json', f"{args.filename}_coverage", compression=args.compress)
+        final = result["coverage_curve"][-1] if result["coverage_curve"] else {}
+        if args.output == 'json':
+            print(json.dumps(convert_to_serializable(result), indent=2))
+        else:
+            for e in sorted(result["elites"], key=lambda e: -e["fitness"])[:10]:
+                print(f"{e['cell']} {args.objective}={e['fitness']:.3f}: {e['axiom']['axiom_text'][:60]}...")
+            logger.info(f"MAP-Elites: {final.get('filled_cells', 0)} cells filled "
+                        f"({final.get('coverage', 0) * 100:.1f}%) after {result['evaluations']} evaluations")
+
+    elif args.command == 'sophia-search':
+        result = forge.sophia_search(budget=args.budget, concept_seed=args.seed,
+                                     population=args.population, sigma=args.sigma,
+                                     threshold=args.threshold, workers=args.workers,
+                                     enable_relativity=not args.no_relativity,
+                                     stop_at_sophia=args.stop_at_sophia,
+                                     compare_random=args.compare_random,
+                                     seed=args.numeric_seed or 0)
+        if args.outputfile:
+            best = dict(result["best"]["axiom"], sophia_search={
+                k: v for k, v in result.items() if k not in ("best", "history")})
+            write_output_files([best], args.outputfile, args.filename, compression=args.compress,
+                               max_bytes=args.rotate_bytes, max_records=args.rotate_records,
+                               layout=args.layout)
+        if args.output == 'json':
+            print(json.dumps(convert_to_serializable(result), indent=2))
+        else:
+            best = result["best"]
+            print(f"Best sophia_score {best['sophia_score']:.3f} at evaluation {best['evaluation']} "
+                  f"({best['framework']}, coords {tuple(round(c, 3) for c in best['coordinates'])})")
+            print(f"  {best['axiom']['axiom_text']}")
+            first = result["evaluations_to_first_sophia"]
+            print(f"Evaluations to first Sophia point (>= {result['threshold']}): "
+                  f"{first if first is not None else 'not reached'} of {result['evaluations']}")
+            if "random_baseline" in result:
+                base = result["random_baseline"]
+                first = base["evaluations_to_first_sophia"]
+                print(f"Random generation: best {base['best_score']:.3f}, first Sophia point "
+                      f"{first if first is not None else 'not reached'} of {base['evaluations']}")
+
     elif args.command == 'test':
         logger.info("Running built-in tests...")
         # Basic tests
@@ -2092,6 +6123,79 @@ def main():
         assert len(flow) == 11
         assert not np.allclose(flow[0], flow[-1])
 
+        # Checkpoint/resume: a walk stopped after 4 steps and resumed by a fresh
+        # engine must write the same steps as one uninterrupted 8-step walk
+        with tempfile.TemporaryDirectory() as tmp:
+            walks = {}
+            for name, legs in (("full", (8,)), ("resumed", (4, 8))):
+                checkpoint = Path(tmp) / f"{name}.json"
+                for leg, steps in enumerate(legs):
+                    # Different seed per leg: only a restored RNG state makes the walks agree
+                    random.seed(7 + leg)
+                    np.random.seed(7 + leg)
+                    walker = MetaOntologyEngine(args.data_root)
+                    walker.persist_dynamic_frameworks = False
+                    walker.explore_phase_space(steps=steps, seed_text="quantum mind",
+                                               checkpoint_path=checkpoint, checkpoint_every=2,
+                                               resume=leg > 0)
+                with open(checkpoint.with_name(checkpoint.name + ".steps.jsonl"), encoding='utf-8') as f:
+                    walks[name] = [{k: v for k, v in json.loads(line).items() if k != "timestamp"} for line in f]
+            assert len(walks["full"]) == 8
+            assert walks["resumed"] == walks["full"], "Resumed walk diverged from the uninterrupted one"
+        HybridFrameworkGenerator.load_frameworks(Path(args.data_root))
+        logger.info("Checkpoint/resume test passed")
+
+        # Forge state: a framework added to frameworks.json after the save survives the restore
+        with tempfile.TemporaryDirectory() as tmp:
+            for fname in ("frameworks.json", "adjectives.json", "concepts.json", "nouns.json",
+                          "verbs.json", "paradox_base.json"):
+                if (Path(args.data_root) / fname).exists():
+                    shutil.copy(Path(args.data_root) / fname, tmp)
+            saved = MetaAxiomForge(tmp)
+            saved.meta_engine.persist_dynamic_frameworks = False
+            saved.generate(mode="meta", count=3)
+            state_file = Path(tmp) / "state.npz"
+            saved.save_state(state_file)
+            fw_path = Path(tmp) / "frameworks.json"
+            with open(fw_path, encoding='utf-8') as f:
+                fw_data = json.load(f)
+            fw_data["ADDED_LATER"] = dict(next(iter(fw_data.values())), coordinates=[0.2, 0.2, 0.2, 0.2, 0.2])
+            with open(fw_path, 'w', encoding='utf-8') as f:
+                json.dump(fw_data, f)
+            restored = MetaAxiomForge(tmp)
+            restored.load_state(state_file)
+            registry = HybridFrameworkGenerator.current()
+            assert "ADDED_LATER" in registry, "load_state dropped a framework added after the save"
+            assert restored.generation_stats["total"] == saved.generation_stats["total"]
+            assert np.allclose(restored.meta_engine.field_sim._attractor, registry.coordinates.mean(axis=0))
+            restored.save_state(state_file)
+            again = MetaAxiomForge(tmp)
+            again.load_state(state_file)
+            assert "ADDED_LATER" in HybridFrameworkGenerator.current()
+        HybridFrameworkGenerator.load_frameworks(Path(args.data_root))
+        logger.info("Forge state test passed")
+
+        # Dedupe over a directory: framework tables and explore checkpoints sitting
+        # next to the output files must be ignored, not parsed as archives
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "out"
+            records = [{"axiom_text": "the observer folds the field into itself"},
+                       {"axiom_text": "the observer folds the field into itself"},
+                       {"axiom_text": "time dreams of a geometry without edges"}]
+            with StreamingOutputWriter("json", "axioms", output_dir=out) as writer:
+                writer.write_many(records)
+            shutil.copy(Path(args.data_root) / "frameworks.json", out)
+            with open(out / "checkpoint.json", 'w', encoding='utf-8') as f:
+                json.dump({"version": 1, "step": 2}, f)
+            with open(out / "checkpoint.json.steps.jsonl", 'w', encoding='utf-8') as f:
+                f.write('{"step": 0}\n{"step": 1}\n')
+            files = find_output_files(out)
+            assert [p.name.startswith("axioms_") for p in files] == [True], files
+            report = dedupe_archives(files + [out / "frameworks.json", out / "checkpoint.json.steps.jsonl"],
+                                     workers=1, output_dir=Path(tmp) / "deduped")
+            assert report["input_records"] == 3 and report["clusters"] == 2, report
+        logger.info("Dedupe test passed")
+
         if args.comprehensive:
             logger.info("Running comprehensive tests...")
             # Diversity test
@@ -2122,5 +6226,9 @@ def main():
     else:
         parser.print_help()
 
+    if state_path:
+        forge.save_state(state_path)
+        logger.info(f"Saved forge state to {state_path}")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file